@@ -1,4 +1,8 @@
-import sys, os, time, struct, threading
+import sys, os, time, threading, html, logging, logging.handlers, queue
+# Modules shared with the other apps (radar_common/) live at the repository root
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from radar_common.startup_profile import StartupProfile
+PROFILE = StartupProfile.from_argv(sys.argv)   # None unless --startup-profile
 import numpy as np
 import serial
 import serial.tools.list_ports
@@ -7,35 +11,49 @@ from collections import deque
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QPushButton, QComboBox, QGroupBox, QGridLayout,
-    QTextEdit, QFrame, QScrollArea, QDoubleSpinBox, QSplitter,
+    QTextEdit, QPlainTextEdit, QFrame, QScrollArea, QDoubleSpinBox, QSplitter,
     QTabWidget, QSizePolicy, QSpacerItem
 )
 from PyQt5.QtCore import Qt, QThread, pyqtSignal, QObject, QTimer, QMutex
 from PyQt5.QtGui import QFont, QColor, QPainter, QBrush, QPen, QFontDatabase
 
-import matplotlib
-matplotlib.use("Qt5Agg")
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-from mpl_toolkits.mplot3d.art3d import Poly3DCollection
-import matplotlib.pyplot as plt
+# matplotlib is imported by views.py, after the window's first paint (MainWindow.init_views)
+from occupancy import OccupancyGrid, OCC_SNAPSHOT_EVERY
+from frame_stats import FrameStats
+from radar_common.config_uploader import ConfigUploader
+from device_cache import DeviceCache, config_hash, device_identity
+from port_discovery import discover_evms
+from radar_protocol import MAGIC_WORD, CLI_BAUD, DATA_BAUD, RadarFrame, RadarParser
+from world_transform import SensorTransform
+from sensor_manager import SensorManager, load_sensor_specs, format_health
+from fusion import FrameFuser
+from zones import Zone, ZoneSet, load_zones
+from events import EventEngine, EventDispatcher, FileSink, UdpSink, WebhookSink
+from fall_detector import FallDetector
+from track_predictor import TrackPredictor
 
 # ══════════════════════════════════════════════════════════════════
-#  PROTOCOL CONSTANTS
+#  CONSTANTS
 # ══════════════════════════════════════════════════════════════════
-MAGIC_WORD      = bytes([0x02, 0x01, 0x04, 0x03, 0x06, 0x05, 0x08, 0x07])
-HEADER_SIZE     = 40          # bytes
-CLI_BAUD        = 115200
-DATA_BAUD       = 921600
-FALL_THRESHOLD  = 0.5         # metres
+OCC_SOURCE      = "targets"   # occupancy heatmap input: "targets" or "points"
+OCC_REFRESH_MS  = 1000        # heatmap view refresh (independent of frame rate)
+UI_REFRESH_HZ   = 10          # person panel refresh cap (sensor runs ~18 Hz)
+STATS_LOG_MS    = 10000       # periodic frame-statistics log line
+LOG_MAX_BLOCKS  = 5000        # CLI console keeps at most this many lines
+LOG_FLUSH_MS    = 100         # CLI console batch interval
+LOG_FILE_PATH   = os.path.join(os.path.dirname(__file__), "logs", "radar_ims.log")
+LOG_FILE_BYTES  = 2_000_000   # rotate the mirror file at this size …
+LOG_FILE_COUNT  = 5           # … keeping this many old files (None path = no mirror)
 DEFAULT_CFG_PATH = os.path.join(os.path.dirname(__file__), "AOP_6m_default.cfg")
-
-# TI People Tracking SDK TLV IDs
-TLV_POINT_CLOUD      = 1   # Detected points (x,y,z,doppler) Cartesian
-TLV_POINT_CLOUD_SIDE = 4   # Side-info per point (snr, noise)
-TLV_TARGET_LIST      = 6   # Tracked targets — People Tracking SDK primary
-TLV_TARGET_IDX       = 7   # Point-to-target index array
-TLV_TARGET_LIST_ALT  = 12  # Alternate target list ID (OOB / SDK 3.x fallback)
+REATTACH_SNIFF_S = 1.0        # listen this long for a still-running sensor
+REATTACH_FRAMES  = 3          # frames that must match before skipping config
+COORD_FRAME      = "world"    # "world" (sensorPosition applied) or "sensor" (raw)
+FUSE_POLL_MS     = 10         # multi-sensor mode: fusion thread queue wait / flush check
+ZONES_PATH       = os.path.join(os.path.dirname(__file__), "zones.json")   # extra polygon zones
+EVENT_LOG_PATH   = os.path.join(os.path.dirname(__file__), "logs", "events.jsonl")
+EVENT_UDP_ADDR   = None                   # e.g. ("127.0.0.1", 5599): JSON datagram per event (None = off)
+EVENT_WEBHOOK_URL = None                 # e.g. "http://localhost:8000/events" (None = off)
+RENDER_HZ        = 30         # track markers are re-predicted and redrawn at this rate
 
 # ══════════════════════════════════════════════════════════════════
 #  COLOUR PALETTE  — Phosphor-terminal industrial dark
@@ -52,145 +70,6 @@ WHITE_TEXT  = "#d4e8d4"
 SUBTEXT     = "#4a6b4a"
 GRID_COL    = "#14201a"
 
-# ══════════════════════════════════════════════════════════════════
-#  TLV FRAME PARSER  —  TI People Tracking SDK
-# ══════════════════════════════════════════════════════════════════
-class RadarFrame:
-    __slots__ = ["frame_num", "points", "targets"]
-    def __init__(self):
-        self.frame_num = 0
-        self.points    = np.empty((0, 4), dtype=np.float32)   # x,y,z,doppler
-        self.targets   = []                                     # list of dicts
-
-class RadarParser:
-    """
-    Robust TLV parser for IWR6843AOP People Tracking SDK.
-
-    Point cloud  — TLV type 1:
-        Each point: x(f32), y(f32), z(f32), doppler(f32)  → 16 bytes
-
-    Target list  — TLV type 6  (primary, People Tracking SDK)
-                   TLV type 12 (fallback, OOB / SDK 3.x):
-        Each target: tid(u32), x(f32), y(f32), z(f32),
-                     vx(f32), vy(f32), vz(f32), ax(f32), ay(f32), az(f32),
-                     ec[16](f32), g(f32), confidenceLevel(f32)
-        → 4 + 9*4 + 16*4 + 4 + 4 = 112 bytes  (SDK 3.x)
-        OR simpler:  tid(u32) + x,y,z,vx,vy,vz,ax,ay,az (9×f32) = 40 bytes
-    Parser auto-detects stride from TLV length / num_targets.
-    """
-
-    def parse_buffer(self, buf: bytes):
-        frames = []
-        while True:
-            idx = buf.find(MAGIC_WORD)
-            if idx < 0:
-                # Keep last 7 bytes — a magic word might be split across reads
-                buf = buf[-7:] if len(buf) >= 7 else buf
-                break
-            if idx > 0:
-                buf = buf[idx:]
-            if len(buf) < HEADER_SIZE:
-                break
-            # total_len is at byte offset 12 in the header
-            if len(buf) < 16:
-                break
-            total_len = struct.unpack_from("<I", buf, 12)[0]
-            # Sanity-check: TI frames are typically 50–5000 bytes
-            if total_len < HEADER_SIZE or total_len > 65536:
-                # Bad sync — skip 1 byte and re-search
-                buf = buf[1:]
-                continue
-            if len(buf) < total_len:
-                break
-            frame = self._parse_frame(buf[:total_len])
-            if frame is not None:
-                frames.append(frame)
-            buf = buf[total_len:]
-        return frames, buf
-
-    def _parse_frame(self, data: bytes):
-        if data[:8] != MAGIC_WORD:
-            return None
-        f = RadarFrame()
-        off = 8
-        try:
-            _ver        = struct.unpack_from("<I", data, off)[0]; off += 4
-            _total_len  = struct.unpack_from("<I", data, off)[0]; off += 4
-            _plat       = struct.unpack_from("<I", data, off)[0]; off += 4
-            f.frame_num = struct.unpack_from("<I", data, off)[0]; off += 4
-            _cpu_time   = struct.unpack_from("<I", data, off)[0]; off += 4
-            num_det     = struct.unpack_from("<I", data, off)[0]; off += 4
-            num_tlvs    = struct.unpack_from("<I", data, off)[0]; off += 4
-            _sub        = struct.unpack_from("<I", data, off)[0]; off += 4
-        except struct.error:
-            return None
-
-        for _ in range(num_tlvs):
-            if off + 8 > len(data):
-                break
-            tlv_type = struct.unpack_from("<I", data, off)[0]; off += 4
-            tlv_len  = struct.unpack_from("<I", data, off)[0]; off += 4
-            if off + tlv_len > len(data):
-                break
-            tlv_data = data[off : off + tlv_len]; off += tlv_len
-
-            if tlv_type == TLV_POINT_CLOUD:
-                f.points = self._parse_points(tlv_data, num_det)
-            elif tlv_type in (TLV_TARGET_LIST, TLV_TARGET_LIST_ALT):
-                f.targets = self._parse_targets(tlv_data)
-
-        return f
-
-    def _parse_points(self, data: bytes, n: int):
-        """
-        Each point = x, y, z, doppler  (4 × float32 = 16 bytes).
-        n comes from the header numDetectedObj field.
-        """
-        stride = 16
-        if n == 0:
-            n = len(data) // stride
-        pts = []
-        for i in range(n):
-            if (i + 1) * stride > len(data):
-                break
-            x, y, z, d = struct.unpack_from("<ffff", data, i * stride)
-            pts.append([x, y, z, d])
-        return np.array(pts, dtype=np.float32) if pts else np.empty((0, 4), dtype=np.float32)
-
-    def _parse_targets(self, data: bytes):
-        """
-        Auto-detects per-target stride.
-        SDK lite  : 40 bytes  (tid + 9 floats)
-        SDK full  : 112 bytes (tid + 9 floats + 16 ec floats + g + conf)
-        """
-        targets = []
-        if len(data) == 0:
-            return targets
-
-        # Try to figure out stride: prefer 112 if it divides evenly, else 40
-        if len(data) % 112 == 0 and len(data) // 112 >= 1:
-            stride = 112
-        elif len(data) % 40 == 0 and len(data) // 40 >= 1:
-            stride = 40
-        else:
-            # Fall back: try both and use whichever gives a reasonable count
-            stride = 40
-
-        n = len(data) // stride
-        for i in range(n):
-            off = i * stride
-            if off + 4 > len(data):
-                break
-            tid = struct.unpack_from("<I", data, off)[0]
-            if off + 16 > len(data):
-                break
-            x, y, z = struct.unpack_from("<fff", data, off + 4)
-            # Sanity: skip obviously garbage tracks
-            if not (-20 < x < 20 and 0 < y < 20 and -1 < z < 5):
-                continue
-            targets.append({"id": tid, "x": float(x), "y": float(y), "z": float(z)})
-        return targets
-
 # ══════════════════════════════════════════════════════════════════
 #  HAZARD ZONE
 # ══════════════════════════════════════════════════════════════════
@@ -220,6 +99,42 @@ class HazardZone:
 # ══════════════════════════════════════════════════════════════════
 #  PERSON STATE
 # ══════════════════════════════════════════════════════════════════
+def target_heights(points, target_pos, radius=0.7):
+    """
+    Height per target: Z-span of raw points within `radius` (x/y) of it,
+    |z| of the point when only one is near, |z| of the target when none.
+    All targets at once (T×N mask). Returns (heights float32 T, counts int T).
+    """
+    h = np.abs(target_pos[:, 2]).astype(np.float32)
+    if len(target_pos) == 0 or len(points) == 0:
+        return h, np.zeros(len(target_pos), dtype=np.int64)
+    d2 = (points[None, :, 0] - target_pos[:, None, 0]) ** 2 + \
+         (points[None, :, 1] - target_pos[:, None, 1]) ** 2
+    near = d2 < radius * radius
+    cnt = near.sum(axis=1)
+    z = points[None, :, 2]
+    zmax = np.where(near, z, -np.inf).max(axis=1)
+    zmin = np.where(near, z, np.inf).min(axis=1)
+    h = np.where(cnt >= 2, zmax - zmin, np.where(cnt == 1, np.abs(zmax), h))
+    return h.astype(np.float32), cnt
+
+
+def annotate_frame(fr, zones, engine, fall_det):
+    """Zones, heights, fall classification and debounced events for one world-frame RadarFrame."""
+    fr.zones = zones.evaluate(fr.points, fr.target_pos)
+    fr.heights, near = target_heights(fr.points, fr.target_pos)
+    falls = fall_det.update(fr.timestamp, fr.target_ids, fr.heights, fr.target_vel[:, 2], near)
+    if engine.zone_names != zones.names:
+        engine.set_zones(zones.names)
+    fr.events = engine.update(fr.timestamp, fr.target_ids, fr.target_pos,
+                              fr.zones.target_mask, falls, fr.sensor_id,
+                              point_intrusion=fr.zones.point_counts >= zones.min_points)
+    # Immutable snapshot of the debounced state: the GUI reads this, never the engine's sets
+    fr.alerts = (frozenset(t for t, _ in engine.hazard if t >= 0), frozenset(engine.fallen),
+                 bool(engine.hazard))
+    return fr
+
+
 class PersonState:
     def __init__(self, tid):
         self.tid           = tid
@@ -228,23 +143,12 @@ class PersonState:
         self.in_hazard     = False
         self.fall          = False
 
-    def update(self, x, y, z, points, zone: HazardZone):
+    def update(self, x, y, z, height, in_hazard, fall):
+        """in_hazard / fall are the debounced flags from the event engine."""
         self.x, self.y, self.z = x, y, z
-        # Height: Z-span of nearby raw points (within 0.7 m radius)
-        if len(points) > 0:
-            d2 = (points[:, 0] - x) ** 2 + (points[:, 1] - y) ** 2
-            near = points[d2 < 0.49]           # 0.7² = 0.49
-            if len(near) >= 2:
-                self.height = float(np.max(near[:, 2]) - np.min(near[:, 2]))
-            elif len(near) == 1:
-                self.height = float(abs(near[0, 2]))
-            else:
-                self.height = float(abs(z))
-        else:
-            self.height = float(abs(z))
-
-        self.in_hazard = zone.contains(x, y, z)
-        self.fall      = 0.01 < self.height < FALL_THRESHOLD
+        self.height    = height
+        self.in_hazard = in_hazard
+        self.fall      = fall
 
 # ══════════════════════════════════════════════════════════════════
 #  SERIAL WORKER THREAD  —  robust connection + ACK handling
@@ -257,16 +161,30 @@ class WorkerSignals(QObject):
     error        = pyqtSignal(str)        # fatal error string
 
 class SerialWorker(QThread):
-    def __init__(self, cli_port, data_port, config_text):
+    def __init__(self, cli_port, data_port, config_text, ports_known=False, dispatcher=None):
         super().__init__()
         self.sig         = WorkerSignals()
         self.cli_port    = cli_port
         self.data_port   = data_port
+        self.ports_known = ports_known   # mapping from USB identity / cache: skip the probe
         self.config_text = config_text
         self._stop_evt   = threading.Event()
         self.parser      = RadarParser()
         self._ser_cli    = None
         self._ser_data   = None
+        self.upload_result = None
+        self._t_cfg_done   = None
+        self.cache       = DeviceCache()
+        self.cfg_hash    = config_hash(config_text)
+        self.device_id   = None
+        self._platform   = None
+        self._seen_tlvs  = set()
+        self._n_frames   = 0
+        self.to_world    = SensorTransform.from_cfg(config_text) if COORD_FRAME == "world" \
+            else SensorTransform()
+        self.zones       = ZoneSet([])   # replaced (not mutated) by the GUI
+        self.events      = EventEngine([], dispatcher)
+        self.falls       = FallDetector()
 
     # ─────────────────────────────────────────────────────────────
     # STEP 1: Probe both ports to find which one is CLI
@@ -311,6 +229,39 @@ class SerialWorker(QThread):
             self.sig.log.emit(f"  Cannot open {port}: {e}", "warn")
             return False
 
+    def _open_cli(self, port) -> bool:
+        """Open a known CLI port without probing; the config upload verifies it."""
+        try:
+            self._ser_cli = serial.Serial(port, CLI_BAUD,
+                                          bytesize=serial.EIGHTBITS,
+                                          parity=serial.PARITY_NONE,
+                                          stopbits=serial.STOPBITS_ONE,
+                                          timeout=1, write_timeout=2)
+        except serial.SerialException as e:
+            self.sig.log.emit(f"  Cannot open {port}: {e}", "warn")
+            return False
+        self.sig.log.emit(f"  CLI port {port} known from USB identity — probe skipped", "ok")
+        return True
+
+    def _find_cli(self) -> bool:
+        """Probe the selected CLI port, then the data port (swapping on success)."""
+        self.sig.log.emit("━━━ Auto-detecting CLI port ━━━", "info")
+        if self._probe_cli(self.cli_port):
+            return True    # user assignment was correct
+        if self._probe_cli(self.data_port):
+            # swap confirmed
+            self.cli_port, self.data_port = self.data_port, self.cli_port
+            self.sig.log.emit(
+                f"  Ports swapped → CLI={self.cli_port}  Data={self.data_port}", "warn")
+            return True
+        self.sig.log.emit("✘  No CLI response on either port. Checklist:", "error")
+        self.sig.log.emit("  1. EVM powered? (green/blue LEDs on the board)", "warn")
+        self.sig.log.emit("  2. People Tracking firmware flashed?", "warn")
+        self.sig.log.emit("  3. Close TI Demo Visualizer if open (port conflict)", "warn")
+        self.sig.log.emit("  4. Unplug USB → replug → click CONNECT again", "warn")
+        self.sig.config_ok.emit(False)
+        return False
+
     # ─────────────────────────────────────────────────────────────
     # main run
     # ─────────────────────────────────────────────────────────────
@@ -321,67 +272,13 @@ class SerialWorker(QThread):
                 self.sig.config_ok.emit(False)
                 return
 
-            # ── Auto-detect which port is CLI ─────────────────────
-            self.sig.log.emit("━━━ Auto-detecting CLI port ━━━", "info")
-            if self._probe_cli(self.cli_port):
-                pass   # user assignment was correct
-            elif self._probe_cli(self.data_port):
-                # swap confirmed
-                self.cli_port, self.data_port = self.data_port, self.cli_port
-                self.sig.log.emit(
-                    f"  Ports swapped → CLI={self.cli_port}  Data={self.data_port}", "warn")
-            else:
-                self.sig.log.emit("✘  No CLI response on either port. Checklist:", "error")
-                self.sig.log.emit("  1. EVM powered? (green/blue LEDs on the board)", "warn")
-                self.sig.log.emit("  2. People Tracking firmware flashed?", "warn")
-                self.sig.log.emit("  3. Close TI Demo Visualizer if open (port conflict)", "warn")
-                self.sig.log.emit("  4. Unplug USB → replug → click CONNECT again", "warn")
-                self.sig.config_ok.emit(False)
-                return
-
-            # ── Flush any stale sensor output ────────────────────
-            time.sleep(0.2)
-            self._ser_cli.reset_input_buffer()
-
-            # ── Send config ───────────────────────────────────────
-            self.sig.log.emit("━━━ Sending AOP_6m People Tracking config ━━━", "info")
-            if not self._send_config():
-                return
-
-            # ── Open data port ────────────────────────────────────
-            self.sig.log.emit(f"Opening Data port {self.data_port} @ {DATA_BAUD}", "info")
-            try:
-                self._ser_data = serial.Serial(
-                    self.data_port, DATA_BAUD,
-                    bytesize=serial.EIGHTBITS,
-                    parity=serial.PARITY_NONE,
-                    stopbits=serial.STOPBITS_ONE,
-                    timeout=0.05)
-                self._ser_data.reset_input_buffer()
-            except serial.SerialException as e:
-                self.sig.log.emit(f"Cannot open Data port: {e}", "error")
-                self.sig.config_ok.emit(False)
-                return
-
-            # ── Sniff for magic word (up to 6 s) ─────────────────
-            self.sig.log.emit("Waiting for radar data frames…", "info")
-            sniff_buf = b""; magic_found = False; t0 = time.time()
-            while time.time() - t0 < 6.0 and not self._stop_evt.is_set():
-                c = self._ser_data.read(1024)
-                if c:
-                    sniff_buf += c
-                    if MAGIC_WORD in sniff_buf:
-                        magic_found = True
-                        break
-
-            if not magic_found:
-                self.sig.log.emit("✘  No data frames on Data port after 6 s.", "error")
-                self.sig.log.emit("   → Sensor may not have started correctly.", "warn")
-                self.sig.log.emit("   → Try: STOP → power-cycle EVM → CONNECT", "warn")
-                self.sig.config_ok.emit(False)
-                return
-
-            self.sig.log.emit(f"✔  Radar frames live on {self.data_port} ✓", "ok")
+            # ── Fast path: sensor still streaming the same config ─
+            self.device_id = device_identity(self.cli_port)
+            sniff_buf = self._try_reattach()
+            if sniff_buf is None:
+                sniff_buf = self._configure_and_sniff()
+                if sniff_buf is None:
+                    return
             self.sig.data_started.emit()
 
             # ── Read loop ─────────────────────────────────────────
@@ -394,8 +291,14 @@ class SerialWorker(QThread):
                 if c:
                     last_t = time.time()
                     buf += c
+                    t0 = time.perf_counter()
                     frames, buf = self.parser.parse_buffer(buf)
+                    if frames:
+                        parse_ms = (time.perf_counter() - t0) * 1000.0 / len(frames)
                     for fr in frames:
+                        fr.timestamp = last_t
+                        fr.parse_ms  = parse_ms
+                        self._process(fr)
                         self.sig.frame.emit(fr)
                 else:
                     if time.time() - last_t > 5.0:
@@ -409,68 +312,213 @@ class SerialWorker(QThread):
             self._close()
 
     # ─────────────────────────────────────────────────────────────
-    # Config sender — one line at a time, tolerant ACK reading
+    # Fast reconnect: skip sensorStop/flushCfg/config when the sensor is
+    # still streaming frames that match what this config produced before
     # ─────────────────────────────────────────────────────────────
-    def _send_config(self):
-        lines = [l.strip() for l in self.config_text.splitlines()
-                 if l.strip() and not l.strip().startswith("%")]
-        total = len(lines)
-        for i, line in enumerate(lines):
-            if self._stop_evt.is_set():
-                return False
-            try:
-                self._ser_cli.write((line + "\n").encode("ascii"))
-                self._ser_cli.flush()
-            except serial.SerialException as e:
-                self.sig.log.emit(f"Write error on '{line}': {e}", "error")
-                self.sig.config_ok.emit(False)
-                return False
+    def _try_reattach(self):
+        entry = self.cache.get(self.device_id)
+        if not entry or entry.get("cfg_hash") != self.cfg_hash \
+                or {entry.get("cli_port"), entry.get("data_port")} != {self.cli_port, self.data_port}:
+            return None
+        if not entry.get("running", True):
+            # we sent sensorStop on the last disconnect — nothing to sniff for
+            self.sig.log.emit("  Sensor was stopped on last disconnect — doing full configuration", "dim")
+            return None
+        # the cached assignment was verified last time, even if the selection is swapped
+        self.cli_port, self.data_port = entry["cli_port"], entry["data_port"]
 
-            self.sig.log.emit(f"  [{i+1:02d}/{total}] TX ▶  {line}", "tx")
-            ack = self._read_ack(timeout=4.0)
-            clean = ack.replace("\r", " ").replace("\n", " ").strip()
+        self.sig.log.emit("━━━ Same config already loaded — checking live stream ━━━", "info")
+        try:
+            self._ser_data = serial.Serial(
+                self.data_port, DATA_BAUD,
+                bytesize=serial.EIGHTBITS,
+                parity=serial.PARITY_NONE,
+                stopbits=serial.STOPBITS_ONE,
+                timeout=0.05)
+        except serial.SerialException as e:
+            self.sig.log.emit(f"  Cannot open Data port: {e}", "warn")
+            return None
 
-            if "Done" in ack:
-                self.sig.log.emit(f"         ◀ Done ✓", "ok")
-            elif clean:
-                self.sig.log.emit(f"         ◀ {clean[:90]}", "dim")
-            else:
-                self.sig.log.emit(f"         ◀ (timeout — ok)", "dim")
+        t0 = time.perf_counter(); buf = b""; frames = []
+        while time.perf_counter() - t0 < REATTACH_SNIFF_S and not self._stop_evt.is_set():
+            c = self._ser_data.read(4096)
+            if c:
+                buf += c
+                got, buf = self.parser.parse_buffer(buf)
+                frames.extend(got)
+                if len(frames) >= REATTACH_FRAMES:
+                    break
 
-            time.sleep(0.06)
+        known = set(entry.get("tlv_types", ()))
+        match = (len(frames) >= REATTACH_FRAMES and
+                 all(fr.platform == entry.get("platform") and set(fr.tlv_types) <= known
+                     for fr in frames))
+        if not match:
+            why = "no frames" if not frames else "stream layout differs"
+            self.sig.log.emit(f"  ✗ {why} — doing full configuration", "dim")
+            try: self._ser_data.close()
+            except Exception: pass
+            self._ser_data = None
+            return None
 
-        self.sig.log.emit(f"━━━ Config sent ({total} commands) ✓ ━━━", "ok")
+        # CLI port opened without writing anything, so STOP still stops the sensor
+        try:
+            self._ser_cli = serial.Serial(self.cli_port, CLI_BAUD, timeout=1, write_timeout=2)
+        except serial.SerialException as e:
+            self.sig.log.emit(f"  CLI port not opened ({e}) — streaming anyway", "warn")
+        ms = (time.perf_counter() - t0) * 1000.0
+        self.sig.log.emit(f"✔  Reattached to running sensor in {ms:.0f} ms — config not resent", "ok")
         self.sig.config_ok.emit(True)
-        return True
+        for fr in frames:
+            fr.timestamp = time.time()
+            self._process(fr)
+            self.sig.frame.emit(fr)
+        return buf
 
-    def _read_ack(self, timeout=4.0):
-        """Read CLI response until 'Done'/'Error'/timeout."""
-        deadline = time.time() + timeout
-        buf = ""
-        while time.time() < deadline:
-            if self._stop_evt.is_set():
-                break
-            if self._ser_cli.in_waiting:
-                buf += self._ser_cli.read(
-                    self._ser_cli.in_waiting).decode("ascii", errors="ignore")
-                if "Done" in buf or "done" in buf:
-                    break
-                if "not recognized" in buf.lower():
+    def _process(self, fr):
+        """Per-frame work done off the GUI thread: world transform, zones, events."""
+        self.to_world.apply_frame(fr)
+        annotate_frame(fr, self.zones, self.events, self.falls)
+        self._note_frame(fr)
+
+    def _note_frame(self, fr):
+        """Learn the stream layout this config produces; cached on first frame and on close."""
+        self._platform = fr.platform
+        self._seen_tlvs.update(fr.tlv_types)
+        self._n_frames += 1
+        if self._n_frames == 1:
+            self._remember_stream()
+
+    def _remember_stream(self):
+        if self._n_frames and self.device_id:
+            self.cache.update(self.device_id, cfg_hash=self.cfg_hash,
+                              cli_port=self.cli_port, data_port=self.data_port,
+                              platform=self._platform, tlv_types=sorted(self._seen_tlvs),
+                              running=True)
+
+    # ─────────────────────────────────────────────────────────────
+    # Full path: probe CLI, upload config, wait for the first frame
+    # Returns the sniffed bytes (start of the stream) or None on failure.
+    # ─────────────────────────────────────────────────────────────
+    def _configure_and_sniff(self):
+        # ── CLI port: trust a known USB mapping, probe otherwise ──
+        probed = not (self.ports_known and self._open_cli(self.cli_port))
+        if probed and not self._find_cli():
+            return None
+
+        # ── Flush any stale sensor output ────────────────────
+        time.sleep(0.2)
+        self._ser_cli.reset_input_buffer()
+
+        # ── Send config ───────────────────────────────────────
+        # Sensor state is unknown until the upload completes
+        self.cache.forget(self.device_id)
+        self.sig.log.emit("━━━ Sending AOP_6m People Tracking config ━━━", "info")
+        res = self._send_config(stop_if_silent=not probed)
+        if res is not None and res.silent:
+            # mapping was stale (e.g. ports renumbered) — fall back to probing
+            self.sig.log.emit(f"  ✗ No reply on {self.cli_port} — probing both ports", "warn")
+            try: self._ser_cli.close()
+            except Exception: pass
+            self._ser_cli = None
+            if not self._find_cli():
+                return None
+            time.sleep(0.2)
+            self._ser_cli.reset_input_buffer()
+            res = self._send_config()
+        if res is None:
+            return None
+        self._t_cfg_done = time.perf_counter()
+
+        # ── Open data port ────────────────────────────────────
+        self.sig.log.emit(f"Opening Data port {self.data_port} @ {DATA_BAUD}", "info")
+        try:
+            self._ser_data = serial.Serial(
+                self.data_port, DATA_BAUD,
+                bytesize=serial.EIGHTBITS,
+                parity=serial.PARITY_NONE,
+                stopbits=serial.STOPBITS_ONE,
+                timeout=0.05)
+            self._ser_data.reset_input_buffer()
+        except serial.SerialException as e:
+            self.sig.log.emit(f"Cannot open Data port: {e}", "error")
+            self.sig.config_ok.emit(False)
+            return None
+
+        # ── Sniff for magic word (up to 6 s) ─────────────────
+        self.sig.log.emit("Waiting for radar data frames…", "info")
+        sniff_buf = b""; magic_found = False; t0 = time.time()
+        while time.time() - t0 < 6.0 and not self._stop_evt.is_set():
+            c = self._ser_data.read(1024)
+            if c:
+                sniff_buf += c
+                if MAGIC_WORD in sniff_buf:
+                    magic_found = True
                     break
+
+        if not magic_found:
+            self.sig.log.emit("✘  No data frames on Data port after 6 s.", "error")
+            self.sig.log.emit("   → Sensor may not have started correctly.", "warn")
+            self.sig.log.emit("   → Try: STOP → power-cycle EVM → CONNECT", "warn")
+            self.sig.config_ok.emit(False)
+            return None
+
+        self.sig.log.emit(f"✔  Radar frames live on {self.data_port} ✓", "ok")
+        cfg_ms = self.upload_result.total_ms if self.upload_result else 0.0
+        ttff = (time.perf_counter() - self._t_cfg_done) * 1000.0
+        self.sig.log.emit(
+            f"   Time to first frame: {cfg_ms + ttff:.0f} ms "
+            f"(config {cfg_ms:.0f} ms + sensor start {ttff:.0f} ms)", "info")
+        return sniff_buf
+
+    # ─────────────────────────────────────────────────────────────
+    # Config sender — next line as soon as the previous one is ACKed
+    # ─────────────────────────────────────────────────────────────
+    def _send_config(self, stop_if_silent=False):
+        """Returns the UploadResult, or None when the upload failed or was stopped."""
+        def on_command(i, total, r):
+            self.sig.log.emit(f"  [{i+1:02d}/{total}] TX ▶  {r.cmd}", "tx")
+            if r.status == "done":
+                self.sig.log.emit(f"         ◀ Done ✓  ({r.rtt_ms:.0f} ms)", "ok")
+            elif r.status == "error":
+                self.sig.log.emit(f"         ◀ {r.response[:90]}", "warn")
+            elif r.response:
+                self.sig.log.emit(f"         ◀ {r.response[:90]}", "dim")
             else:
-                time.sleep(0.01)
-        return buf
+                self.sig.log.emit(f"         ◀ (timeout — ok)", "dim")
+
+        uploader = ConfigUploader(self._ser_cli, on_command, self._stop_evt, stop_if_silent)
+        try:
+            res = uploader.upload(self.config_text)
+        except serial.SerialException as e:
+            self.sig.log.emit(f"Write error during config: {e}", "error")
+            self.sig.config_ok.emit(False)
+            return None
+        if res.aborted:
+            return None
+        if res.silent:
+            return res
+
+        self.upload_result = res
+        self.sig.log.emit(f"━━━ Config sent ({res.summary()}) ✓ ━━━", "ok")
+        self.sig.config_ok.emit(True)
+        return res
 
     def stop(self):
         self._stop_evt.set()
         self.wait(3000)
 
     def _close(self):
+        self._remember_stream()
         for s, name in [(self._ser_cli, "CLI"), (self._ser_data, "Data")]:
             try:
                 if s and s.is_open:
                     if name == "CLI":
-                        try: s.write(b"sensorStop\n"); s.flush(); time.sleep(0.15)
+                        try:
+                            s.write(b"sensorStop\n"); s.flush(); time.sleep(0.15)
+                            # the layout stays cached, but there is no stream to reattach to
+                            if self._n_frames and self.device_id:
+                                self.cache.update(self.device_id, running=False)
                         except: pass
                     s.close()
                     self.sig.log.emit(f"{name} port closed.", "dim")
@@ -479,146 +527,48 @@ class SerialWorker(QThread):
 
 
 # ══════════════════════════════════════════════════════════════════
-#  MATPLOTLIB 3-D CANVAS
+#  FUSION WORKER THREAD  —  multi-sensor: fuse + zones / events off the GUI
 # ══════════════════════════════════════════════════════════════════
-class Radar3DCanvas(FigureCanvas):
-    """Embedded 3-D scatter view with room box + hazard zone."""
-
-    def __init__(self, zone: HazardZone, parent=None):
-        self.fig = Figure(facecolor="#0b0e0b", tight_layout=True)
-        super().__init__(self.fig)
-        self.setParent(parent)
-        self.zone = zone
-
-        self.ax = self.fig.add_subplot(111, projection="3d")
-        self._style_axes()
-
-        self._pt_scat  = None
-        self._tk_scat  = None
-        self._hz_mesh  = None
-        self._room_lines = []
-        self._draw_room()
-        self._draw_hazard_zone()
-
-        self.setMinimumHeight(440)
-
-    # ── axes style ────────────────────────────────────────────────
-    def _style_axes(self):
-        ax = self.ax
-        ax.set_facecolor("#0b0e0b")
-        ax.tick_params(colors="#1f6b10", labelsize=7)
-        for pane in [ax.xaxis.pane, ax.yaxis.pane, ax.zaxis.pane]:
-            pane.fill = False
-            pane.set_edgecolor("#14201a")
-        for spine in ax.spines.values():
-            spine.set_edgecolor("#14201a")
-        ax.xaxis.label.set_color("#39ff14")
-        ax.yaxis.label.set_color("#39ff14")
-        ax.zaxis.label.set_color("#39ff14")
-        ax.set_xlabel("X (m)", fontsize=8, labelpad=4)
-        ax.set_ylabel("Y (m)", fontsize=8, labelpad=4)
-        ax.set_zlabel("Z (m)", fontsize=8, labelpad=4)
-        ax.set_xlim(-4, 4)
-        ax.set_ylim(0, 6)
-        ax.set_zlim(0, 3)
-        ax.set_title("RADAR FIELD  —  IWR6843AOP EVM  (6 m range)",
-                     color="#39ff14", fontsize=9, pad=8,
-                     fontfamily="monospace")
-
-    # ── room wireframe ────────────────────────────────────────────
-    def _draw_room(self):
-        for l in self._room_lines:
-            l.remove()
-        self._room_lines = []
-        rx = (-4, 4); ry = (0, 6); rz = (0, 3)
-        def edge(p1, p2):
-            xs = [p1[0], p2[0]]; ys = [p1[1], p2[1]]; zs = [p1[2], p2[2]]
-            ln, = self.ax.plot(xs, ys, zs, color="#14451a", lw=0.8, alpha=0.6)
-            self._room_lines.append(ln)
-
-        corners = [
-            (rx[0],ry[0],rz[0]), (rx[1],ry[0],rz[0]),
-            (rx[1],ry[1],rz[0]), (rx[0],ry[1],rz[0]),
-            (rx[0],ry[0],rz[1]), (rx[1],ry[0],rz[1]),
-            (rx[1],ry[1],rz[1]), (rx[0],ry[1],rz[1]),
-        ]
-        edges_idx = [(0,1),(1,2),(2,3),(3,0),(4,5),(5,6),(6,7),(7,4),
-                     (0,4),(1,5),(2,6),(3,7)]
-        for a, b in edges_idx:
-            edge(corners[a], corners[b])
-
-    # ── hazard zone ───────────────────────────────────────────────
-    def _draw_hazard_zone(self):
-        if self._hz_mesh:
-            try:
-                self._hz_mesh.remove()
-            except Exception:
-                pass
-        c = self.zone.corners()
-        faces = [
-            [c[0],c[1],c[2],c[3]],   # bottom
-            [c[4],c[5],c[6],c[7]],   # top
-            [c[0],c[1],c[5],c[4]],   # front
-            [c[2],c[3],c[7],c[6]],   # back
-            [c[0],c[3],c[7],c[4]],   # left
-            [c[1],c[2],c[6],c[5]],   # right
-        ]
-        poly = Poly3DCollection(faces, alpha=0.08,
-                                facecolor="#ff2020", edgecolor="#ff4040",
-                                linewidth=1.2, linestyle="--")
-        self._hz_mesh = self.ax.add_collection3d(poly)
-
-        # label
-        cx = (self.zone.x0 + self.zone.x1) / 2
-        cy = (self.zone.y0 + self.zone.y1) / 2
-        cz = self.zone.z1 + 0.15
-        self.ax.text(cx, cy, cz, "⚠ HAZARD", color="#ff4040",
-                     fontsize=7, fontfamily="monospace", ha="center")
-
-    # ── public update ─────────────────────────────────────────────
-    def update_scene(self, points: np.ndarray, targets: list, persons: dict):
-        ax = self.ax
-
-        # Remove old scatters
-        if self._pt_scat:
-            self._pt_scat.remove(); self._pt_scat = None
-        if self._tk_scat:
-            self._tk_scat.remove(); self._tk_scat = None
-
-        # Point cloud — colour by height
-        if len(points) > 0:
-            xs, ys, zs = points[:,0], points[:,1], points[:,2]
-            z_norm = np.clip(zs / 3.0, 0, 1)
-            colors = np.zeros((len(points), 4))
-            colors[:,0] = 0.0
-            colors[:,1] = 0.3 + z_norm * 0.7
-            colors[:,2] = 0.0
-            colors[:,3] = 0.6
-            self._pt_scat = ax.scatter(xs, ys, zs, c=colors, s=8, depthshade=False)
-
-        # Track centroids
-        if targets:
-            txs = [t["x"] for t in targets]
-            tys = [t["y"] for t in targets]
-            tzs = [t["z"] for t in targets]
-            tcs = []
-            for t in targets:
-                p = persons.get(t["id"])
-                if p and p.in_hazard:
-                    tcs.append("#ff2020")
-                elif p and p.fall:
-                    tcs.append("#ffb300")
-                else:
-                    tcs.append("#39ff14")
-            self._tk_scat = ax.scatter(txs, tys, tzs, c=tcs, s=90,
-                                       marker="^", depthshade=False, zorder=5)
+class FusionWorker(QThread):
+    """
+    Drains the SensorManager queue, fuses frames and runs annotate_frame()
+    (zones, falls, events → sinks) here, like SerialWorker._process() does
+    for one sensor, so event latency does not depend on render load. Fused
+    frames reach the GUI through sig.frame, with points copied out of the
+    fuser's rotating buffers.
+    """
 
-        self.draw_idle()
+    def __init__(self, manager, fuser, zone_names, dispatcher):
+        super().__init__()
+        self.sig      = WorkerSignals()
+        self.manager  = manager
+        self.fuser    = fuser
+        self.zones    = ZoneSet([])   # replaced (not mutated) by the GUI
+        self.events   = EventEngine(zone_names, dispatcher)
+        self.falls    = FallDetector()
+        self._stop_evt = threading.Event()
+
+    def run(self):
+        started = False
+        while not self._stop_evt.is_set():
+            fr = self.manager.get(timeout=FUSE_POLL_MS / 1000.0)
+            fused = self.fuser.push(fr) if fr is not None else []
+            late = self.fuser.poll()
+            if late is not None:
+                fused.append(late)
+            for f in fused:
+                annotate_frame(f, self.zones, self.events, self.falls)
+                # f.points is a view of one of the fuser's FUSE_BUFFERS arrays; the
+                # GUI can lag further behind than that, so it gets its own copy
+                f.points = f.points.copy()
+                if not started:
+                    self.sig.data_started.emit()
+                    started = True
+                self.sig.frame.emit(f)
 
-    def refresh_hazard_zone(self):
-        self._draw_hazard_zone()
-        self._draw_room()
-        self.draw_idle()
+    def stop(self):
+        self._stop_evt.set()
+        self.wait(3000)
 
 
 # ══════════════════════════════════════════════════════════════════
@@ -701,13 +651,64 @@ class AlertBanner(QFrame):
 #  PERSON ROW WIDGET
 # ══════════════════════════════════════════════════════════════════
 class PersonRow(QFrame):
+    """One row per track ID. Built once; set_person() only touches what changed."""
+
     def __init__(self, person: PersonState):
         super().__init__()
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-        self._build(person)
+        self._text  = {}         # field → last text shown
+        self._state = None       # (in_hazard, fall) last styled
+        self._build()
+        self.set_person(person)
+
+    def _build(self):
+        row = QHBoxLayout(self); row.setContentsMargins(8,5,8,5); row.setSpacing(14)
+
+        def field(label, col=WHITE_TEXT):
+            w = QWidget(); lay = QVBoxLayout(w); lay.setContentsMargins(0,0,0,0); lay.setSpacing(0)
+            lbl = QLabel(label); lbl.setStyleSheet(f"color:{SUBTEXT};font-size:8px;font-family:Courier New;letter-spacing:1px;")
+            vl  = QLabel("");    vl.setStyleSheet(f"color:{col};font-size:12px;font-weight:700;font-family:Courier New;")
+            lay.addWidget(lbl); lay.addWidget(vl)
+            row.addWidget(w)
+            return vl
+
+        self._vals = {
+            "id":     field("ID", PHOSPHOR),
+            "height": field("HEIGHT"),
+            "x":      field("X"),
+            "y":      field("Y"),
+            "z":      field("Z"),
+        }
+
+        def flag(txt, col):
+            fl = QLabel(txt)
+            fl.setStyleSheet(f"color:{col};font-size:9px;font-weight:700;font-family:Courier New;"
+                             f"background:{col}18;border:1px solid {col};border-radius:3px;padding:1px 5px;")
+            fl.hide()
+            row.addWidget(fl)
+            return fl
+
+        self._flag_hazard = flag("⚠ HAZARD", RED_ALERT)
+        self._flag_fall   = flag("⚡ FALL",   AMBER)
+        row.addStretch()
+
+    def _set_text(self, key, text):
+        if self._text.get(key) != text:
+            self._text[key] = text
+            self._vals[key].setText(text)
 
-    def _build(self, p: PersonState):
-        # pick border colour
+    def set_person(self, p: PersonState):
+        self._set_text("id",     f"#{p.tid:02d}")
+        self._set_text("height", f"{p.height:.2f} m")
+        self._set_text("x",      f"{p.x:+.2f}")
+        self._set_text("y",      f"{p.y:.2f}")
+        self._set_text("z",      f"{p.z:.2f}")
+
+        state = (bool(p.in_hazard), bool(p.fall))
+        if state == self._state:
+            return
+        self._state = state
+        # border colour + flags restyled only when hazard/fall state flips
         bc = RED_ALERT if p.in_hazard else (AMBER if p.fall else BORDER)
         self.setStyleSheet(f"""
             QFrame {{
@@ -717,32 +718,85 @@ class PersonRow(QFrame):
                 border-radius:3px;
             }}
         """)
-        row = QHBoxLayout(self); row.setContentsMargins(8,5,8,5); row.setSpacing(14)
+        self._vals["height"].setStyleSheet(
+            f"color:{AMBER if p.fall else WHITE_TEXT};font-size:12px;font-weight:700;font-family:Courier New;")
+        self._flag_hazard.setVisible(p.in_hazard)
+        self._flag_fall.setVisible(p.fall)
 
-        def field(label, val, col=WHITE_TEXT):
-            w = QWidget(); lay = QVBoxLayout(w); lay.setContentsMargins(0,0,0,0); lay.setSpacing(0)
-            lbl = QLabel(label); lbl.setStyleSheet(f"color:{SUBTEXT};font-size:8px;font-family:Courier New;letter-spacing:1px;")
-            vl  = QLabel(val);   vl.setStyleSheet(f"color:{col};font-size:12px;font-weight:700;font-family:Courier New;")
-            lay.addWidget(lbl); lay.addWidget(vl)
-            return w
 
-        row.addWidget(field("ID", f"#{p.tid:02d}", PHOSPHOR))
-        row.addWidget(field("HEIGHT", f"{p.height:.2f} m",
-                            AMBER if p.fall else WHITE_TEXT))
-        row.addWidget(field("X", f"{p.x:+.2f}"))
-        row.addWidget(field("Y", f"{p.y:.2f}"))
-        row.addWidget(field("Z", f"{p.z:.2f}"))
-
-        flags = []
-        if p.in_hazard:    flags.append(("⚠ HAZARD", RED_ALERT))
-        if p.fall:         flags.append(("⚡ FALL",   AMBER))
-
-        for txt, col in flags:
-            fl = QLabel(txt)
-            fl.setStyleSheet(f"color:{col};font-size:9px;font-weight:700;font-family:Courier New;"
-                             f"background:{col}18;border:1px solid {col};border-radius:3px;padding:1px 5px;")
-            row.addWidget(fl)
-        row.addStretch()
+# ══════════════════════════════════════════════════════════════════
+#  LOG SINK  —  batched, bounded CLI console + optional rotating file
+# ══════════════════════════════════════════════════════════════════
+class LogSink(QObject):
+    """
+    post() only queues the message; a LOG_FLUSH_MS timer renders everything
+    pending in one go into a QPlainTextEdit whose document is capped at
+    LOG_MAX_BLOCKS lines, so appends stay O(1) for the whole session.
+    With a file path, messages are also mirrored to a RotatingFileHandler
+    running on a logging QueueListener thread (no disk I/O on the GUI thread).
+    """
+    COLORS = {"info": CYAN_INFO, "ok": PHOSPHOR, "error": RED_ALERT,
+              "tx": AMBER, "dim": SUBTEXT, "warn": AMBER}
+    LEVELS = {"error": logging.ERROR, "warn": logging.WARNING}
+
+    def __init__(self, view: QPlainTextEdit, file_path=None, parent=None):
+        super().__init__(parent)
+        self.view     = view
+        self._pending = deque()
+        self._timer   = QTimer(self)
+        self._timer.timeout.connect(self.flush)
+        self._timer.start(LOG_FLUSH_MS)
+
+        self._file_log = None
+        self._listener = None
+        if file_path:
+            try:
+                os.makedirs(os.path.dirname(file_path), exist_ok=True)
+                fh = logging.handlers.RotatingFileHandler(
+                    file_path, maxBytes=LOG_FILE_BYTES, backupCount=LOG_FILE_COUNT,
+                    encoding="utf-8")
+                fh.setFormatter(logging.Formatter("%(asctime)s %(levelname)-7s %(message)s"))
+                q = queue.SimpleQueue()
+                self._listener = logging.handlers.QueueListener(q, fh)
+                self._listener.start()
+                self._file_log = logging.getLogger("radar_ims.cli")
+                self._file_log.propagate = False
+                self._file_log.setLevel(logging.INFO)
+                self._file_log.addHandler(logging.handlers.QueueHandler(q))
+            except OSError:
+                self._file_log = None
+
+    def post(self, msg, level="info"):
+        self._pending.append((time.strftime("%H:%M:%S"), msg, level))
+        if self._file_log:
+            self._file_log.log(self.LEVELS.get(level, logging.INFO), msg)
+
+    def flush(self):
+        if not self._pending:
+            return
+        view = self.view
+        sb = view.verticalScrollBar()
+        at_bottom = sb.value() >= sb.maximum() - 2
+        view.setUpdatesEnabled(False)
+        while self._pending:
+            ts, msg, level = self._pending.popleft()
+            col = self.COLORS.get(level, WHITE_TEXT)
+            view.appendHtml(
+                f'<span style="color:{SUBTEXT}">[{ts}]</span>'
+                f' <span style="color:{col}">{html.escape(str(msg))}</span>')
+        view.setUpdatesEnabled(True)
+        if at_bottom:
+            sb.setValue(sb.maximum())
+
+    def close(self):
+        self._timer.stop()
+        self.flush()
+        if self._file_log:
+            for h in list(self._file_log.handlers):
+                self._file_log.removeHandler(h)
+            self._file_log = None
+        if self._listener:
+            self._listener.stop(); self._listener = None
 
 
 # ══════════════════════════════════════════════════════════════════
@@ -811,7 +865,7 @@ QPushButton#btn_stop {{
     color: #fff;
 }}
 QPushButton#btn_stop:hover {{ background: #cc0000; }}
-QTextEdit {{
+QTextEdit, QPlainTextEdit {{
     background: #050805;
     border: 1px solid {BORDER};
     color: {DIM_GREEN};
@@ -851,7 +905,7 @@ QSplitter::handle {{
 
 class MainWindow(QMainWindow):
 
-    def __init__(self):
+    def __init__(self, sensor_specs=None, persist=True):
         super().__init__()
         self.setWindowTitle("RADAR IMS  ·  IWR6843AOP EVM  ·  Industrial Monitoring")
         self.setMinimumSize(1360, 820)
@@ -860,14 +914,76 @@ class MainWindow(QMainWindow):
         self.zone    = HazardZone()
         self.persons = {}        # tid → PersonState
         self.worker  = None
-        self._frame_ts = deque(maxlen=60)
+        self.stats   = FrameStats()
+        self._evm    = None          # EvmPorts found by USB identity on last refresh
+        self.sensor_specs = sensor_specs   # multi-sensor mode when set (--sensors file)
+        self.persist = persist       # False: no log / event files, no occupancy snapshot
+        self.manager = None
+        self.fuser   = None
+        self.fusion  = None          # FusionWorker (multi-sensor mode)
+        self.extra_zones = self._load_extra_zones()
+        self.zones   = self._compile_zones()
+        self.dispatcher = self._make_dispatcher()
+        self.predictor = self._make_predictor()
+        self.occupancy = OccupancyGrid()
+        self._load_occupancy()
+        self._person_rows   = {}     # tid → PersonRow
+        self._persons_dirty = False
 
         self._build_ui()
 
+        self._ui_timer = QTimer(self)
+        self._ui_timer.timeout.connect(self._refresh_person_panel)
+        self._ui_timer.start(int(1000 / UI_REFRESH_HZ))
+        self._stats_timer = QTimer(self)
+        self._stats_timer.timeout.connect(self._log_stats)
+        self._stats_timer.start(STATS_LOG_MS)
+
+        self._occ_timer = QTimer(self)
+        self._occ_timer.timeout.connect(self._refresh_occupancy)
+        self._occ_timer.start(OCC_REFRESH_MS)
+        self._occ_snap_timer = QTimer(self)
+        self._occ_snap_timer.timeout.connect(self._snapshot_occupancy)
+        self._occ_snap_timer.start(int(OCC_SNAPSHOT_EVERY * 1000))
+        self._render_timer = QTimer(self)
+        self._render_timer.timeout.connect(self._render_tracks)
+        self._render_timer.start(int(1000 / RENDER_HZ))
+
         # Auto-populate ports after the window is fully constructed
         QTimer.singleShot(100, self._on_refresh_ports)
         QTimer.singleShot(200, self._load_initial_config)
 
+    # ── deferred views ────────────────────────────────────────────
+    def init_views(self):
+        """Import matplotlib and build the 3D view; call after the first paint."""
+        if self.canvas3d is not None:
+            return
+        from views import Radar3DCanvas
+        tab3d = self._tabs.widget(0)
+        self._clear_tab(tab3d)
+        self.canvas3d = Radar3DCanvas(self.zone, tab3d)
+        self.canvas3d.draw_zones(self.extra_zones)
+        tab3d.layout().addWidget(self.canvas3d)
+
+    def _on_tab_changed(self, index):
+        if index == 1 and self.canvas_occ is None:
+            from views import HeatmapCanvas
+            tab_occ = self._tabs.widget(1)
+            self._clear_tab(tab_occ)
+            self.canvas_occ = HeatmapCanvas(self.occupancy, tab_occ)
+            tab_occ.layout().addWidget(self.canvas_occ)
+            self.canvas_occ.refresh()
+        elif index == 0:
+            self.init_views()
+
+    @staticmethod
+    def _clear_tab(tab):
+        lay = tab.layout()
+        while lay.count():
+            w = lay.takeAt(0).widget()
+            if w is not None:
+                w.deleteLater()
+
     def _load_initial_config(self):
         if os.path.exists(DEFAULT_CFG_PATH):
             try:
@@ -936,8 +1052,11 @@ class MainWindow(QMainWindow):
         self.card_fps   = StatCard("Frame Rate", "0", "Hz",      CYAN_INFO)
         self.card_pts   = StatCard("Points", "0",   "in cloud",  DIM_GREEN)
         self.card_trk   = StatCard("Tracks", "0",   "active",    AMBER)
+        self.card_lost  = StatCard("Lost", "0",     "frames",    RED_ALERT)
+        self.card_jit   = StatCard("Jitter", "0",   "ms (σ)",    CYAN_INFO)
         sg.addWidget(self.card_count, 0, 0); sg.addWidget(self.card_fps,  0, 1)
         sg.addWidget(self.card_pts,   1, 0); sg.addWidget(self.card_trk,  1, 1)
+        sg.addWidget(self.card_lost,  2, 0); sg.addWidget(self.card_jit,  2, 1)
         ll.addWidget(stats)
 
         # Alerts
@@ -983,24 +1102,36 @@ class MainWindow(QMainWindow):
 
         tabs = QTabWidget()
 
-        # Tab 1 — 3D view
+        # Tab 1 — 3D view; Tab 2 — occupancy heatmap.
+        # Both are matplotlib canvases, built by init_views() / on first show;
+        # until then the tabs hold a placeholder so the window paints at once.
         tab3d = QWidget(); t3l = QVBoxLayout(tab3d); t3l.setContentsMargins(4,4,4,4)
-        self.canvas3d = Radar3DCanvas(self.zone, tab3d)
-        t3l.addWidget(self.canvas3d)
+        t3l.addWidget(mk_label("Initialising 3D view…", 11, color=SUBTEXT, mono=True),
+                      alignment=Qt.AlignCenter)
         tabs.addTab(tab3d, "  3D RADAR VIEW  ")
-
-        # Tab 2 — CLI console
+        tab_occ = QWidget(); tol = QVBoxLayout(tab_occ); tol.setContentsMargins(4,4,4,4)
+        tol.addWidget(mk_label("Initialising occupancy view…", 11, color=SUBTEXT, mono=True),
+                      alignment=Qt.AlignCenter)
+        tabs.addTab(tab_occ, "  OCCUPANCY  ")
+        self.canvas3d   = None
+        self.canvas_occ = None
+        tabs.currentChanged.connect(self._on_tab_changed)
+        self._tabs = tabs
+
+        # Tab 3 — CLI console
         tab_cli = QWidget(); tcl = QVBoxLayout(tab_cli); tcl.setContentsMargins(6,6,6,6)
         tcl.addWidget(mk_label("CLI  /  SERIAL CONSOLE", 10, bold=True, color=PHOSPHOR, mono=True))
         tcl.addWidget(mk_label(
             f"AOP_6m_default (People Tracking)  ·  CLI @ {CLI_BAUD}  ·  Data @ {DATA_BAUD} baud  "
             f"·  Lower COM# = CLI,  Higher COM# = Data",
             9, color=SUBTEXT, mono=True))
-        self.cli_log = QTextEdit(); self.cli_log.setReadOnly(True)
+        self.cli_log = QPlainTextEdit(); self.cli_log.setReadOnly(True)
+        self.cli_log.setMaximumBlockCount(LOG_MAX_BLOCKS)
+        self.log_sink = LogSink(self.cli_log, LOG_FILE_PATH if self.persist else None, parent=self)
         tcl.addWidget(self.cli_log)
         tabs.addTab(tab_cli, "  CLI CONSOLE  ")
 
-        # Tab 3 — Config editor
+        # Tab 4 — Config editor
         tab_cfg = QWidget(); tfl = QVBoxLayout(tab_cfg); tfl.setContentsMargins(6,6,6,6)
         tfl.addWidget(mk_label("ACTIVE CONFIGURATION SCRIPT", 10, bold=True, color=PHOSPHOR, mono=True))
         self.cfg_editor = QTextEdit()
@@ -1043,12 +1174,21 @@ class MainWindow(QMainWindow):
             combo.addItem("(none found)", userData="")
 
     def _on_refresh_ports(self):
-        """Refresh both dropdowns and auto-assign CLI=lower, Data=higher."""
+        """Refresh both dropdowns; assign by USB identity, else CLI=lower, Data=higher."""
         self._fill_ports(self.cmb_cli)
         self._fill_ports(self.cmb_data)
 
         ports = self._get_sorted_ports()
-        if len(ports) >= 2:
+        evms = discover_evms(ports)
+        self._evm = evms[0] if evms else None
+        if self._evm:
+            self.cmb_cli.setCurrentIndex(self.cmb_cli.findData(self._evm.cli))
+            self.cmb_data.setCurrentIndex(self.cmb_data.findData(self._evm.data))
+            how = "last verified mapping" if self._evm.source == "cache" else "USB interface"
+            self._log(f"{self._evm.bridge} EVM → CLI: {self._evm.cli}   Data: {self._evm.data}  ({how})", "ok")
+            if len(evms) > 1:
+                self._log(f"  {len(evms) - 1} more EVM(s) attached — using the first", "dim")
+        elif len(ports) >= 2:
             # Auto-select: lower COM# → CLI, higher COM# → Data
             self.cmb_cli.setCurrentIndex(0)
             self.cmb_data.setCurrentIndex(len(ports) - 1)
@@ -1064,12 +1204,15 @@ class MainWindow(QMainWindow):
 
     # ── connect / stop ────────────────────────────────────────────
     def _on_toggle_connection(self):
-        if self.worker and self.worker.isRunning():
+        if (self.worker and self.worker.isRunning()) or self.manager:
             self._on_stop()
         else:
             self._on_connect()
 
     def _on_connect(self):
+        if self.sensor_specs:
+            self._start_multi()
+            return
         # currentData() holds the raw device path (e.g. "COM5")
         # currentText() holds the display string (e.g. "COM5  [XDS110 CLI]")
         cp  = self.cmb_cli.currentData()  or self.cmb_cli.currentText().split()[0]
@@ -1096,7 +1239,11 @@ class MainWindow(QMainWindow):
         self._log(f"━━━ Connecting:  CLI={cp}   Data={dp} ━━━", "info")
         self._log("  (Code will auto-swap ports if no data detected)", "dim")
 
-        self.worker = SerialWorker(cp, dp, cfg)
+        self.stats.reset()
+        known = self._evm is not None and (cp, dp) == (self._evm.cli, self._evm.data)
+        self.worker = SerialWorker(cp, dp, cfg, ports_known=known, dispatcher=self.dispatcher)
+        self.worker.zones = self.zones
+        self._log(f"  Coordinates: {COORD_FRAME} frame — {self.worker.to_world}", "dim")
         self.worker.sig.log.connect(self._log)
         self.worker.sig.config_ok.connect(self._on_config_ok)
         self.worker.sig.data_started.connect(self._on_data_started)
@@ -1106,6 +1253,13 @@ class MainWindow(QMainWindow):
     def _on_stop(self):
         if self.worker:
             self.worker.stop(); self.worker = None
+        if self.manager:
+            self.fusion.stop(); self.fusion = None
+            self.manager.stop(); self.manager = None
+            self._log(self.fuser.summary(), "dim")
+        self.predictor = self._make_predictor()
+        if self.canvas3d is not None:
+            self.canvas3d.update_tracks(self.predictor.ids, self.predictor.predict(0.0), {})
         self.btn_connect.setText("▶  CONNECT")
         self.btn_connect.setStyleSheet(GLOBAL_SS) # Reset to default style from GLOBAL_SS
         # But wait, GLOBAL_SS has QPushButton#btn_connect style which is green.
@@ -1130,24 +1284,29 @@ class MainWindow(QMainWindow):
 
     def _on_frame(self, frame: RadarFrame):
         now = time.time()
-        self._frame_ts.append(now)
-        fps = len([t for t in self._frame_ts if now - t < 2.0]) / 2.0
+        # Arrival time as stamped by the reader thread, not when Qt delivered it here
+        self.stats.update(frame, frame.timestamp or now)
+        fps = self.stats.fps()
 
         pts = frame.points
+        hazard_ids, fallen_ids, any_hazard = frame.alerts or ((), (), False)
+        for ev in frame.events:
+            self._log_event(ev)
         # Update/create person states
         active_ids = set()
-        for t in frame.targets:
+        for i, t in enumerate(frame.targets):
             tid = t["id"]; active_ids.add(tid)
             if tid not in self.persons:
                 self.persons[tid] = PersonState(tid)
-            self.persons[tid].update(t["x"], t["y"], t["z"], pts, self.zone)
+            self.persons[tid].update(t["x"], t["y"], t["z"], float(frame.heights[i]),
+                                     tid in hazard_ids, tid in fallen_ids)
         # Remove stale
         for gone in set(self.persons) - active_ids:
             del self.persons[gone]
 
         # Alerts
-        any_hazard = any(p.in_hazard for p in self.persons.values())
-        any_fall   = any(p.fall      for p in self.persons.values())
+        # Banners follow the debounced engine state (snapshot on the frame), not raw per-frame flags
+        any_fall   = bool(fallen_ids)
         self.alert_hazard.set_active(any_hazard)
         self.alert_fall.set_active(any_fall)
 
@@ -1156,41 +1315,158 @@ class MainWindow(QMainWindow):
         self.card_fps.set_value(f"{fps:.1f}")
         self.card_pts.set_value(len(pts))
         self.card_trk.set_value(len(frame.targets))
+        self.card_lost.set_value(self.stats.lost)
+        self.card_jit.set_value(f"{self.stats.jitter_std():.1f}")
 
-        # Person list
-        self._refresh_person_panel()
+        # Person list — redrawn by _ui_timer at UI_REFRESH_HZ
+        self._persons_dirty = True
+
+        # Occupancy heatmap — O(points in this frame)
+        if OCC_SOURCE == "targets":
+            if len(frame.target_pos):
+                self.occupancy.add(frame.target_pos, now)
+        else:
+            self.occupancy.add(pts, now)
 
-        # 3D
-        self.canvas3d.update_scene(pts, frame.targets, self.persons)
+        # 3D — points per frame; track markers follow the predictor at RENDER_HZ
+        if self.canvas3d is not None:
+            self.canvas3d.update_scene(pts)
+        self.predictor.update(frame, now)
 
     def _refresh_person_panel(self):
+        if not self._persons_dirty:
+            return
+        self._persons_dirty = False
         layout = self._person_layout
-        # remove all but stretch
-        while layout.count() > 1:
-            item = layout.takeAt(0)
-            if item.widget(): item.widget().deleteLater()
-        for p in sorted(self.persons.values(), key=lambda x: x.tid):
-            layout.insertWidget(layout.count()-1, PersonRow(p))
+        rows   = self._person_rows
+
+        for gone in set(rows) - set(self.persons):
+            w = rows.pop(gone)
+            layout.removeWidget(w); w.deleteLater()
+
+        for tid in sorted(self.persons):
+            p = self.persons[tid]
+            row = rows.get(tid)
+            if row is None:
+                row = rows[tid] = PersonRow(p)
+                # keep rows ordered by track ID (stretch stays last)
+                pos = sum(1 for t in rows if t < tid)
+                layout.insertWidget(pos, row)
+            else:
+                row.set_person(p)
+
+    def _render_tracks(self):
+        p = self.predictor
+        if p.frames == 0 or self.canvas3d is None:
+            return
+        # Predict to when this draw reaches the screen, not to when it was requested
+        t = time.time() + self.canvas3d.draw_ms / 1000.0
+        self.canvas3d.update_tracks(p.ids, p.predict(t), self.persons)
+
+    def _log_stats(self):
+        if self.manager:
+            for line in format_health(self.manager.health()).splitlines():
+                self._log(line, "dim")
+            self._log(self.fuser.summary(), "dim")
+        if ((self.worker and self.worker.isRunning()) or self.manager) and self.stats.frames:
+            self._log(self.stats.log_line(time.time()), "dim")
+            if self.canvas3d is not None:
+                self._log(f"display: pipeline latency {self.predictor.latency_ms:.0f} ms · "
+                          f"draw {self.canvas3d.draw_ms:.0f} ms · tracks drawn at {RENDER_HZ} Hz", "dim")
+
+    # ── multi-sensor mode: SensorManager readers → FrameFuser → _on_frame ──
+    def _start_multi(self):
+        ids = [s.sensor_id for s in self.sensor_specs]
+        self.btn_connect.setText("■  DISCONNECT")
+        self.btn_connect.setStyleSheet(f"background: {RED_ALERT}; color: #fff;")
+        self._set_status("CONNECTING…", AMBER)
+        self._log(f"━━━ Starting {len(ids)} sensors: {', '.join(ids)} ━━━", "info")
+        for spec in self.sensor_specs:
+            self._log(f"  {spec.sensor_id}: CLI={spec.cli_port}  Data={spec.data_port}  "
+                      f"{spec.transform()}", "dim")
+        self.stats.reset()
+        self.fuser   = FrameFuser(ids)
+        self.manager = SensorManager(self.sensor_specs)
+        self.fusion  = FusionWorker(self.manager, self.fuser, self.zones.names, self.dispatcher)
+        self.fusion.zones = self.zones
+        self.fusion.sig.data_started.connect(self._on_data_started)
+        self.fusion.sig.frame.connect(self._on_frame)
+        self.manager.start()
+        self.fusion.start()
+
+    def _refresh_occupancy(self):
+        if self.canvas_occ is not None and self._tabs.currentWidget() is self.canvas_occ.parent():
+            self.canvas_occ.refresh()
+
+    def _snapshot_occupancy(self):
+        try:
+            self.occupancy.save()
+        except OSError as e:
+            self._log(f"Occupancy snapshot failed: {e}", "warn")
+
+    def _make_predictor(self):
+        # Sensor-side latency is assumed per sensor (sensors.json latency_ms); fused
+        # frames are as old as their slowest sensor
+        lat = [s.latency_s for s in self.sensor_specs or () if s.latency_s is not None]
+        return TrackPredictor(sensor_latency=max(lat)) if lat else TrackPredictor()
+
+    def _load_occupancy(self):
+        # A truncated / corrupt snapshot must not stop the app: start empty instead
+        try:
+            self.occupancy.load()
+        except (OSError, ValueError, EOFError) as e:
+            print(f"occupancy: cannot load snapshot, starting empty: {e}")
+            self.occupancy.clear()
+
+    def _make_dispatcher(self):
+        sinks = []
+        try:
+            if self.persist:
+                sinks.append(FileSink(EVENT_LOG_PATH))
+        except OSError as e:
+            print(f"events: no file sink ({e})")
+        if EVENT_UDP_ADDR:
+            sinks.append(UdpSink(*EVENT_UDP_ADDR))
+        if EVENT_WEBHOOK_URL:
+            sinks.append(WebhookSink(EVENT_WEBHOOK_URL))
+        return EventDispatcher(sinks)
+
+    def _log_event(self, ev):
+        who = "points" if ev["track"] < 0 else f"track {ev['track']}"
+        where = f" {ev['zone']}" if ev["zone"] else ""
+        level = "error" if ev["type"] in ("enter", "fall") else "info"
+        self._log(f"EVENT {ev['type'].upper():<9} {who}{where}  "
+                  f"({ev['latency_ms']:.0f} ms)" + (f" [{ev['reason']}]" if "reason" in ev else ""), level)
+
+    def _load_extra_zones(self):
+        if not os.path.exists(ZONES_PATH):
+            return []
+        try:
+            return load_zones(ZONES_PATH)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"zones: cannot load {ZONES_PATH}: {e}")
+            return []
+
+    def _compile_zones(self):
+        """Hazard box from the panel + polygon zones from zones.json, as one ZoneSet."""
+        zs = ZoneSet([Zone.from_box("HAZARD", self.zone)] + self.extra_zones)
+        for w in (self.worker, self.fusion):
+            if w:
+                w.zones = zs                # reference swap; the reader picks it up next frame
+        return zs
 
     def _apply_zone(self):
         v = [s.value() for s in self._hz_spins]
         self.zone.update(*v)
-        self.canvas3d.zone = self.zone
-        self.canvas3d.refresh_hazard_zone()
+        self.zones = self._compile_zones()
+        if self.canvas3d is not None:
+            self.canvas3d.zone = self.zone
+            self.canvas3d.refresh_hazard_zone()
         self._log(f"Hazard zone updated → X[{v[0]:.1f},{v[1]:.1f}] Y[{v[2]:.1f},{v[3]:.1f}] Z[{v[4]:.1f},{v[5]:.1f}]","info")
 
     # ── log ───────────────────────────────────────────────────────
     def _log(self, msg, level="info"):
-        col_map = {"info": CYAN_INFO, "ok": PHOSPHOR, "error": RED_ALERT,
-                   "tx": AMBER, "dim": SUBTEXT, "warn": AMBER}
-        col = col_map.get(level, WHITE_TEXT)
-        ts  = time.strftime("%H:%M:%S")
-        self.cli_log.append(
-            f'<span style="color:{SUBTEXT}">[{ts}]</span>'
-            f' <span style="color:{col}">{msg}</span>'
-        )
-        sb = self.cli_log.verticalScrollBar()
-        sb.setValue(sb.maximum())
+        self.log_sink.post(msg, level)
 
     def _set_status(self, text, color):
         self.lbl_status.setText(f"⬤  {text}")
@@ -1198,17 +1474,43 @@ class MainWindow(QMainWindow):
             f"color:{color};font-size:12px;font-weight:700;font-family:Courier New;")
 
     def closeEvent(self, ev):
-        self._on_stop(); super().closeEvent(ev)
+        self._on_stop()
+        if self.persist:
+            self._snapshot_occupancy()
+        self.dispatcher.close()
+        self.log_sink.close()
+        super().closeEvent(ev)
 
 
 # ══════════════════════════════════════════════════════════════════
 #  ENTRY POINT
 # ══════════════════════════════════════════════════════════════════
 def main():
-    app = QApplication(sys.argv)
+    import argparse
+    ap = argparse.ArgumentParser(description="RADAR IMS")
+    ap.add_argument("--sensors", help="JSON sensors file: run several radars and fuse them")
+    ap.add_argument("--startup-profile", action="store_true",
+                    help="print per-import and per-phase startup times, then exit")
+    args, qt_argv = ap.parse_known_args()
+    specs = load_sensor_specs(args.sensors) if args.sensors else None
+    if PROFILE: PROFILE.mark("module imports")
+
+    app = QApplication(sys.argv[:1] + qt_argv)
     app.setFont(QFont("Arial", 10))
-    win = MainWindow()
+    if PROFILE: PROFILE.mark("QApplication")
+    win = MainWindow(specs, persist=not PROFILE)   # a profile run leaves no files behind
+    if PROFILE: PROFILE.mark("main window built")
     win.show()
+    app.processEvents()              # first paint before matplotlib is even imported
+    if PROFILE: PROFILE.mark("first paint")
+    win.init_views()
+    if PROFILE:
+        app.processEvents()
+        PROFILE.mark("3D view ready")
+        PROFILE.uninstall()
+        print(PROFILE.report())
+        win.close()
+        sys.exit(0)
     sys.exit(app.exec_())
 
 if __name__ == "__main__":
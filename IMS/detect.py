@@ -1,13 +1,21 @@
+import os
+import sys
 import tkinter as tk
 from tkinter import filedialog
 import serial
 import serial.tools.list_ports
 import threading
 import struct
-import math
+from collections import namedtuple
 import numpy as np
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import matplotlib.pyplot as pltha
+import matplotlib.pyplot as plt
+
+# Modules shared with the other apps (radar_common/) live at the repository root
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from radar_common.config_uploader import ConfigUploader
+from device_cache import DeviceCache
+from port_discovery import discover_evms
 
 
 BAUD_CONFIG = 115200
@@ -16,7 +24,89 @@ BAUD_DATA = 921600
 MAGIC_WORD = b'\x02\x01\x04\x03\x06\x05\x08\x07'
 TRACK_TLV = 1010
 
-VELOCITY_THRESHOLD = 0.15
+# 108-byte target record: id, x, y, vx, vy, then 22 floats we don't use
+TARGET_DTYPE = np.dtype([
+    ("tid", "<u4"),
+    ("pos", "<f4", 2),
+    ("vel", "<f4", 2),
+    ("rest", "<f4", 22),
+])
+
+VELOCITY_WINDOW = 6        # frames of speed averaged per track (~0.3 s)
+MOVING_ENTER = 0.20        # m/s mean speed to become "Moving"
+MOVING_EXIT = 0.10         # m/s mean speed to fall back to "Sitting"
+
+DISPLAY_MS = 50            # plot refresh period; newer frames replace older ones in between
+
+
+class MotionClassifier:
+    """
+    Moving / Sitting per track from the mean speed over the last
+    VELOCITY_WINDOW frames, with hysteresis between MOVING_ENTER and
+    MOVING_EXIT so one noisy velocity can't flip the state.
+
+    Each track owns a row of a (slots x window) speed array; one update()
+    per frame writes all tracks and classifies them together. Tracks
+    missing from a frame are forgotten (the tracker reports every live
+    track each frame).
+    """
+
+    def __init__(self, window=VELOCITY_WINDOW, slots=16):
+        self.window = window
+        self.speed = np.zeros((slots, window), dtype=np.float32)
+        self.filled = np.zeros(slots, dtype=np.int64)
+        self.moving = np.zeros(slots, dtype=bool)
+        self._slot = {}            # tid -> row
+
+    def _rows(self, tids):
+        live = set(tids)
+        for tid in [t for t in self._slot if t not in live]:
+            del self._slot[tid]
+        used = set(self._slot.values())
+        free = [r for r in range(len(self.speed)) if r not in used]
+        rows = np.empty(len(tids), dtype=np.int64)
+        for i, tid in enumerate(tids):
+            r = self._slot.get(tid)
+            if r is None:
+                if not free:
+                    n = len(self.speed)
+                    self.speed = np.vstack([self.speed, np.zeros_like(self.speed)])
+                    self.filled = np.concatenate([self.filled, np.zeros(n, dtype=np.int64)])
+                    self.moving = np.concatenate([self.moving, np.zeros(n, dtype=bool)])
+                    free = list(range(n, 2 * n))
+                r = self._slot[tid] = free.pop(0)
+                self.speed[r] = 0.0
+                self.filled[r] = 0
+                self.moving[r] = False
+            rows[i] = r
+        return rows
+
+    def update(self, tids, speeds):
+        """tids: track ids of this frame; speeds: matching m/s. Returns bool moving flags."""
+        rows = self._rows(tids)
+        if len(rows) == 0:
+            return np.zeros(0, dtype=bool)
+        self.speed[rows, self.filled[rows] % self.window] = speeds
+        self.filled[rows] += 1
+        mean = self.speed[rows].sum(axis=1) / np.minimum(self.filled[rows], self.window)
+        moving = np.where(self.moving[rows], mean > MOVING_EXIT, mean >= MOVING_ENTER)
+        self.moving[rows] = moving
+        return moving
+
+
+# One parsed frame as handed to the Tk thread. Built once by the reader
+# thread and never modified afterwards (its arrays are read-only).
+Snapshot = namedtuple("Snapshot", ["frame", "ids", "xy", "moving"])
+
+
+def make_snapshot(frame, ids, xy, moving):
+    for a in (ids, xy, moving):
+        a.setflags(write=False)
+    return Snapshot(frame, ids, xy, moving)
+
+
+EMPTY_SNAPSHOT = make_snapshot(0, np.zeros(0, dtype=np.uint32),
+                               np.zeros((0, 2), dtype=np.float32), np.zeros(0, dtype=bool))
 
 
 class PeopleMotionDetector:
@@ -26,14 +116,25 @@ class PeopleMotionDetector:
         self.root.title("Industrial Radar - Motion Classification")
 
         self.data_buffer = bytearray()
-        self.tracks = {}
+        self.motion = MotionClassifier()
         self.running = False
 
+        # Single-slot handoff: the reader thread replaces `latest` (one
+        # reference assignment, atomic), the Tk timer picks up whatever is
+        # newest. Frames replaced before they were drawn count as dropped.
+        self.latest = EMPTY_SNAPSHOT
+        self.frames = 0
+        self.shown = 0
+        self.dropped = 0
+
         self.config_port = None
         self.data_port = None
+        self.evm = None
+        self.ports_verified = False
 
         self.create_ui()
         self.auto_detect_ports()
+        self.root.after(DISPLAY_MS, self.display_tick)
 
     # ---------------- UI ----------------
 
@@ -54,8 +155,19 @@ class PeopleMotionDetector:
         self.summary_label = tk.Label(left, text="Moving: 0 | Sitting: 0")
         self.summary_label.pack()
 
+        self.frames_label = tk.Label(left, text="Frames: 0 | Not drawn: 0", fg="gray")
+        self.frames_label.pack()
+
         # 2D Plot
         self.fig, self.ax = plt.subplots()
+        self.ax.set_xlabel("X (m)")
+        self.ax.set_ylabel("Y (m)")
+        self.ax.set_xlim(-5, 5)
+        self.ax.set_ylim(0, 10)
+        # Persistent artists: each frame only moves them
+        self.moving_plot = self.ax.scatter(np.zeros(0), np.zeros(0), c='red', s=100)
+        self.sitting_plot = self.ax.scatter(np.zeros(0), np.zeros(0), c='blue', s=100)
+        self.labels = []
         self.canvas = FigureCanvasTkAgg(self.fig, master=right)
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
 
@@ -63,7 +175,16 @@ class PeopleMotionDetector:
 
     def auto_detect_ports(self):
         ports = list(serial.tools.list_ports.comports())
-        if len(ports) >= 2:
+        evms = discover_evms(ports)
+        if evms:
+            self.evm = evms[0]
+            self.config_port = self.evm.cli
+            self.data_port = self.evm.data
+            self.status_label.config(
+                text=f"{self.evm.bridge}: CLI {self.config_port} & Data {self.data_port}",
+                fg="green"
+            )
+        elif len(ports) >= 2:
             self.config_port = ports[0].device
             self.data_port = ports[1].device
             self.status_label.config(
@@ -80,15 +201,27 @@ class PeopleMotionDetector:
         if not file_path:
             return
 
+        self.status_label.config(text="Sending Config...", fg="blue")
+        threading.Thread(target=self._upload_config, args=(file_path,), daemon=True).start()
+
+    def _upload_config(self, file_path):
         try:
-            ser = serial.Serial(self.config_port, BAUD_CONFIG, timeout=1)
             with open(file_path, 'r') as f:
-                for line in f:
-                    ser.write((line.strip() + '\n').encode())
-            ser.close()
-            self.status_label.config(text="Config Sent", fg="green")
+                cfg_text = f.read()
+            with serial.Serial(self.config_port, BAUD_CONFIG, timeout=1) as ser:
+                ser.reset_input_buffer()
+                result = ConfigUploader(ser).upload(cfg_text)
+            print("Config:", result.summary())
+            for r in result.errors:
+                print(f"  {r.cmd} -> {r.response}")
+            if result.ok:
+                self.root.after(0, lambda: self.status_label.config(
+                    text=f"Config Sent ({result.total_ms:.0f} ms)", fg="green"))
+            else:
+                self.root.after(0, lambda: self.status_label.config(
+                    text=f"Config Errors: {len(result.errors)}", fg="red"))
         except Exception as e:
-            self.status_label.config(text="Config Error", fg="red")
+            self.root.after(0, lambda: self.status_label.config(text="Config Error", fg="red"))
             print(e)
 
     # ---------------- Threading ----------------
@@ -110,6 +243,13 @@ class PeopleMotionDetector:
         except Exception as e:
             print("Serial Error:", e)
 
+    def remember_ports(self):
+        # Frames arrived, so this CLI/data mapping is verified for next time
+        self.ports_verified = True
+        if self.evm is not None:
+            DeviceCache().update(self.evm.identity,
+                                 cli_port=self.config_port, data_port=self.data_port)
+
     # ---------------- Parsing ----------------
 
     def parse_stream(self):
@@ -134,13 +274,15 @@ class PeopleMotionDetector:
 
             packet = self.data_buffer[idx:idx + total_len]
             self.parse_frame(packet, num_tlvs)
+            if not self.ports_verified:
+                self.remember_ports()
 
             del self.data_buffer[:idx + total_len]
 
     def parse_frame(self, packet, num_tlvs):
 
         offset = 40
-        self.tracks.clear()
+        targets = b""
 
         for _ in range(num_tlvs):
 
@@ -150,61 +292,54 @@ class PeopleMotionDetector:
             payload = packet[offset:offset + tlv_len - 8]
 
             if tlv_type == TRACK_TLV:
-                self.parse_targets(payload)
+                targets = payload
 
             offset += tlv_len - 8
 
-        self.root.after(0, self.update_plot)
+        self.parse_targets(targets)
 
     def parse_targets(self, payload):
 
-        size = 108
-        count = len(payload) // size
-
-        for i in range(count):
-
-            chunk = payload[i * size:(i + 1) * size]
-            data = struct.unpack('<I26f', chunk)
+        count = len(payload) // TARGET_DTYPE.itemsize
+        t = np.frombuffer(payload, dtype=TARGET_DTYPE, count=count)
 
-            tid = data[0]
-            posX = data[1]
-            posY = data[2]
-            velX = data[3]
-            velY = data[4]
+        speed = np.hypot(t["vel"][:, 0], t["vel"][:, 1])
+        moving = self.motion.update(t["tid"].tolist(), speed)
 
-            velocity = math.sqrt(velX**2 + velY**2)
-
-            state = "Moving" if velocity > VELOCITY_THRESHOLD else "Sitting"
-
-            self.tracks[tid] = (posX, posY, state)
+        self.frames += 1
+        self.latest = make_snapshot(self.frames, t["tid"].copy(), t["pos"].copy(), moving)
 
     # ---------------- 2D Plot ----------------
 
-    def update_plot(self):
-
-        self.ax.clear()
-
-        moving_count = 0
-        sitting_count = 0
-
-        for tid, (x, y, state) in self.tracks.items():
-
-            if state == "Moving":
-                self.ax.scatter(x, y, c='red', s=100)
-                moving_count += 1
-            else:
-                self.ax.scatter(x, y, c='blue', s=100)
-                sitting_count += 1
-
-            self.ax.text(x, y, f"ID {tid}", fontsize=8)
-
-        self.ax.set_xlabel("X (m)")
-        self.ax.set_ylabel("Y (m)")
-        self.ax.set_xlim(-5, 5)
-        self.ax.set_ylim(0, 10)
-
+    def display_tick(self):
+        # Runs on the Tk thread at a fixed rate, however fast frames arrive
+        snap = self.latest
+        if snap.frame != self.shown:
+            self.dropped += max(snap.frame - self.shown - 1, 0)
+            self.shown = snap.frame
+            self.update_plot(snap)
+            self.frames_label.config(text=f"Frames: {snap.frame} | Not drawn: {self.dropped}")
+        self.root.after(DISPLAY_MS, self.display_tick)
+
+    def update_plot(self, snap):
+
+        ids, xy, moving = snap.ids, snap.xy, snap.moving
+
+        self.moving_plot.set_offsets(xy[moving])
+        self.sitting_plot.set_offsets(xy[~moving])
+
+        while len(self.labels) < len(ids):
+            self.labels.append(self.ax.text(0, 0, "", fontsize=8))
+        for label, tid, (x, y) in zip(self.labels, ids.tolist(), xy.tolist()):
+            label.set_position((x, y))
+            label.set_text(f"ID {tid}")
+            label.set_visible(True)
+        for label in self.labels[len(ids):]:
+            label.set_visible(False)
+
+        moving_count = int(moving.sum())
         self.summary_label.config(
-            text=f"Moving: {moving_count} | Sitting: {sitting_count}"
+            text=f"Moving: {moving_count} | Sitting: {len(ids) - moving_count}"
         )
 
         self.canvas.draw()
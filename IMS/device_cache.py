@@ -0,0 +1,94 @@
+import os
+import json
+import time
+import hashlib
+
+from radar_common.config_uploader import config_commands
+
+# ══════════════════════════════════════════════════════════════════
+#  DEVICE CACHE  —  what each EVM was last configured with
+# ══════════════════════════════════════════════════════════════════
+CACHE_PATH = os.path.join(os.path.expanduser("~"), ".radar_ims", "device_cache.json")
+
+# Control commands that do not change the sensor configuration
+_CONTROL_CMDS = {"sensorStop", "sensorStart", "flushCfg"}
+
+
+def _norm_token(tok):
+    try:
+        return repr(float(tok))           # "55.00" and "55" hash the same
+    except ValueError:
+        return tok
+
+
+def config_hash(cfg_text):
+    """SHA-1 of the normalised config: no comments/whitespace/control commands."""
+    lines = []
+    for cmd in config_commands(cfg_text):
+        parts = cmd.split()
+        if parts[0] in _CONTROL_CMDS:
+            continue
+        lines.append(" ".join([parts[0]] + [_norm_token(t) for t in parts[1:]]))
+    return hashlib.sha1("\n".join(lines).encode("ascii", errors="ignore")).hexdigest()
+
+
+def usb_identity(p):
+    """
+    Identity of the USB device behind a list_ports entry: VID:PID + serial
+    number, else the USB location without its interface suffix ("1-1.4:1.0"
+    → "1-1.4"), so every port of one bridge gives the same key. None when
+    the OS reports neither.
+    """
+    dev = p.serial_number or (p.location or "").split(":")[0]
+    return f"{p.vid:04x}:{p.pid:04x}:{dev}" if dev else None
+
+
+def device_identity(port):
+    """
+    Stable identity for the EVM behind a serial port: usb_identity() of the
+    port (survives COM-number changes), else the port name.
+    """
+    try:
+        import serial.tools.list_ports
+        for p in serial.tools.list_ports.comports():
+            if p.device == port and p.vid is not None:
+                return usb_identity(p) or f"port:{port}"
+    except Exception:
+        pass
+    return f"port:{port}"
+
+
+class DeviceCache:
+    """Small JSON file keyed by device identity; every write is atomic."""
+
+    def __init__(self, path=CACHE_PATH):
+        self.path = path
+        self._data = {}
+        try:
+            with open(path, "r") as f:
+                self._data = json.load(f)
+        except (OSError, ValueError):
+            self._data = {}
+
+    def get(self, device_id):
+        return self._data.get(device_id)
+
+    def update(self, device_id, **fields):
+        entry = self._data.setdefault(device_id, {})
+        entry.update(fields)
+        entry["updated"] = time.time()
+        self._save()
+
+    def forget(self, device_id):
+        if self._data.pop(device_id, None) is not None:
+            self._save()
+
+    def _save(self):
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp = self.path + ".tmp"
+            with open(tmp, "w") as f:
+                json.dump(self._data, f, indent=1, sort_keys=True)
+            os.replace(tmp, self.path)
+        except OSError:
+            pass
@@ -0,0 +1,254 @@
+import os
+import json
+import time
+import queue
+import socket
+import threading
+import urllib.request
+
+# ══════════════════════════════════════════════════════════════════
+#  EVENTS  —  debounced zone / fall events, delivered to async sinks
+# ══════════════════════════════════════════════════════════════════
+ENTER_MIN_S   = 0.25          # inside a zone this long before "enter"
+EXIT_MIN_S    = 1.0           # outside this long before "exit" (hysteresis)
+FALL_MIN_S    = 0.1           # fall flag held this long before "fall" (FallDetector already needs a dwell)
+RECOVER_MIN_S = 2.0           # … and cleared this long before "recovered"
+SINK_QUEUE    = 1000          # per-sink backlog; events beyond it are dropped and counted
+POINTS_TRACK  = -1            # track id used for raw-point intrusions
+
+
+class _Debounce:
+    """Two-state debouncer: the raw input must hold for on_s / off_s to flip."""
+
+    __slots__ = ["state", "since"]
+
+    def __init__(self):
+        self.state = False
+        self.since = None         # when the raw input started to disagree with state
+
+    def feed(self, raw, t, on_s, off_s):
+        """Returns True when the debounced state flips on this call."""
+        if raw == self.state:
+            self.since = None
+            return False
+        if self.since is None:
+            self.since = t
+        if t - self.since >= (on_s if raw else off_s):
+            self.state, self.since = raw, None
+            return True
+        return False
+
+
+class EventEngine:
+    """
+    Turns per-frame flags into debounced events.
+
+    For every (track, zone) pair the raw "inside" flag must hold for
+    ENTER_MIN_S before an "enter" event and be absent for EXIT_MIN_S before
+    "exit" — the longer exit time is the hysteresis that stops a person on
+    a zone edge from flickering. Falls work the same way per track
+    (FALL_MIN_S / RECOVER_MIN_S). A track that disappears leaves its zones
+    with reason "lost".
+
+    Events go to the dispatcher (non-blocking) and are also returned, so the
+    caller can attach them to the frame. `hazard` / `fallen` hold the
+    debounced state for the alert banners.
+    """
+
+    def __init__(self, zone_names, dispatcher=None):
+        self.zone_names = list(zone_names)
+        self.dispatcher = dispatcher
+        self._zone = {}           # (tid, zone index) → _Debounce
+        self._fall = {}           # tid → _Debounce
+        self._last = {}           # tid → (x, y, z)
+        self.hazard = set()       # (tid, zone name) currently inside
+        self.fallen = set()       # tids currently fallen
+
+    def set_zones(self, zone_names):
+        """Zones changed: drop per-zone state (open zones exit with reason "reconfigured")."""
+        if list(zone_names) == self.zone_names:
+            return []
+        now = time.time()
+        out = [self._event("exit", now, tid, self.zone_names[zi], reason="reconfigured")
+               for (tid, zi), d in self._zone.items() if d.state]
+        self.zone_names = list(zone_names)
+        self._zone.clear(); self.hazard.clear()
+        self._post(out)
+        return out
+
+    def update(self, t, track_ids, positions, zone_mask, falls=None, sensor_id=None,
+               point_intrusion=None):
+        """
+        t          frame timestamp (host time)
+        track_ids  sequence of target ids, in the row order of positions/zone_mask
+        positions  T×3 world positions
+        zone_mask  bool T×Z from ZoneSet.evaluate (None → no zones)
+        falls      bool T raw fall flags (None → not evaluated)
+        point_intrusion  bool Z, enough raw points inside each zone; debounced
+                   like a track with id POINTS_TRACK (catches untracked intruders)
+        """
+        out = []
+        seen = set()
+        for i, tid in enumerate(track_ids):
+            tid = int(tid); seen.add(tid)
+            self._last[tid] = tuple(float(v) for v in positions[i][:3])
+            if zone_mask is not None:
+                self._feed_zones(out, t, tid, zone_mask[i], sensor_id)
+            if falls is not None:
+                d = self._fall.setdefault(tid, _Debounce())
+                if d.feed(bool(falls[i]), t, FALL_MIN_S, RECOVER_MIN_S):
+                    kind = "fall" if d.state else "recovered"
+                    (self.fallen.add if d.state else self.fallen.discard)(tid)
+                    out.append(self._event(kind, t, tid, None, sensor_id))
+
+        if point_intrusion is not None:
+            seen.add(POINTS_TRACK)
+            self._feed_zones(out, t, POINTS_TRACK, point_intrusion, sensor_id)
+
+        # Tracks that vanished: close their zones and falls at once
+        for key in [k for k in self._zone if k[0] not in seen]:
+            d = self._zone.pop(key)
+            if d.state:
+                out.append(self._zone_event(False, t, key[0], key[1], sensor_id, reason="lost"))
+        for tid in [k for k in self._fall if k not in seen]:
+            if self._fall.pop(tid).state:
+                self.fallen.discard(tid)
+                out.append(self._event("recovered", t, tid, None, sensor_id, reason="lost"))
+        for tid in [k for k in self._last if k not in seen]:
+            del self._last[tid]
+
+        self._post(out)
+        return out
+
+    def _feed_zones(self, out, t, tid, row, sensor_id):
+        for zi in range(len(row)):
+            raw = bool(row[zi])
+            d = self._zone.get((tid, zi))
+            if d is None:
+                if not raw:
+                    continue
+                d = self._zone[(tid, zi)] = _Debounce()
+            if d.feed(raw, t, ENTER_MIN_S, EXIT_MIN_S):
+                out.append(self._zone_event(d.state, t, tid, zi, sensor_id))
+            if not d.state and d.since is None:
+                del self._zone[(tid, zi)]
+
+    def _zone_event(self, entered, t, tid, zi, sensor_id, reason=None):
+        name = self.zone_names[zi]
+        (self.hazard.add if entered else self.hazard.discard)((tid, name))
+        return self._event("enter" if entered else "exit", t, tid, name, sensor_id, reason)
+
+    def _event(self, kind, t, tid, zone, sensor_id=None, reason=None):
+        x, y, z = self._last.get(tid, (None, None, None))
+        ev = {"type": kind, "ts": t, "track": tid, "zone": zone, "sensor": sensor_id,
+              "x": x, "y": y, "z": z,
+              "latency_ms": round((time.time() - t) * 1000.0, 1)}
+        if reason:
+            ev["reason"] = reason
+        return ev
+
+    def _post(self, events):
+        if self.dispatcher is not None:
+            for ev in events:
+                self.dispatcher.post(ev)
+
+
+# ── sinks ─────────────────────────────────────────────────────────
+class FileSink:
+    """Appends one JSON object per line."""
+
+    def __init__(self, path):
+        self.path = path
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._f = open(path, "a", buffering=1, encoding="utf-8")
+
+    def send(self, ev):
+        self._f.write(json.dumps(ev) + "\n")
+
+    def close(self):
+        self._f.close()
+
+
+class UdpSink:
+    """One JSON datagram per event (e.g. to a local PLC gateway or logger)."""
+
+    def __init__(self, host="127.0.0.1", port=5599):
+        self.addr = (host, port)
+        self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+    def send(self, ev):
+        self._sock.sendto(json.dumps(ev).encode("utf-8"), self.addr)
+
+    def close(self):
+        self._sock.close()
+
+
+class WebhookSink:
+    """HTTP POST of the event as JSON; runs on its own thread, so a slow endpoint only delays itself."""
+
+    def __init__(self, url, timeout=2.0):
+        self.url, self.timeout = url, timeout
+
+    def send(self, ev):
+        req = urllib.request.Request(self.url, data=json.dumps(ev).encode("utf-8"),
+                                     headers={"Content-Type": "application/json"})
+        urllib.request.urlopen(req, timeout=self.timeout).close()
+
+    def close(self):
+        pass
+
+
+class EventDispatcher:
+    """
+    Fans events out to sinks without blocking the caller.
+
+    Each sink gets its own bounded queue and daemon thread; post() only does
+    put_nowait, so a slow or failing sink never delays the reader thread or
+    the other sinks. Full queues drop the event and count it in `dropped`.
+    """
+
+    def __init__(self, sinks, maxsize=SINK_QUEUE):
+        self.sinks   = list(sinks)
+        self.dropped = 0
+        self.errors  = 0
+        self.last_error = ""
+        self._queues = []
+        self._threads = []
+        for s in self.sinks:
+            q = queue.Queue(maxsize=maxsize)
+            th = threading.Thread(target=self._run, args=(s, q), daemon=True,
+                                  name=f"events-{type(s).__name__}")
+            self._queues.append(q); self._threads.append(th)
+            th.start()
+
+    def post(self, ev):
+        for q in self._queues:
+            try:
+                q.put_nowait(ev)
+            except queue.Full:
+                self.dropped += 1
+
+    def _run(self, sink, q):
+        while True:
+            ev = q.get()
+            if ev is None:
+                break
+            try:
+                sink.send(ev)
+            except Exception as e:       # a broken sink must not kill its thread
+                self.errors += 1
+                self.last_error = f"{type(sink).__name__}: {e}"
+        try:
+            sink.close()
+        except Exception:
+            pass
+
+    def close(self, timeout=1.0):
+        for q in self._queues:
+            try:
+                q.put(None, timeout=timeout)
+            except queue.Full:
+                pass
+        for th in self._threads:
+            th.join(timeout)
@@ -0,0 +1,123 @@
+import numpy as np
+
+# ══════════════════════════════════════════════════════════════════
+#  FALL DETECTOR  —  per-track height / vz history, batched per frame
+# ══════════════════════════════════════════════════════════════════
+HISTORY       = 48            # frames kept per track (~2.6 s at 18 fps)
+MIN_POINTS    = 3             # frames with fewer nearby points are ignored (sparse)
+DROP_WINDOW_S = 1.2           # look back this far for the standing height
+DROP_MIN_M    = 0.5           # height must fall by at least this much …
+DROP_RATE_MS  = 0.8           # … at this rate (m/s) or faster,
+PEAK_TOL_M    = 0.1           #   timed from the last frame within this of the standing height,
+VZ_FALL_MS    = -0.8          # … or the tracker's vz must reach this
+DWELL_S       = 0.8           # then stay low this long
+DWELL_FRAMES  = 5             # with at least this many usable frames
+FALL_HEIGHT_M = 0.5           # "low" = mean height below this
+RECOVER_M     = 0.9           # fall clears once mean height is back above this
+STALE_S       = 3.0           # free a track's slot after this long unseen
+
+
+class FallDetector:
+    """
+    Temporal fall classifier over all tracks at once.
+
+    Every track owns one row of preallocated (slots × HISTORY) ring arrays:
+    timestamp, height, z-velocity and nearby point count. update() writes
+    the new column for all tracks with one fancy-indexed store, then
+    evaluates every active row together:
+
+      drop   the highest height in the DROP_WINDOW_S before the dwell window
+             minus the mean height in the dwell window ≥ DROP_MIN_M, reached
+             at ≥ DROP_RATE_MS — or vz ≤ VZ_FALL_MS during that time. The
+             rate is timed from the last frame within PEAK_TOL_M of that
+             height, so a long stand before the fall does not dilute it
+      dwell  ≥ DWELL_FRAMES usable frames in the last DWELL_S, mean height
+             below FALL_HEIGHT_M
+
+    drop & dwell latches the fall; it clears when the mean height in the
+    dwell window rises above RECOVER_M. Frames with fewer than MIN_POINTS
+    points near the track are masked out, so one sparse frame cannot
+    trigger (or clear) a fall.
+    """
+
+    def __init__(self, history=HISTORY, slots=32):
+        self.history = history
+        self._alloc(slots)
+        self._slot = {}               # tid → row
+
+    def _alloc(self, slots):
+        old = getattr(self, "t", None)
+        H = self.history
+        t = np.full((slots, H), -np.inf)
+        h = np.zeros((slots, H), dtype=np.float32)
+        vz = np.zeros((slots, H), dtype=np.float32)
+        n = np.zeros((slots, H), dtype=np.int32)
+        head = np.zeros(slots, dtype=np.int64)
+        fallen = np.zeros(slots, dtype=bool)
+        last = np.full(slots, -np.inf)
+        if old is not None:
+            k = len(old)
+            t[:k], h[:k], vz[:k], n[:k] = self.t, self.h, self.vz, self.n
+            head[:k], fallen[:k], last[:k] = self.head, self.fallen, self.last
+        self.t, self.h, self.vz, self.n = t, h, vz, n
+        self.head, self.fallen, self.last = head, fallen, last
+        self._free = [i for i in range(slots - 1, -1, -1)
+                      if old is None or i >= len(old)] + getattr(self, "_free", [])
+
+    def _rows(self, tids, now):
+        # free slots of tracks not seen for STALE_S
+        for tid, r in list(self._slot.items()):
+            if now - self.last[r] > STALE_S:
+                del self._slot[tid]
+                self._free.append(r)
+        rows = np.empty(len(tids), dtype=np.int64)
+        for i, tid in enumerate(tids):
+            r = self._slot.get(tid)
+            if r is None:
+                if not self._free:
+                    self._alloc(2 * len(self.t))
+                r = self._slot[tid] = self._free.pop()
+                self.t[r] = -np.inf; self.n[r] = 0; self.head[r] = 0; self.fallen[r] = False
+            rows[i] = r
+        return rows
+
+    def update(self, now, track_ids, heights, vz, counts):
+        """Feed one frame (arrays in target order); returns bool fall flags per target."""
+        tids = [int(t) for t in track_ids]
+        if not tids:
+            self._rows(tids, now)
+            return np.zeros(0, dtype=bool)
+        rows = self._rows(tids, now)
+        col = self.head[rows]
+        self.t[rows, col] = now
+        self.h[rows, col] = heights
+        self.vz[rows, col] = vz
+        self.n[rows, col] = counts
+        self.head[rows] = (col + 1) % self.history
+        self.last[rows] = now
+
+        t, h, v = self.t[rows], self.h[rows], self.vz[rows]
+        age = now - t
+        usable = self.n[rows] >= MIN_POINTS
+        dwell = usable & (age <= DWELL_S)
+        before = usable & (age > DWELL_S) & (age <= DWELL_S + DROP_WINDOW_S)
+
+        n_dwell = dwell.sum(axis=1)
+        mean_dwell = np.where(dwell, h, 0.0).sum(axis=1) / np.maximum(n_dwell, 1)
+        h_before = np.where(before, h, -np.inf)
+        peak = h_before.max(axis=1)
+        # last frame still at standing height, i.e. where the drop started
+        t_peak = np.where(h_before >= peak[:, None] - PEAK_TOL_M, t, -np.inf).max(axis=1)
+        t_low = np.where(dwell, t, np.inf).min(axis=1)      # first frame of the dwell window
+        drop = peak - mean_dwell
+        rate = np.divide(drop, np.maximum(t_low - t_peak, 1e-3), out=np.zeros_like(drop),
+                         where=np.isfinite(peak) & np.isfinite(t_low))
+        fast_vz = (np.where(before | dwell, v, 0.0) <= VZ_FALL_MS).any(axis=1)
+
+        dropped = np.isfinite(peak) & (drop >= DROP_MIN_M) & ((rate >= DROP_RATE_MS) | fast_vz)
+        low = (n_dwell >= DWELL_FRAMES) & (mean_dwell < FALL_HEIGHT_M)
+        recovered = (n_dwell >= DWELL_FRAMES) & (mean_dwell > RECOVER_M)
+
+        fallen = (self.fallen[rows] | (dropped & low)) & ~recovered
+        self.fallen[rows] = fallen
+        return fallen
@@ -0,0 +1,138 @@
+import time
+from collections import deque
+import numpy as np
+
+# ══════════════════════════════════════════════════════════════════
+#  FRAME STATISTICS  —  rate, gaps, jitter, parse time, sensor frame period
+# ══════════════════════════════════════════════════════════════════
+STATS_WINDOW_S  = 2.0          # sliding window for the rate meter
+CPU_CLOCK_HZ    = 200e6        # IWR6843 R4F clock; header timeCpuCycles ticks at this rate
+JITTER_BIN_MS   = 5.0          # inter-arrival histogram bin width
+JITTER_BINS     = 40           # 0 … 200 ms, last bin collects everything above
+EWMA_ALPHA      = 0.1
+
+
+class RateMeter:
+    """
+    Sliding-window event rate. add() and rate() are amortised O(1):
+    each timestamp is appended once and popped once.
+    """
+
+    def __init__(self, window=STATS_WINDOW_S):
+        self.window = float(window)
+        self._ts = deque()
+
+    def add(self, t):
+        self._ts.append(t)
+        self._expire(t)
+
+    def _expire(self, now):
+        ts, lim = self._ts, now - self.window
+        while ts and ts[0] < lim:
+            ts.popleft()
+
+    def rate(self, now=None):
+        if now is not None:
+            self._expire(now)
+        return len(self._ts) / self.window
+
+    def clear(self):
+        self._ts.clear()
+
+
+class FrameStats:
+    """
+    Per-stream frame statistics, fed once per parsed RadarFrame.
+
+      fps          sliding-window frame rate (RateMeter)
+      gaps / lost  frame_num discontinuities from the header / frames missed
+      resets       frame_num went backwards (sensor restarted)
+      jitter       inter-arrival histogram (JITTER_BIN_MS bins) + mean/std of
+                   the reader-thread arrival times (frame.timestamp)
+      chip_ms      frame period by the sensor's clock (header timeCpuCycles
+                   deltas); not on-chip processing time
+      parse_ms     host parse time per frame (set by the reader thread)
+    """
+
+    def __init__(self, window=STATS_WINDOW_S, cpu_clock_hz=CPU_CLOCK_HZ):
+        self.rate = RateMeter(window)
+        self.cpu_clock_hz = cpu_clock_hz
+        self.hist = np.zeros(JITTER_BINS, dtype=np.int64)
+        self.reset()
+
+    def reset(self):
+        self.rate.clear()
+        self.hist[:] = 0
+        self.frames   = 0
+        self.gaps     = 0
+        self.lost     = 0
+        self.resets   = 0
+        self.chip_ms  = 0.0
+        self.parse_ms = 0.0
+        self._last_num    = None
+        self._last_t      = None
+        self._last_cycles = None
+        # Welford running mean / variance of inter-arrival (ms)
+        self._n = 0; self._mean = 0.0; self._m2 = 0.0
+
+    def update(self, frame, now=None):
+        """now: arrival time of the frame (pass frame.timestamp; defaults to time.time())."""
+        now = time.time() if now is None else now
+        self.frames += 1
+        self.rate.add(now)
+
+        num = frame.frame_num
+        if self._last_num is not None:
+            d = num - self._last_num
+            if d > 1:
+                self.gaps += 1
+                self.lost += d - 1
+            elif d <= 0:
+                self.resets += 1
+        self._last_num = num
+
+        if self._last_t is not None:
+            dt_ms = (now - self._last_t) * 1000.0
+            b = min(int(dt_ms / JITTER_BIN_MS), JITTER_BINS - 1)
+            self.hist[b] += 1
+            self._n += 1
+            delta = dt_ms - self._mean
+            self._mean += delta / self._n
+            self._m2 += delta * (dt_ms - self._mean)
+        self._last_t = now
+
+        cycles = getattr(frame, "cpu_cycles", None)
+        if cycles is not None:
+            if self._last_cycles is not None:
+                dc = (cycles - self._last_cycles) & 0xFFFFFFFF   # u32 wrap
+                ms = dc / self.cpu_clock_hz * 1000.0
+                self.chip_ms = ms if self.chip_ms == 0.0 else \
+                    self.chip_ms + EWMA_ALPHA * (ms - self.chip_ms)
+            self._last_cycles = cycles
+
+        p = getattr(frame, "parse_ms", 0.0)
+        if p:
+            self.parse_ms = p if self.parse_ms == 0.0 else \
+                self.parse_ms + EWMA_ALPHA * (p - self.parse_ms)
+
+    # ── derived values ────────────────────────────────────────────
+    def fps(self, now=None):
+        return self.rate.rate(now)
+
+    def jitter_std(self):
+        return (self._m2 / (self._n - 1)) ** 0.5 if self._n > 1 else 0.0
+
+    def interval_percentile(self, q):
+        """Inter-arrival percentile (ms) from the histogram, bin-centre resolution."""
+        total = self.hist.sum()
+        if total == 0:
+            return 0.0
+        idx = int(np.searchsorted(np.cumsum(self.hist), q / 100.0 * total))
+        return (min(idx, JITTER_BINS - 1) + 0.5) * JITTER_BIN_MS
+
+    def log_line(self, now=None):
+        return (f"stats: {self.fps(now):.1f} fps · frames {self.frames} · "
+                f"gaps {self.gaps} (lost {self.lost}) · "
+                f"interval {self._mean:.1f}±{self.jitter_std():.1f} ms "
+                f"(p50 {self.interval_percentile(50):.0f} / p95 {self.interval_percentile(95):.0f}) · "
+                f"sensor period {self.chip_ms:.1f} ms · parse {self.parse_ms:.2f} ms")
@@ -0,0 +1,147 @@
+import math
+import time
+import numpy as np
+
+from radar_protocol import RadarFrame
+
+# ══════════════════════════════════════════════════════════════════
+#  FUSION  —  frames from several sensors → one world-frame frame
+# ══════════════════════════════════════════════════════════════════
+FUSE_WINDOW_S   = 0.03        # frames within this host-time window belong together
+FUSE_MAX_POINTS = 4096        # fused point-cloud capacity (extra points are dropped)
+FUSE_BUFFERS    = 4           # rotating output buffers = fused frames in flight downstream
+DEDUP_RADIUS    = 0.4         # m (x/y); targets of different sensors closer than this merge
+FUSED_ID_STRIDE = 1000        # fused target id = sensor index × stride + sensor track id
+
+
+class FrameFuser:
+    """
+    Aligns frames from several sensors by host timestamp and fuses them.
+
+    Frames must already be in the shared world frame (SensorTransform with
+    per-sensor placement). A group is emitted as soon as every sensor has
+    delivered a frame, when a sensor delivers its next frame, or — through
+    poll() — once the oldest frame in the group is FUSE_WINDOW_S old, so
+    fusion adds at most one window of latency even when a sensor drops out.
+
+    Points are concatenated into one of FUSE_BUFFERS preallocated arrays
+    (the fused frame's points are a view of it; consumers that keep points
+    longer than FUSE_BUFFERS frames must copy). Targets seen by two sensors
+    are merged through a spatial hash with cell size DEDUP_RADIUS.
+    """
+
+    def __init__(self, sensor_ids, window=FUSE_WINDOW_S, max_points=FUSE_MAX_POINTS,
+                 dedup_radius=DEDUP_RADIUS):
+        self.sensor_ids = list(sensor_ids)
+        self._index  = {sid: i for i, sid in enumerate(self.sensor_ids)}
+        self.window  = window
+        self.dedup_radius = dedup_radius
+        self._bufs   = [np.empty((max_points, 4), dtype=np.float32) for _ in range(FUSE_BUFFERS)]
+        self._buf_i  = 0
+        self._pending = {}            # sensor_id → newest frame of the open group
+        self._t_first = None          # timestamp of the oldest frame in the open group
+        self.fused     = 0            # fused frames emitted
+        self.partial   = 0            # … of which were missing at least one sensor
+        self.truncated = 0            # fused frames that hit max_points
+        self.merged    = 0            # duplicate targets removed
+        self.latency_ms = 0.0         # EWMA of oldest-frame age at emit
+        self.latency_max_ms = 0.0
+
+    def push(self, fr, now=None):
+        """Add one sensor frame; returns the fused frames completed by it (0–2)."""
+        now = time.time() if now is None else now
+        out = []
+        if fr.sensor_id in self._pending or \
+                (self._pending and fr.timestamp - self._t_first > self.window):
+            out.append(self._flush(now))
+        self._pending[fr.sensor_id] = fr
+        if self._t_first is None:
+            self._t_first = fr.timestamp
+        if len(self._pending) == len(self.sensor_ids):
+            out.append(self._flush(now))
+        return out
+
+    def poll(self, now=None):
+        """Emit the open group if it has waited a full window; else None."""
+        now = time.time() if now is None else now
+        if self._pending and now - self._t_first >= self.window:
+            return self._flush(now)
+        return None
+
+    # ── internals ─────────────────────────────────────────────────
+    def _flush(self, now):
+        frames = [self._pending[s] for s in self.sensor_ids if s in self._pending]
+        self._pending = {}
+        self._t_first = None
+
+        f = RadarFrame()
+        f.sensor_id = "fused"
+        f.frame_num = self.fused
+        f.timestamp = max(fr.timestamp for fr in frames)
+        f.parse_ms  = sum(fr.parse_ms for fr in frames)
+        f.platform  = frames[0].platform
+        f.tlv_types = tuple(sorted({t for fr in frames for t in fr.tlv_types}))
+
+        buf = self._bufs[self._buf_i]
+        self._buf_i = (self._buf_i + 1) % len(self._bufs)
+        n = 0
+        for fr in frames:
+            k = min(len(fr.points), len(buf) - n)
+            buf[n:n + k] = fr.points[:k]
+            n += k
+        if n == len(buf) and sum(len(fr.points) for fr in frames) > n:
+            self.truncated += 1
+        f.points = buf[:n]
+
+        ids = np.concatenate([fr.target_ids.astype(np.int64) +
+                              self._index[fr.sensor_id] * FUSED_ID_STRIDE for fr in frames])
+        pos = np.concatenate([np.hstack([fr.target_pos, fr.target_vel, fr.target_acc]) for fr in frames])
+        owner = np.concatenate([np.full(len(fr.target_ids), self._index[fr.sensor_id])
+                                for fr in frames])
+        f.target_ids, pv = self._dedup(ids, pos, owner)
+        f.target_pos, f.target_vel, f.target_acc = pv[:, :3].copy(), pv[:, 3:6].copy(), pv[:, 6:9].copy()
+
+        self.fused += 1
+        if len(frames) < len(self.sensor_ids):
+            self.partial += 1
+        lat = (now - min(fr.timestamp for fr in frames)) * 1000.0
+        self.latency_ms = lat if self.fused == 1 else self.latency_ms + 0.1 * (lat - self.latency_ms)
+        self.latency_max_ms = max(self.latency_max_ms, lat)
+        return f
+
+    def _dedup(self, ids, pos, owner):
+        """Merge targets of different sensors within dedup_radius (x/y); rows (pos, vel, acc) averaged."""
+        if len(ids) < 2:
+            return ids.astype(np.uint32), pos.astype(np.float32)
+        r = self.dedup_radius; r2 = r * r
+        cells = {}
+        keep = []                       # [id, owner set, column sums, count]
+        for tid, p, o in zip(ids.tolist(), pos.tolist(), owner.tolist()):
+            cx, cy = math.floor(p[0] / r), math.floor(p[1] / r)
+            hit = None
+            for dx in (-1, 0, 1):
+                for dy in (-1, 0, 1):
+                    for k in cells.get((cx + dx, cy + dy), ()):
+                        kk = keep[k]
+                        mx, my = kk[2][0] / kk[3], kk[2][1] / kk[3]
+                        if o not in kk[1] and (mx - p[0]) ** 2 + (my - p[1]) ** 2 < r2:
+                            hit = k; break
+                    if hit is not None: break
+                if hit is not None: break
+            if hit is None:
+                cells.setdefault((cx, cy), []).append(len(keep))
+                keep.append([tid, {o}, list(p), 1])
+            else:
+                kk = keep[hit]
+                kk[1].add(o); kk[3] += 1
+                kk[2] = [a + b for a, b in zip(kk[2], p)]
+                self.merged += 1
+        out_ids = np.array([k[0] for k in keep], dtype=np.uint32)
+        out_rows = np.array([[c / k[3] for c in k[2]] for k in keep], dtype=np.float32)
+        return out_ids, out_rows.reshape(-1, pos.shape[1])
+
+    def summary(self):
+        return (f"fusion: {self.fused} frames ({self.partial} partial) · "
+                f"{self.merged} duplicate targets merged · "
+                f"latency {self.latency_ms:.1f} ms (max {self.latency_max_ms:.1f}) · "
+                f"truncated {self.truncated}")
@@ -0,0 +1,103 @@
+import os
+import time
+import numpy as np
+
+# ══════════════════════════════════════════════════════════════════
+#  OCCUPANCY HEATMAP  —  incremental grid accumulator
+# ══════════════════════════════════════════════════════════════════
+OCC_BOUNDS         = ((-4.0, 4.0), (0.0, 6.0))   # x, y (add a z band for 3-D)
+OCC_CELL           = 0.10        # metres per cell
+OCC_HALF_LIFE      = 6 * 3600.0  # s — old activity fades with this half-life
+OCC_DECAY_EVERY    = 30.0        # s — decay cadence (O(cells), not per frame)
+OCC_SNAPSHOT_EVERY = 300.0       # s — .npy snapshot cadence
+OCC_SNAPSHOT_PATH  = os.path.join(os.path.dirname(__file__), "occupancy.npy")
+
+
+class OccupancyGrid:
+    """
+    Long-term "where do people spend time" heatmap.
+
+    add() bins one frame of positions with np.add.at into a fixed 2-D or 3-D
+    grid, so each update costs O(points in frame) no matter how long the
+    history is. Exponential decay is applied on a fixed cadence instead of per
+    frame: every `decay_every` seconds the grid is scaled by
+    0.5 ** (elapsed / half_life).
+    """
+
+    def __init__(self, bounds=OCC_BOUNDS, cell=OCC_CELL,
+                 half_life=OCC_HALF_LIFE, decay_every=OCC_DECAY_EVERY):
+        self.lo    = np.array([b[0] for b in bounds], dtype=np.float32)
+        self.hi    = np.array([b[1] for b in bounds], dtype=np.float32)
+        self.cell  = float(cell)
+        self.ndim  = len(bounds)
+        self.shape = tuple(int(np.ceil((h - l) / self.cell))
+                           for l, h in zip(self.lo, self.hi))
+        self.grid  = np.zeros(self.shape, dtype=np.float32)
+        self._flat = self.grid.reshape(-1)           # view, same storage
+        self._max_idx = np.array(self.shape, dtype=np.intp) - 1
+        self.half_life   = float(half_life)
+        self.decay_every = float(decay_every)
+        self._last_decay = time.time()
+        self.total = 0.0                             # decayed sample count
+
+    # ── accumulation ──────────────────────────────────────────────
+    def add(self, positions: np.ndarray, now=None, weight=1.0):
+        """Accumulate N × ≥ndim positions (extra columns ignored)."""
+        now = time.time() if now is None else now
+        if now - self._last_decay >= self.decay_every:
+            self.decay(now)
+        if positions is None or len(positions) == 0:
+            return
+        p = positions[:, :self.ndim]
+        inside = np.all((p >= self.lo) & (p < self.hi), axis=1)
+        if not inside.any():
+            return
+        idx = ((p[inside] - self.lo) / self.cell).astype(np.intp)
+        # guard against float rounding at the upper edge
+        np.minimum(idx, self._max_idx, out=idx)
+        flat = np.ravel_multi_index(idx.T, self.shape)
+        np.add.at(self._flat, flat, weight)
+        self.total += weight * len(flat)
+
+    def decay(self, now=None):
+        now = time.time() if now is None else now
+        dt = now - self._last_decay
+        self._last_decay = now
+        if dt <= 0 or self.half_life <= 0:
+            return
+        k = np.float32(0.5 ** (dt / self.half_life))
+        self.grid *= k
+        self.total *= float(k)
+
+    def clear(self):
+        self.grid[:] = 0
+        self.total = 0.0
+
+    # ── views ─────────────────────────────────────────────────────
+    def floor_map(self):
+        """2-D (x, y) map; 3-D grids are summed over the height axis."""
+        return self.grid if self.ndim == 2 else self.grid.sum(axis=2)
+
+    def extent(self):
+        """(x0, x1, y0, y1) for imshow."""
+        return (float(self.lo[0]), float(self.lo[0] + self.shape[0] * self.cell),
+                float(self.lo[1]), float(self.lo[1] + self.shape[1] * self.cell))
+
+    # ── persistence ───────────────────────────────────────────────
+    def save(self, path=OCC_SNAPSHOT_PATH):
+        """Atomic .npy snapshot (write temp file, then rename)."""
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            np.save(f, self.grid)
+        os.replace(tmp, path)
+
+    def load(self, path=OCC_SNAPSHOT_PATH):
+        """Resume from a snapshot with the same grid shape. Returns True if loaded."""
+        if not os.path.exists(path):
+            return False
+        g = np.load(path)
+        if g.shape != self.shape:
+            return False
+        self.grid[...] = g
+        self.total = float(g.sum())
+        return True
@@ -0,0 +1,85 @@
+import re
+
+from device_cache import DeviceCache, usb_identity
+
+# ══════════════════════════════════════════════════════════════════
+#  PORT DISCOVERY  —  CLI / data port pair from USB identity
+# ══════════════════════════════════════════════════════════════════
+# (vid, pid): (cli interface, data interface, bridge name)
+KNOWN_EVM_BRIDGES = {
+    (0x0451, 0xBEF3): (0, 3, "XDS110"),   # XDS110: if00 App/User UART, if03 Aux Data Port
+    (0x10C4, 0xEA70): (0, 1, "CP2105"),   # CP2105 (AOP EVM): if00 Enhanced, if01 Standard
+}
+# Description fallbacks when the OS does not report interface numbers
+_CLI_HINTS  = ("application/user", "enhanced", "user uart")
+_DATA_HINTS = ("auxiliary", "standard", "data port")
+
+_IFACE_RE = re.compile(r":(?:[\dx]+)\.(\d+)$")   # "1-1.4:1.0" (Linux), "1-2:x.3" (Windows)
+
+
+class EvmPorts:
+    __slots__ = ["identity", "cli", "data", "bridge", "source"]
+
+    def __init__(self, identity, cli, data, bridge, source):
+        self.identity = identity    # same key device_cache.device_identity() produces
+        self.cli      = cli
+        self.data     = data
+        self.bridge   = bridge
+        self.source   = source      # "cache" (verified before) | "usb" (interface numbers)
+
+    def __repr__(self):
+        return f"EvmPorts({self.bridge} CLI={self.cli} Data={self.data} via {self.source})"
+
+
+def _interface(p):
+    m = _IFACE_RE.search(p.location or "")
+    return int(m.group(1)) if m else None
+
+
+def _pick(group, cli_if, data_if):
+    """Return (cli, data) devices from one USB device's ports, or None."""
+    by_if = {_interface(p): p.device for p in group}
+    if cli_if in by_if and data_if in by_if:
+        return by_if[cli_if], by_if[data_if]
+    cli  = [p.device for p in group if any(h in (p.description or "").lower() for h in _CLI_HINTS)]
+    data = [p.device for p in group if any(h in (p.description or "").lower() for h in _DATA_HINTS)]
+    if len(cli) == 1 and len(data) == 1 and cli != data:
+        return cli[0], data[0]
+    return None
+
+
+def discover_evms(ports=None, cache=None):
+    """
+    Match serial ports against known EVM USB bridges.
+
+    The last verified CLI/data mapping in the device cache wins when both
+    of its ports are still present; otherwise the mapping comes from the USB
+    interface numbers (or descriptions). Nothing is opened or written.
+    """
+    if ports is None:
+        import serial.tools.list_ports
+        ports = list(serial.tools.list_ports.comports())
+    cache = cache if cache is not None else DeviceCache()
+    present = {p.device for p in ports}
+
+    groups = {}
+    for p in ports:
+        if p.vid is None or (p.vid, p.pid) not in KNOWN_EVM_BRIDGES:
+            continue
+        key = usb_identity(p) or f"{p.vid:04x}:{p.pid:04x}:"
+        groups.setdefault(key, []).append(p)
+
+    found = []
+    for group in groups.values():
+        first = group[0]
+        cli_if, data_if, bridge = KNOWN_EVM_BRIDGES[(first.vid, first.pid)]
+        pair = _pick(group, cli_if, data_if)
+        # Same key device_identity() gives the CLI port, so cache entries match
+        identity = usb_identity(first) or (f"port:{pair[0]}" if pair else None)
+        entry = (cache.get(identity) if identity else None) or {}
+        if entry.get("cli_port") in present and entry.get("data_port") in present:
+            found.append(EvmPorts(identity, entry["cli_port"], entry["data_port"], bridge, "cache"))
+            continue
+        if pair:
+            found.append(EvmPorts(identity, pair[0], pair[1], bridge, "usb"))
+    return found
@@ -0,0 +1,179 @@
+import struct
+import numpy as np
+
+# ══════════════════════════════════════════════════════════════════
+#  PROTOCOL CONSTANTS
+# ══════════════════════════════════════════════════════════════════
+MAGIC_WORD      = bytes([0x02, 0x01, 0x04, 0x03, 0x06, 0x05, 0x08, 0x07])
+HEADER_SIZE     = 40          # bytes
+CLI_BAUD        = 115200
+DATA_BAUD       = 921600
+# TI People Tracking SDK TLV IDs
+TLV_POINT_CLOUD      = 1   # Detected points (x,y,z,doppler) Cartesian
+TLV_POINT_CLOUD_SIDE = 4   # Side-info per point (snr, noise)
+TLV_TARGET_LIST      = 6   # Tracked targets — People Tracking SDK primary
+TLV_TARGET_IDX       = 7   # Point-to-target index array
+TLV_TARGET_LIST_ALT  = 12  # Alternate target list ID (OOB / SDK 3.x fallback)
+
+# ══════════════════════════════════════════════════════════════════
+#  TLV FRAME PARSER  —  TI People Tracking SDK
+# ══════════════════════════════════════════════════════════════════
+class RadarFrame:
+    __slots__ = ["frame_num", "points", "target_ids", "target_pos", "target_vel", "target_acc", "_targets", "cpu_cycles",
+                 "timestamp", "parse_ms", "platform", "tlv_types", "sensor_id", "zones",
+                 "heights", "events", "alerts"]
+    def __init__(self):
+        self.frame_num  = 0
+        self.points     = np.empty((0, 4), dtype=np.float32)   # x,y,z,doppler
+        self.target_ids = np.empty(0, dtype=np.uint32)
+        self.target_pos = np.empty((0, 3), dtype=np.float32)   # x,y,z per target
+        self.target_vel = np.empty((0, 3), dtype=np.float32)   # vx,vy,vz per target
+        self.target_acc = np.empty((0, 3), dtype=np.float32)   # ax,ay,az per target
+        self._targets   = None                                   # dict view, built on demand
+        self.cpu_cycles = None     # header timeCpuCycles (u32, wraps)
+        self.timestamp  = 0.0      # host time.time() when the frame was parsed
+        self.parse_ms   = 0.0      # host parse cost attributed to this frame
+        self.platform   = 0        # header platform field (e.g. 0xA6843)
+        self.tlv_types  = ()       # TLV type IDs present, in stream order
+        self.sensor_id  = None     # set by the reader that produced the frame
+        self.zones      = None     # ZoneResult, filled in by the reader thread
+        self.heights    = None     # float32 T, body height estimate per target
+        self.events     = ()       # debounced events emitted for this frame
+        self.alerts     = None     # (hazard tids, fallen tids) after debouncing
+
+    @property
+    def targets(self):
+        """List of {"id", "x", "y", "z"} dicts, built once from the arrays."""
+        if self._targets is None:
+            self._targets = [{"id": int(i), "x": float(p[0]), "y": float(p[1]), "z": float(p[2])}
+                             for i, p in zip(self.target_ids.tolist(), self.target_pos.tolist())]
+        return self._targets
+
+    @targets.setter
+    def targets(self, value):
+        self._targets = value
+
+class RadarParser:
+    """
+    Robust TLV parser for IWR6843AOP People Tracking SDK.
+
+    Point cloud  — TLV type 1:
+        Each point: x(f32), y(f32), z(f32), doppler(f32)  → 16 bytes
+
+    Target list  — TLV type 6  (primary, People Tracking SDK)
+                   TLV type 12 (fallback, OOB / SDK 3.x):
+        Each target: tid(u32), x(f32), y(f32), z(f32),
+                     vx(f32), vy(f32), vz(f32), ax(f32), ay(f32), az(f32),
+                     ec[16](f32), g(f32), confidenceLevel(f32)
+        → 4 + 9*4 + 16*4 + 4 + 4 = 112 bytes  (SDK 3.x)
+        OR simpler:  tid(u32) + x,y,z,vx,vy,vz,ax,ay,az (9×f32) = 40 bytes
+    Parser auto-detects stride from TLV length / num_targets.
+    """
+
+    def parse_buffer(self, buf: bytes):
+        frames = []
+        while True:
+            idx = buf.find(MAGIC_WORD)
+            if idx < 0:
+                # Keep last 7 bytes — a magic word might be split across reads
+                buf = buf[-7:] if len(buf) >= 7 else buf
+                break
+            if idx > 0:
+                buf = buf[idx:]
+            if len(buf) < HEADER_SIZE:
+                break
+            # total_len is at byte offset 12 in the header
+            if len(buf) < 16:
+                break
+            total_len = struct.unpack_from("<I", buf, 12)[0]
+            # Sanity-check: TI frames are typically 50–5000 bytes
+            if total_len < HEADER_SIZE or total_len > 65536:
+                # Bad sync — skip 1 byte and re-search
+                buf = buf[1:]
+                continue
+            if len(buf) < total_len:
+                break
+            frame = self._parse_frame(buf[:total_len])
+            if frame is not None:
+                frames.append(frame)
+            buf = buf[total_len:]
+        return frames, buf
+
+    def _parse_frame(self, data: bytes):
+        if data[:8] != MAGIC_WORD:
+            return None
+        f = RadarFrame()
+        off = 8
+        try:
+            _ver        = struct.unpack_from("<I", data, off)[0]; off += 4
+            _total_len  = struct.unpack_from("<I", data, off)[0]; off += 4
+            f.platform  = struct.unpack_from("<I", data, off)[0]; off += 4
+            f.frame_num = struct.unpack_from("<I", data, off)[0]; off += 4
+            f.cpu_cycles = struct.unpack_from("<I", data, off)[0]; off += 4
+            num_det     = struct.unpack_from("<I", data, off)[0]; off += 4
+            num_tlvs    = struct.unpack_from("<I", data, off)[0]; off += 4
+            _sub        = struct.unpack_from("<I", data, off)[0]; off += 4
+        except struct.error:
+            return None
+
+        types = []
+        for _ in range(num_tlvs):
+            if off + 8 > len(data):
+                break
+            tlv_type = struct.unpack_from("<I", data, off)[0]; off += 4
+            tlv_len  = struct.unpack_from("<I", data, off)[0]; off += 4
+            if off + tlv_len > len(data):
+                break
+            tlv_data = data[off : off + tlv_len]; off += tlv_len
+            types.append(tlv_type)
+
+            if tlv_type == TLV_POINT_CLOUD:
+                f.points = self._parse_points(tlv_data, num_det)
+            elif tlv_type in (TLV_TARGET_LIST, TLV_TARGET_LIST_ALT):
+                f.target_ids, f.target_pos, f.target_vel, f.target_acc = self._parse_targets(tlv_data)
+
+        f.tlv_types = tuple(types)
+        return f
+
+    def _parse_points(self, data: bytes, n: int):
+        """
+        Each point = x, y, z, doppler  (4 × float32 = 16 bytes).
+        n comes from the header numDetectedObj field.
+        """
+        stride = 16
+        if n == 0:
+            n = len(data) // stride
+        n = min(n, len(data) // stride)
+        # copy: frombuffer views are read-only and points get transformed in place
+        return np.frombuffer(data, dtype="<f4", count=n * 4).reshape(n, 4).astype(np.float32)
+
+    def _parse_targets(self, data: bytes):
+        """
+        Auto-detects per-target stride.
+        SDK lite  : 40 bytes  (tid + 9 floats)
+        SDK full  : 112 bytes (tid + 9 floats + 16 ec floats + g + conf)
+        Returns (ids uint32 N, positions, velocities, accelerations — float32 N×3).
+        """
+        if len(data) < 40:
+            return (np.empty(0, dtype=np.uint32), np.empty((0, 3), dtype=np.float32),
+                    np.empty((0, 3), dtype=np.float32), np.empty((0, 3), dtype=np.float32))
+
+        # Try to figure out stride: prefer 112 if it divides evenly, else 40
+        if len(data) % 112 == 0 and len(data) // 112 >= 1:
+            stride = 112
+        elif len(data) % 40 == 0 and len(data) // 40 >= 1:
+            stride = 40
+        else:
+            # Fall back: try both and use whichever gives a reasonable count
+            stride = 40
+
+        n = len(data) // stride
+        rows = np.frombuffer(data, dtype=np.uint8, count=n * stride).reshape(n, stride)
+        ids = rows[:, 0:4].copy().view("<u4").ravel()
+        pos = rows[:, 4:16].copy().view("<f4").reshape(n, 3).astype(np.float32)
+        vel = rows[:, 16:28].copy().view("<f4").reshape(n, 3).astype(np.float32)
+        acc = rows[:, 28:40].copy().view("<f4").reshape(n, 3).astype(np.float32)
+        # Sanity: skip obviously garbage tracks
+        x, y, z = pos[:, 0], pos[:, 1], pos[:, 2]
+        ok = (-20 < x) & (x < 20) & (0 < y) & (y < 20) & (-1 < z) & (z < 5)
+        return ids[ok].astype(np.uint32), pos[ok], vel[ok], acc[ok]
@@ -0,0 +1,285 @@
+import os
+import sys
+import json
+import time
+import queue
+import argparse
+import threading
+
+import serial
+
+from radar_protocol import RadarParser, CLI_BAUD, DATA_BAUD
+from frame_stats import FrameStats
+# Modules shared with the other apps (radar_common/) live at the repository root
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from radar_common.config_uploader import ConfigUploader
+from world_transform import SensorTransform
+
+# ══════════════════════════════════════════════════════════════════
+#  SENSOR MANAGER  —  N radars read concurrently, frames tagged by id
+# ══════════════════════════════════════════════════════════════════
+FRAME_QUEUE_SIZE = 256        # frames from all sensors waiting for the consumer
+READ_CHUNK       = 8192       # bytes per data-port read
+READ_TIMEOUT_S   = 0.05       # data-port read timeout (bounds stop latency)
+STALL_S          = 2.0        # no frame for this long → "stalled"
+RECONNECT_S      = 2.0        # back-off before reopening a failed sensor
+
+
+class SensorSpec:
+    __slots__ = ["sensor_id", "cli_port", "data_port", "cfg_path", "placement", "latency_s"]
+
+    def __init__(self, sensor_id, cli_port, data_port, cfg_path=None, placement=None,
+                 latency_s=None):
+        self.sensor_id = str(sensor_id)
+        self.cli_port  = cli_port
+        self.data_port = data_port
+        self.cfg_path  = cfg_path     # None → sensor is already configured, just listen
+        self.placement = placement or {}   # x, y, yaw in the shared room frame
+        self.latency_s = latency_s    # assumed frame → host delay (None = TrackPredictor default)
+
+    def transform(self):
+        cfg_text = ""
+        if self.cfg_path:
+            with open(self.cfg_path, "r") as f:
+                cfg_text = f.read()
+        return SensorTransform.from_cfg(cfg_text, **self.placement)
+
+
+def load_sensor_specs(path):
+    """
+    Read a sensors file: a JSON list of
+    {"id": "north", "cli": "COM5", "data": "COM6", "cfg": "AOP_6m_default.cfg",
+     "x": 0.0, "y": 0.0, "yaw": 0.0, "latency_ms": 60}.
+    Relative cfg paths are resolved against the sensors file; x/y/yaw place
+    the sensor in the room (height and tilt come from sensorPosition).
+    latency_ms (optional) is the assumed delay from measurement to the host
+    seeing the frame (chirp processing + UART), used to extrapolate tracks.
+    """
+    with open(path, "r") as f:
+        raw = json.load(f)
+    base = os.path.dirname(os.path.abspath(path))
+    specs = []
+    for i, s in enumerate(raw):
+        cfg = s.get("cfg")
+        if cfg and not os.path.isabs(cfg):
+            cfg = os.path.join(base, cfg)
+        placement = {k: float(s[k]) for k in ("x", "y", "yaw") if k in s}
+        latency = float(s["latency_ms"]) / 1000.0 if "latency_ms" in s else None
+        specs.append(SensorSpec(s.get("id", f"s{i}"), s.get("cli"), s["data"], cfg, placement,
+                                latency))
+    ids = [s.sensor_id for s in specs]
+    if len(set(ids)) != len(ids):
+        raise ValueError(f"duplicate sensor ids in {path}: {ids}")
+    return specs
+
+
+class SensorReader(threading.Thread):
+    """
+    One sensor: opens its ports, uploads its config, then reads and parses
+    the data UART. Every frame is moved into world coordinates, gets
+    sensor_id set and goes into the shared queue; when the consumer falls behind the oldest frame is dropped
+    (counted in `dropped`) so a slow consumer never blocks a reader.
+
+    Failed ports are retried every RECONNECT_S until the manager stops.
+    """
+
+    def __init__(self, spec, out_queue, stop_event):
+        super().__init__(name=f"sensor-{spec.sensor_id}", daemon=True)
+        self.spec      = spec
+        self.out       = out_queue
+        self._stop_evt = stop_event
+        self.parser    = RadarParser()
+        self.to_world  = spec.transform()
+        self.stats     = FrameStats()
+        self._lock     = threading.Lock()     # stats are read from other threads
+        self._ser_cli  = None
+        self._ser_data = None
+
+        self.state      = "idle"    # idle | configuring | streaming | stalled | error | stopped
+        self.last_error = ""
+        self.reconnects = 0
+        self.bytes_rx   = 0
+        self.dropped    = 0
+        self.last_frame_t = 0.0
+        self._rx_mark   = (time.time(), 0)
+
+    # ── thread body ───────────────────────────────────────────────
+    def run(self):
+        while not self._stop_evt.is_set():
+            try:
+                self._connect()
+                self._read_loop()
+            except (serial.SerialException, OSError) as e:
+                self.state, self.last_error = "error", str(e)
+            finally:
+                self._close()
+            if self._stop_evt.wait(RECONNECT_S):
+                break
+            self.reconnects += 1
+        self.state = "stopped"
+
+    def _connect(self):
+        self.state = "configuring"
+        if self.spec.cli_port:
+            self._ser_cli = serial.Serial(self.spec.cli_port, CLI_BAUD, timeout=1, write_timeout=2)
+        self._ser_data = serial.Serial(self.spec.data_port, DATA_BAUD, timeout=READ_TIMEOUT_S)
+        if self.spec.cfg_path and self._ser_cli is not None:
+            with open(self.spec.cfg_path, "r") as f:
+                cfg_text = f.read()
+            self._ser_cli.reset_input_buffer()
+            res = ConfigUploader(self._ser_cli, stop_event=self._stop_evt).upload(cfg_text)
+            if not res.ok and not res.aborted:
+                self.last_error = f"config: {len(res.errors)} error(s)"
+        self._ser_data.reset_input_buffer()
+        self.parser = RadarParser()
+
+    def _read_loop(self):
+        buf = b""
+        sid = self.spec.sensor_id
+        while not self._stop_evt.is_set():
+            c = self._ser_data.read(READ_CHUNK)
+            now = time.time()
+            if not c:
+                if self.last_frame_t and now - self.last_frame_t > STALL_S:
+                    self.state = "stalled"
+                continue
+            self.bytes_rx += len(c)
+            buf += c
+            t0 = time.perf_counter()
+            frames, buf = self.parser.parse_buffer(buf)
+            if not frames:
+                continue
+            parse_ms = (time.perf_counter() - t0) * 1000.0 / len(frames)
+            self.state, self.last_frame_t = "streaming", now
+            for fr in frames:
+                fr.sensor_id = sid
+                fr.timestamp = now
+                fr.parse_ms  = parse_ms
+                self.to_world.apply_frame(fr)
+                with self._lock:
+                    self.stats.update(fr, now)
+                self._emit(fr)
+
+    def _emit(self, fr):
+        try:
+            self.out.put_nowait(fr)
+        except queue.Full:
+            try:
+                self.out.get_nowait()
+                self.dropped += 1
+            except queue.Empty:
+                pass
+            try:
+                self.out.put_nowait(fr)
+            except queue.Full:
+                self.dropped += 1
+
+    def _close(self):
+        for s, is_cli in ((self._ser_cli, True), (self._ser_data, False)):
+            try:
+                if s and s.is_open:
+                    if is_cli and self._stop_evt.is_set():
+                        s.write(b"sensorStop\n"); s.flush()
+                    s.close()
+            except Exception:
+                pass
+        self._ser_cli = self._ser_data = None
+
+    # ── health ────────────────────────────────────────────────────
+    def health(self, now=None):
+        now = time.time() if now is None else now
+        t_prev, b_prev = self._rx_mark
+        kbps = (self.bytes_rx - b_prev) / max(now - t_prev, 1e-3) / 1000.0
+        self._rx_mark = (now, self.bytes_rx)
+        with self._lock:
+            st = self.stats
+            return {
+                "id": self.spec.sensor_id, "state": self.state,
+                "fps": st.fps(now), "frames": st.frames, "lost": st.lost,
+                "dropped": self.dropped, "rx_kBps": kbps,
+                "parse_ms": st.parse_ms, "reconnects": self.reconnects,
+                "age_s": now - self.last_frame_t if self.last_frame_t else None,
+                "error": self.last_error,
+            }
+
+
+class SensorManager:
+    """
+    Runs N sensors concurrently, one SensorReader thread per sensor.
+
+    Threads rather than one selectors loop: pyserial COM ports on Windows
+    cannot be registered with selectors, and a blocking read() releases the
+    GIL, so idle readers cost nothing and each sensor only adds its own parse
+    time. All frames arrive on one queue (`frames`) tagged with sensor_id.
+    """
+
+    def __init__(self, specs, queue_size=FRAME_QUEUE_SIZE):
+        self.specs     = list(specs)
+        self.frames    = queue.Queue(maxsize=queue_size)
+        self._stop_evt = threading.Event()
+        self.readers   = {}
+
+    def start(self):
+        self._stop_evt.clear()
+        for spec in self.specs:
+            r = SensorReader(spec, self.frames, self._stop_evt)
+            self.readers[spec.sensor_id] = r
+            r.start()
+
+    def stop(self, timeout=3.0):
+        self._stop_evt.set()
+        for r in self.readers.values():
+            r.join(timeout)
+
+    def get(self, timeout=None):
+        """Next frame from any sensor, or None on timeout."""
+        try:
+            return self.frames.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def health(self):
+        now = time.time()
+        return [r.health(now) for r in self.readers.values()]
+
+
+def format_health(rows):
+    lines = [f"{'sensor':<10} {'state':<11} {'fps':>5} {'frames':>7} {'lost':>5} "
+             f"{'drop':>5} {'kB/s':>6} {'ms/fr':>6} {'reconn':>6}"]
+    for h in rows:
+        lines.append(f"{h['id']:<10} {h['state']:<11} {h['fps']:5.1f} {h['frames']:7d} "
+                     f"{h['lost']:5d} {h['dropped']:5d} {h['rx_kBps']:6.1f} "
+                     f"{h['parse_ms']:6.2f} {h['reconnects']:6d}"
+                     + (f"  ! {h['error']}" if h['error'] else ""))
+    return "\n".join(lines)
+
+
+# ══════════════════════════════════════════════════════════════════
+#  HEADLESS ENTRY  —  python sensor_manager.py sensors.json
+# ══════════════════════════════════════════════════════════════════
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Run several radars concurrently and print health.")
+    ap.add_argument("sensors", help="JSON sensors file (see sensors.example.json)")
+    ap.add_argument("--interval", type=float, default=5.0, help="seconds between health reports")
+    ap.add_argument("--duration", type=float, default=0.0, help="stop after this many seconds (0 = run until Ctrl+C)")
+    args = ap.parse_args(argv)
+
+    mgr = SensorManager(load_sensor_specs(args.sensors))
+    mgr.start()
+    t_end = time.time() + args.duration if args.duration > 0 else None
+    t_report = time.time() + args.interval
+    try:
+        while t_end is None or time.time() < t_end:
+            mgr.get(timeout=0.2)          # a real consumer would use the frame here
+            if time.time() >= t_report:
+                print(format_health(mgr.health()), flush=True)
+                t_report += args.interval
+    except KeyboardInterrupt:
+        pass
+    finally:
+        mgr.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,115 @@
+import os
+import sys
+
+import numpy as np
+
+# Run from IMS (python -m pytest tests) or from anywhere else
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from events import (EventEngine, EventDispatcher, ENTER_MIN_S, EXIT_MIN_S,
+                    FALL_MIN_S, RECOVER_MIN_S, POINTS_TRACK)
+
+DT = 0.05
+POS = np.array([[1.0, 2.0, 1.0]], dtype=np.float32)
+
+
+def feed(engine, t0, seconds, inside, tid=7):
+    """One frame every DT for `seconds`; returns (events, time after the last frame)."""
+    out, t = [], t0
+    for _ in range(int(round(seconds / DT))):
+        out += engine.update(t, [tid], POS, np.array([[inside]]))
+        t += DT
+    return out, t
+
+
+def test_enter_only_after_dwell():
+    eng = EventEngine(["press"])
+    ev, t = feed(eng, 0.0, ENTER_MIN_S - DT, True)
+    assert ev == [] and not eng.hazard
+    ev, t = feed(eng, t, 2 * DT, True)
+    assert [e["type"] for e in ev] == ["enter"]
+    assert ev[0]["zone"] == "press" and ev[0]["track"] == 7 and ev[0]["x"] == 1.0
+    assert eng.hazard == {(7, "press")}
+
+
+def test_short_blip_inside_is_ignored():
+    eng = EventEngine(["press"])
+    ev, t = feed(eng, 0.0, ENTER_MIN_S / 2, True)
+    ev2, _ = feed(eng, t, 2.0, False)
+    assert ev + ev2 == []
+
+
+def test_exit_hysteresis():
+    eng = EventEngine(["press"])
+    _, t = feed(eng, 0.0, 1.0, True)
+    # a dip outside shorter than EXIT_MIN_S does not exit
+    ev, t = feed(eng, t, EXIT_MIN_S / 2, False)
+    assert ev == []
+    ev, t = feed(eng, t, 0.5, True)
+    assert ev == [] and eng.hazard
+    ev, t = feed(eng, t, EXIT_MIN_S + 2 * DT, False)
+    assert [e["type"] for e in ev] == ["exit"]
+    assert not eng.hazard
+
+
+def test_lost_track_exits_at_once():
+    eng = EventEngine(["press"])
+    _, t = feed(eng, 0.0, 1.0, True)
+    ev = eng.update(t, [], np.zeros((0, 3)), np.zeros((0, 1), dtype=bool))
+    assert [(e["type"], e["reason"]) for e in ev] == [("exit", "lost")]
+
+
+def test_fall_and_recover_debounce():
+    eng = EventEngine([])
+    t, types = 0.0, []
+    for flag, secs in ((True, FALL_MIN_S + 2 * DT), (False, RECOVER_MIN_S / 2),
+                       (True, 0.2), (False, RECOVER_MIN_S + 2 * DT)):
+        for _ in range(int(round(secs / DT))):
+            types += [e["type"] for e in eng.update(t, [3], POS, None, falls=[flag])]
+            t += DT
+    assert types == ["fall", "recovered"]
+    assert not eng.fallen
+
+
+def test_point_intrusion_uses_points_track():
+    eng = EventEngine(["press"])
+    t, ev = 0.0, []
+    for _ in range(10):
+        ev += eng.update(t, [], np.zeros((0, 3)), None, point_intrusion=np.array([True]))
+        t += DT
+    assert [(e["type"], e["track"]) for e in ev] == [("enter", POINTS_TRACK)]
+
+
+def test_set_zones_closes_open_zones():
+    eng = EventEngine(["press"])
+    feed(eng, 0.0, 1.0, True)
+    assert eng.set_zones(["press"]) == []
+    ev = eng.set_zones(["press", "robot"])
+    assert [(e["type"], e["reason"]) for e in ev] == [("exit", "reconfigured")]
+    assert not eng.hazard
+
+
+class ListSink:
+    def __init__(self):
+        self.got = []
+
+    def send(self, ev):
+        self.got.append(ev)
+
+    def close(self):
+        pass
+
+
+class BrokenSink(ListSink):
+    def send(self, ev):
+        raise OSError("unreachable")
+
+
+def test_dispatcher_delivers_to_every_sink_and_survives_errors():
+    good, bad = ListSink(), BrokenSink()
+    disp = EventDispatcher([good, bad])
+    eng = EventEngine(["press"], disp)
+    feed(eng, 0.0, 1.0, True)
+    disp.close()
+    assert [e["type"] for e in good.got] == ["enter"]
+    assert disp.errors == 1 and "unreachable" in disp.last_error
@@ -0,0 +1,86 @@
+import os
+import sys
+
+import numpy as np
+
+# Run from IMS (python -m pytest tests) or from anywhere else
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fall_detector import FallDetector, MIN_POINTS, DWELL_S
+
+FPS = 20.0
+STAND = 1.1                   # m, mean point height of a standing person
+
+
+def profile(*segments):
+    """Height per frame from (seconds, end height) segments, linear from the previous end."""
+    h = [STAND]
+    for secs, end in segments:
+        n = int(round(secs * FPS))
+        h += list(np.linspace(h[-1], end, n + 1)[1:]) if n else [end]
+    return np.array(h)
+
+
+def run(heights, counts=8, tid=1, vz=None):
+    """Feeds one track; returns (fall flag per frame, detector)."""
+    det = FallDetector()
+    vz = np.gradient(heights) * FPS if vz is None else np.broadcast_to(vz, heights.shape)
+    counts = np.broadcast_to(counts, heights.shape)
+    flags = [bool(det.update(i / FPS, [tid], [heights[i]], [vz[i]], [counts[i]])[0])
+             for i in range(len(heights))]
+    return np.array(flags), det
+
+
+def test_fall_detected_after_dwell():
+    h = profile((2.0, STAND), (0.4, 0.25), (2.0, 0.25))
+    flags, _ = run(h)
+    # not while still falling; latched within a dwell window of landing
+    assert not flags[:int(2.2 * FPS)].any()
+    assert flags[int((2.4 + DWELL_S) * FPS):].all()
+
+
+def test_fast_drop_detected_without_tracker_vz():
+    h = profile((2.0, STAND), (0.4, 0.25), (2.0, 0.25))
+    flags, _ = run(h, vz=0.0)                  # height history alone
+    assert flags[-1]
+
+
+def test_sitting_down_is_not_a_fall():
+    h = profile((2.0, STAND), (0.6, 0.65), (3.0, 0.65))
+    flags, _ = run(h)
+    assert not flags.any()
+
+
+def test_lying_down_slowly_is_not_a_fall():
+    h = profile((2.0, STAND), (4.0, 0.25), (3.0, 0.25))
+    flags, _ = run(h)
+    assert not flags.any()
+
+
+def test_sparse_frames_cannot_trigger():
+    h = profile((2.0, STAND), (0.4, 0.25), (2.0, 0.25))
+    counts = np.full(len(h), MIN_POINTS - 1)
+    counts[:int(2.0 * FPS)] = 8                 # only the standing part is usable
+    flags, _ = run(h, counts)
+    assert not flags.any()
+
+
+def test_fall_latches_until_getting_up():
+    h = profile((2.0, STAND), (0.4, 0.25), (2.0, 0.25), (0.1, 0.4), (0.5, 0.4))
+    flags, _ = run(h)
+    assert flags[-1]                            # moving on the floor keeps the fall
+    h = np.concatenate([h, profile((1.0, STAND), (2.0, STAND))[1:]])
+    flags, _ = run(h)
+    assert flags.any() and not flags[-1]
+
+
+def test_tracks_are_independent_and_slots_grow():
+    det = FallDetector(slots=2)
+    tids = list(range(5))
+    h = profile((2.0, STAND), (0.4, 0.25), (2.0, 0.25))
+    for i in range(len(h)):
+        heights = [h[i] if tid == 3 else STAND for tid in tids]
+        vz = [0.0] * len(tids)
+        flags = det.update(i / FPS, tids, heights, vz, [8] * len(tids))
+    assert flags.tolist() == [False, False, False, True, False]
+    assert len(det.t) >= 5
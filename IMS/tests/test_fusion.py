@@ -0,0 +1,79 @@
+import os
+import sys
+
+import numpy as np
+
+# Run from IMS (python -m pytest tests) or from anywhere else
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from radar_protocol import RadarFrame
+from fusion import FrameFuser, FUSED_ID_STRIDE
+
+
+def frame(sensor_id, t, points=(), targets=()):
+    """targets: (tid, x, y, z) rows."""
+    fr = RadarFrame()
+    fr.sensor_id = sensor_id
+    fr.timestamp = t
+    fr.platform = 0xA6843
+    fr.tlv_types = (1, 6)
+    fr.points = np.array(points, dtype=np.float32).reshape(-1, 4)
+    tg = np.array(targets, dtype=np.float32).reshape(-1, 4)
+    fr.target_ids = tg[:, 0].astype(np.uint32)
+    fr.target_pos = tg[:, 1:4].copy()
+    fr.target_vel = np.zeros((len(tg), 3), dtype=np.float32)
+    fr.target_acc = np.zeros((len(tg), 3), dtype=np.float32)
+    return fr
+
+
+def test_group_emitted_when_every_sensor_delivered():
+    fuser = FrameFuser(["a", "b"])
+    assert fuser.push(frame("a", 10.00, [[0, 1, 1, 0]]), now=10.00) == []
+    out = fuser.push(frame("b", 10.01, [[1, 1, 1, 0], [2, 2, 1, 0]]), now=10.01)
+    assert len(out) == 1
+    f = out[0]
+    assert f.sensor_id == "fused" and f.timestamp == 10.01
+    np.testing.assert_array_equal(f.points[:, 0], [0, 1, 2])
+    assert fuser.partial == 0
+
+
+def test_same_person_seen_by_two_sensors_is_merged():
+    fuser = FrameFuser(["a", "b"])
+    fuser.push(frame("a", 0.0, targets=[[3, 1.0, 2.0, 1.0], [4, -2.0, 4.0, 1.0]]), now=0.0)
+    f = fuser.push(frame("b", 0.01, targets=[[7, 1.2, 2.1, 1.2]]), now=0.01)[0]
+    assert sorted(f.target_ids.tolist()) == [3, 4]          # b's duplicate of 3 folded in
+    i = f.target_ids.tolist().index(3)
+    np.testing.assert_allclose(f.target_pos[i], [1.1, 2.05, 1.1], atol=1e-6)
+    assert fuser.merged == 1
+
+
+def test_close_targets_of_one_sensor_are_not_merged():
+    fuser = FrameFuser(["a", "b"])
+    fuser.push(frame("a", 0.0, targets=[[1, 1.0, 2.0, 1.0], [2, 1.1, 2.0, 1.0]]), now=0.0)
+    f = fuser.push(frame("b", 0.01, targets=[[1, 5.0, 5.0, 1.0]]), now=0.01)[0]
+    assert sorted(f.target_ids.tolist()) == [1, 2, FUSED_ID_STRIDE + 1]
+    assert fuser.merged == 0
+
+
+def test_missing_sensor_flushed_by_poll_after_window():
+    fuser = FrameFuser(["a", "b"], window=0.03)
+    fuser.push(frame("a", 1.0, [[0, 1, 1, 0]]), now=1.0)
+    assert fuser.poll(now=1.02) is None
+    f = fuser.poll(now=1.04)
+    assert f is not None and len(f.points) == 1
+    assert fuser.partial == 1
+
+
+def test_next_frame_from_same_sensor_closes_the_group():
+    fuser = FrameFuser(["a", "b"])
+    fuser.push(frame("a", 1.0, [[0, 1, 1, 0]]), now=1.0)
+    out = fuser.push(frame("a", 1.01, [[5, 5, 1, 0]]), now=1.01)
+    assert len(out) == 1 and out[0].points[0, 0] == 0
+
+
+def test_points_beyond_capacity_are_truncated():
+    fuser = FrameFuser(["a", "b"], max_points=3)
+    fuser.push(frame("a", 0.0, [[i, 0, 0, 0] for i in range(2)]), now=0.0)
+    f = fuser.push(frame("b", 0.0, [[i, 0, 0, 0] for i in range(2, 4)]), now=0.0)[0]
+    np.testing.assert_array_equal(f.points[:, 0], [0, 1, 2])
+    assert fuser.truncated == 1
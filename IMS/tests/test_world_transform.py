@@ -0,0 +1,69 @@
+import os
+import sys
+
+import numpy as np
+
+# Run from IMS (python -m pytest tests) or from anywhere else
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from radar_protocol import RadarFrame
+from world_transform import SensorTransform
+
+
+def pts(*rows):
+    return np.array(rows, dtype=np.float32)
+
+
+def test_identity_leaves_points_alone():
+    tf = SensorTransform()
+    a = pts([1, 2, 3, 0.5])
+    assert tf.identity
+    np.testing.assert_array_equal(tf.apply(a.copy()), a)
+
+
+def test_height_and_down_tilt():
+    # Sensor 2 m up looking straight down: 1 m along the boresight is 1 m above the floor
+    tf = SensorTransform(height=2.0, elev_tilt=90.0)
+    a = tf.apply(pts([0, 1, 0, 0.7]))
+    np.testing.assert_allclose(a[0, :3], [0, 0, 1], atol=1e-6)
+    assert a[0, 3] == np.float32(0.7)       # doppler column untouched
+
+
+def test_azimuth_tilt_turns_boresight_towards_plus_x():
+    a = SensorTransform(az_tilt=90.0).apply(pts([0, 2, 0]))
+    np.testing.assert_allclose(a[0], [2, 0, 0], atol=1e-6)
+
+
+def test_apply_is_in_place_and_inverse_round_trips():
+    tf = SensorTransform(height=1.8, az_tilt=20.0, elev_tilt=15.0, x=1.0, y=-2.0, yaw=30.0)
+    rng = np.random.default_rng(0)
+    sensor = rng.uniform(-3, 3, (50, 4)).astype(np.float32)
+    world = sensor.copy()
+    assert tf.apply(world) is world
+    np.testing.assert_allclose(tf.inverse(world), sensor[:, :3], atol=1e-5)
+    # rotation keeps distances to the sensor
+    np.testing.assert_allclose(np.linalg.norm(world[:, :3] - tf.t, axis=1),
+                               np.linalg.norm(sensor[:, :3], axis=1), rtol=1e-5)
+
+
+def test_from_cfg_reads_sensor_position():
+    cfg = "% comment\nsensorStop\nsensorPosition 2.1 10 25\nsensorStart\n"
+    tf = SensorTransform.from_cfg(cfg, x=3.0)
+    assert (tf.height, tf.az_tilt, tf.elev_tilt, tf.x) == (2.1, 10.0, 25.0, 3.0)
+    assert SensorTransform.from_cfg("sensorStart\n").identity
+
+
+def test_apply_frame_places_world_targets_but_transforms_points():
+    tf = SensorTransform(height=2.0, x=5.0, yaw=90.0)
+    fr = RadarFrame()
+    fr.points = pts([0, 1, 0, 0])
+    fr.target_ids = np.array([1], dtype=np.uint32)
+    fr.target_pos = pts([0, 1, 1.2])
+    fr.target_vel = pts([0, 1, 0])
+    fr.target_acc = pts([0, 0, 0])
+    tf.apply_frame(fr)
+    np.testing.assert_allclose(fr.points[0, :3], [6, 0, 2], atol=1e-6)
+    # targets are already in the tracker's world frame: placement only, no height
+    np.testing.assert_allclose(fr.target_pos[0], [6, 0, 1.2], atol=1e-6)
+    np.testing.assert_allclose(fr.target_vel[0], [1, 0, 0], atol=1e-6)
+    assert fr.targets[0]["x"] == fr.target_pos[0, 0]
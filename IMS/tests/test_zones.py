@@ -0,0 +1,105 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# Run from IMS (python -m pytest tests) or from anywhere else
+IMS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, IMS_DIR)
+
+from zones import Zone, ZoneSet, load_zones, ZONE_MIN_POINTS
+
+SQUARE = [(0, 0), (2, 0), (2, 2), (0, 2)]
+L_SHAPE = [(0, 0), (3, 0), (3, 1), (1, 1), (1, 3), (0, 3)]
+DIAMOND = [(0, -1), (1, 0), (0, 1), (-1, 0)]
+
+
+def ray_cast(poly, x, y):
+    """Reference even-odd test, one point and one polygon at a time."""
+    inside = False
+    for (x0, y0), (x1, y1) in zip(poly, poly[1:] + poly[:1]):
+        if (y0 > y) != (y1 > y) and x < (x1 - x0) * (y - y0) / (y1 - y0) + x0:
+            inside = not inside
+    return inside
+
+
+def at(*xy, z=1.0):
+    return np.array([(x, y, z) for x, y in xy], dtype=np.float32)
+
+
+def test_convex_and_concave_polygons():
+    zs = ZoneSet([Zone("sq", SQUARE), Zone("L", L_SHAPE)])
+    m = zs.contains(at((1, 1), (3, 3), (0.5, 2.5), (2, 2.5), (2.5, 0.5)))
+    assert m.tolist() == [[True, False],      # square only (L notch)
+                          [False, False],
+                          [False, True],
+                          [False, False],     # inside the L's bounding box, in the notch
+                          [False, True]]
+
+
+def test_boundary_is_half_open():
+    m = ZoneSet([Zone("sq", SQUARE)]).contains(at((0, 1), (2, 1), (1, 0), (1, 2)))
+    # crossing number: left/bottom edges inside, right/top edges outside
+    assert m[:, 0].tolist() == [True, False, True, False]
+
+
+def test_ray_through_vertex_counts_once():
+    m = ZoneSet([Zone("d", DIAMOND)]).contains(at((-0.5, 0), (0.5, 0), (-1.5, 0), (1.5, 0)))
+    assert m[:, 0].tolist() == [True, True, False, False]
+
+
+def test_height_band():
+    zs = ZoneSet([Zone("sq", SQUARE, 0.5, 2.0)])
+    m = zs.contains(np.array([(1, 1, 0.2), (1, 1, 0.5), (1, 1, 1.9), (1, 1, 2.5)], dtype=np.float32))
+    assert m[:, 0].tolist() == [False, True, True, False]
+
+
+def test_mixed_vertex_counts_match_reference():
+    polys = [SQUARE, L_SHAPE, DIAMOND, [(-2, 2), (-1, 4), (-3, 3.5)]]
+    zs = ZoneSet([Zone(str(i), p) for i, p in enumerate(polys)])
+    rng = np.random.default_rng(3)
+    xy = rng.uniform(-4, 4, (2000, 2))
+    m = zs.contains(np.hstack([xy, np.ones((len(xy), 1))]).astype(np.float32))
+    xy32 = xy.astype(np.float32).astype(float)
+    ref = [[ray_cast(p, x, y) for p in polys] for x, y in xy32]
+    assert m.tolist() == ref
+
+
+def test_empty_inputs():
+    assert ZoneSet([]).contains(at((1, 1))).shape == (1, 0)
+    assert ZoneSet([Zone("sq", SQUARE)]).contains(np.zeros((0, 3))).shape == (0, 1)
+
+
+def test_evaluate_ignores_static_points():
+    zs = ZoneSet([Zone("sq", SQUARE)])
+    static = np.array([(1, 1, 1, 0.0)] * (ZONE_MIN_POINTS + 5), dtype=np.float32)
+    moving = np.array([(1, 1, 1, -0.4)] * ZONE_MIN_POINTS, dtype=np.float32)
+    r = zs.evaluate(static, np.zeros((0, 3)))
+    assert r.point_counts.tolist() == [0] and not r.intrusion[0]
+    r = zs.evaluate(np.vstack([static, moving[:-1]]), np.zeros((0, 3)))
+    assert not r.intrusion[0]
+    r = zs.evaluate(np.vstack([static, moving]), np.zeros((0, 3)))
+    assert r.point_counts.tolist() == [ZONE_MIN_POINTS] and r.intrusion[0]
+
+
+def test_evaluate_target_alone_is_an_intrusion():
+    zs = ZoneSet([Zone("sq", SQUARE), Zone("L", L_SHAPE)])
+    r = zs.evaluate(np.zeros((0, 4)), at((2.5, 0.5), (5, 5)))
+    assert r.target_mask.tolist() == [[False, True], [False, False]]
+    assert r.target_counts.tolist() == [0, 1]
+    assert r.intrusion.tolist() == [False, True]
+
+
+def test_load_example_zones_and_box():
+    zones = load_zones(os.path.join(IMS_DIR, "zones.example.json"))
+    assert [z.name for z in zones] == ["PRESS-1", "ROBOT"]
+    assert len(zones[1].polygon) == 5 and zones[1].z1 == 2.8
+
+    class Box:
+        x0, x1, y0, y1, z0, z1 = -1, 1, 2, 4, 0, 2
+    box = Zone.from_box("box", Box)
+    assert ZoneSet([box]).contains(at((0, 3)))[0, 0]
+
+    with pytest.raises(ValueError):
+        Zone("line", [(0, 0), (1, 1)])
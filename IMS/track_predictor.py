@@ -0,0 +1,83 @@
+import numpy as np
+
+# ══════════════════════════════════════════════════════════════════
+#  TRACK PREDICTOR  —  draw tracks where people are now, not where they were
+# ══════════════════════════════════════════════════════════════════
+SENSOR_LATENCY_S = 0.06       # assumed, not measured: chirp processing + UART transfer before the host
+                              # sees a frame (per sensor: "latency_ms" in sensors.json)
+MAX_EXTRAP_S     = 0.25       # never predict further than this past the measurement
+BLEND_S          = 0.055      # ease from the old to the new trajectory over ~one frame
+LATENCY_ALPHA    = 0.1        # EWMA weight of the measured pipeline latency
+
+
+class TrackPredictor:
+    """
+    Constant-acceleration extrapolation of the latest target list.
+
+    update() stores each track's state with the time it was measured: the
+    host parse timestamp minus the parse cost (measured) and sensor_latency.
+    The sensor-side part cannot be observed from the host — timeCpuCycles
+    runs on an unsynchronised clock — so it is a setting: SENSOR_LATENCY_S,
+    or the "latency_ms" of the sensors in sensors.json.
+    predict(t) moves every track to t with p + v·dt + ½·a·dt² (dt capped at
+    MAX_EXTRAP_S, so a stalled stream freezes instead of drifting off).
+
+    A new frame rarely lands exactly where the old prediction was. Instead
+    of jumping, the difference is kept as an offset that decays linearly to
+    zero over BLEND_S — the drawn track interpolates from the old trajectory
+    onto the new one.
+    """
+
+    def __init__(self, sensor_latency=SENSOR_LATENCY_S, max_extrap=MAX_EXTRAP_S, blend=BLEND_S):
+        self.sensor_latency = sensor_latency
+        self.max_extrap = max_extrap
+        self.blend = blend
+        self.ids = np.empty(0, dtype=np.uint32)
+        self._pos = np.empty((0, 3), dtype=np.float32)
+        self._vel = np.empty((0, 3), dtype=np.float32)
+        self._acc = np.empty((0, 3), dtype=np.float32)
+        self._off = np.empty((0, 3), dtype=np.float32)
+        self._t_meas = 0.0
+        self._t_recv = 0.0
+        self.latency_ms = 0.0        # EWMA of measurement → hand-off to the UI
+        self.frames = 0
+
+    def update(self, fr, now):
+        """Take the targets of one (world-frame) RadarFrame received at host time now."""
+        t_meas = fr.timestamp - fr.parse_ms / 1000.0 - self.sensor_latency
+        old_ids, old_pos = self.ids, self.predict(now)
+
+        self.ids = fr.target_ids.copy()
+        self._pos = fr.target_pos.astype(np.float32)
+        self._vel = fr.target_vel.astype(np.float32)
+        self._acc = fr.target_acc.astype(np.float32) if len(fr.target_acc) == len(self.ids) \
+            else np.zeros_like(self._pos)
+        self._t_meas, self._t_recv = t_meas, now
+
+        self._off = np.zeros_like(self._pos)
+        if len(old_ids) and len(self.ids):
+            new_pos = self._extrapolate(now)
+            order = np.argsort(old_ids)
+            k = np.searchsorted(old_ids, self.ids, sorter=order).clip(0, len(old_ids) - 1)
+            j = order[k]
+            hit = old_ids[j] == self.ids
+            self._off[hit] = old_pos[j[hit]] - new_pos[hit]
+
+        lat = (now - t_meas) * 1000.0
+        self.latency_ms = lat if self.frames == 0 else \
+            self.latency_ms + LATENCY_ALPHA * (lat - self.latency_ms)
+        self.frames += 1
+
+    def _extrapolate(self, t):
+        dt = min(max(t - self._t_meas, 0.0), self.max_extrap)
+        return self._pos + self._vel * dt + self._acc * (0.5 * dt * dt)
+
+    def predict(self, t):
+        """float32 T×3 positions of self.ids at host time t."""
+        if len(self.ids) == 0:
+            return self._pos
+        p = self._extrapolate(t)
+        w = 1.0 - min(max((t - self._t_recv) / self.blend, 0.0), 1.0) if self.blend > 0 else 0.0
+        if w > 0.0:
+            p += self._off * w
+        return p
@@ -0,0 +1,208 @@
+import time
+import numpy as np
+
+import matplotlib
+matplotlib.use("Qt5Agg")
+from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.figure import Figure
+from mpl_toolkits.mplot3d.art3d import Poly3DCollection
+
+from radar_common.point_history import PointHistory, TRAIL_FRAMES
+from occupancy import OccupancyGrid
+
+# ══════════════════════════════════════════════════════════════════
+#  MATPLOTLIB 3-D CANVAS
+# ══════════════════════════════════════════════════════════════════
+class Radar3DCanvas(FigureCanvas):
+    """Embedded 3-D scatter view with room box + hazard zone."""
+
+    def __init__(self, zone, parent=None, trail_frames=TRAIL_FRAMES):
+        self.fig = Figure(facecolor="#0b0e0b", tight_layout=True)
+        super().__init__(self.fig)
+        self.setParent(parent)
+        self.zone = zone
+        self.trail = PointHistory(trail_frames)   # persistence: last K frames
+        # RGBA per merged trail point (R = B = 0); rows rewritten in place each frame
+        self._pt_colors = np.zeros((self.trail.frames * self.trail.max_points, 4), dtype=np.float32)
+
+        self.ax = self.fig.add_subplot(111, projection="3d")
+        self._style_axes()
+
+        self._pt_scat  = self.ax.scatter([], [], [], s=8, depthshade=False)
+        self._tk_scat  = None
+        self.draw_ms   = 0.0       # EWMA of a full canvas draw; predictions lead by this much
+        self._hz_mesh  = None
+        self._room_lines = []
+        self._draw_room()
+        self._draw_hazard_zone()
+
+        self.setMinimumHeight(440)
+
+    # ── axes style ────────────────────────────────────────────────
+    def _style_axes(self):
+        ax = self.ax
+        ax.set_facecolor("#0b0e0b")
+        ax.tick_params(colors="#1f6b10", labelsize=7)
+        for pane in [ax.xaxis.pane, ax.yaxis.pane, ax.zaxis.pane]:
+            pane.fill = False
+            pane.set_edgecolor("#14201a")
+        for spine in ax.spines.values():
+            spine.set_edgecolor("#14201a")
+        ax.xaxis.label.set_color("#39ff14")
+        ax.yaxis.label.set_color("#39ff14")
+        ax.zaxis.label.set_color("#39ff14")
+        ax.set_xlabel("X (m)", fontsize=8, labelpad=4)
+        ax.set_ylabel("Y (m)", fontsize=8, labelpad=4)
+        ax.set_zlabel("Z (m)", fontsize=8, labelpad=4)
+        ax.set_xlim(-4, 4)
+        ax.set_ylim(0, 6)
+        ax.set_zlim(0, 3)
+        ax.set_title("RADAR FIELD  —  IWR6843AOP EVM  (6 m range)",
+                     color="#39ff14", fontsize=9, pad=8,
+                     fontfamily="monospace")
+
+    # ── room wireframe ────────────────────────────────────────────
+    def _draw_room(self):
+        for l in self._room_lines:
+            l.remove()
+        self._room_lines = []
+        rx = (-4, 4); ry = (0, 6); rz = (0, 3)
+        def edge(p1, p2):
+            xs = [p1[0], p2[0]]; ys = [p1[1], p2[1]]; zs = [p1[2], p2[2]]
+            ln, = self.ax.plot(xs, ys, zs, color="#14451a", lw=0.8, alpha=0.6)
+            self._room_lines.append(ln)
+
+        corners = [
+            (rx[0],ry[0],rz[0]), (rx[1],ry[0],rz[0]),
+            (rx[1],ry[1],rz[0]), (rx[0],ry[1],rz[0]),
+            (rx[0],ry[0],rz[1]), (rx[1],ry[0],rz[1]),
+            (rx[1],ry[1],rz[1]), (rx[0],ry[1],rz[1]),
+        ]
+        edges_idx = [(0,1),(1,2),(2,3),(3,0),(4,5),(5,6),(6,7),(7,4),
+                     (0,4),(1,5),(2,6),(3,7)]
+        for a, b in edges_idx:
+            edge(corners[a], corners[b])
+
+    # ── hazard zone ───────────────────────────────────────────────
+    def _draw_hazard_zone(self):
+        if self._hz_mesh:
+            try:
+                self._hz_mesh.remove()
+            except Exception:
+                pass
+        c = self.zone.corners()
+        faces = [
+            [c[0],c[1],c[2],c[3]],   # bottom
+            [c[4],c[5],c[6],c[7]],   # top
+            [c[0],c[1],c[5],c[4]],   # front
+            [c[2],c[3],c[7],c[6]],   # back
+            [c[0],c[3],c[7],c[4]],   # left
+            [c[1],c[2],c[6],c[5]],   # right
+        ]
+        poly = Poly3DCollection(faces, alpha=0.08,
+                                facecolor="#ff2020", edgecolor="#ff4040",
+                                linewidth=1.2, linestyle="--")
+        self._hz_mesh = self.ax.add_collection3d(poly)
+
+        # label
+        cx = (self.zone.x0 + self.zone.x1) / 2
+        cy = (self.zone.y0 + self.zone.y1) / 2
+        cz = self.zone.z1 + 0.15
+        self.ax.text(cx, cy, cz, "⚠ HAZARD", color="#ff4040",
+                     fontsize=7, fontfamily="monospace", ha="center")
+
+    # ── polygon zones (zones.json) — outlines only ───────────────
+    def draw_zones(self, zones):
+        for z in zones:
+            poly = np.vstack([z.polygon, z.polygon[:1]])
+            for h in (z.z0, z.z1):
+                self.ax.plot(poly[:, 0], poly[:, 1], np.full(len(poly), h),
+                             color="#ff8040", lw=0.9, alpha=0.7, linestyle="--")
+            for vx, vy in z.polygon:
+                self.ax.plot([vx, vx], [vy, vy], [z.z0, z.z1], color="#ff8040", lw=0.6, alpha=0.5)
+            cx, cy = z.polygon.mean(axis=0)
+            self.ax.text(cx, cy, z.z1 + 0.1, z.name, color="#ff8040",
+                         fontsize=7, fontfamily="monospace", ha="center")
+        self.draw_idle()
+
+    def draw(self):
+        t0 = time.perf_counter()
+        super().draw()
+        ms = (time.perf_counter() - t0) * 1000.0
+        self.draw_ms = ms if self.draw_ms == 0.0 else self.draw_ms + 0.1 * (ms - self.draw_ms)
+
+    # ── public update ─────────────────────────────────────────────
+    def update_scene(self, points: np.ndarray):
+        # Point cloud — last K frames, colour by height, older frames fade out;
+        # one persistent scatter, colours written into the preallocated buffer
+        self.trail.push(points)
+        points, age_alpha = self.trail.merged()
+        n = len(points)
+        colors = self._pt_colors[:n]
+        np.clip(points[:, 2], 0.0, 3.0, out=colors[:, 1])
+        colors[:, 1] *= 0.7 / 3.0
+        colors[:, 1] += 0.3
+        np.multiply(age_alpha, 0.6, out=colors[:, 3])
+        self._pt_scat._offsets3d = (points[:, 0], points[:, 1], points[:, 2])
+        self._pt_scat.set_facecolors(colors)
+
+        self.draw_idle()
+
+    def update_tracks(self, ids, positions, persons: dict):
+        """Track centroids at their predicted positions; called at RENDER_HZ."""
+        if self._tk_scat is None:
+            if len(ids) == 0:
+                return
+            self._tk_scat = self.ax.scatter([], [], [], s=90, marker="^",
+                                            depthshade=False, zorder=5)
+        tcs = []
+        for tid in ids.tolist():
+            p = persons.get(tid)
+            if p and p.in_hazard:
+                tcs.append("#ff2020")
+            elif p and p.fall:
+                tcs.append("#ffb300")
+            else:
+                tcs.append("#39ff14")
+        self._tk_scat._offsets3d = (positions[:, 0], positions[:, 1], positions[:, 2])
+        self._tk_scat.set_color(tcs)
+        self._tk_scat.set_visible(len(ids) > 0)
+        self.draw_idle()
+
+    def refresh_hazard_zone(self):
+        self._draw_hazard_zone()
+        self._draw_room()
+        self.draw_idle()
+
+
+# ══════════════════════════════════════════════════════════════════
+#  OCCUPANCY HEATMAP CANVAS
+# ══════════════════════════════════════════════════════════════════
+class HeatmapCanvas(FigureCanvas):
+    """Top-down occupancy heatmap; one persistent image artist, set_data only."""
+
+    def __init__(self, grid: OccupancyGrid, parent=None):
+        self.fig = Figure(facecolor="#0b0e0b", tight_layout=True)
+        super().__init__(self.fig)
+        self.setParent(parent)
+        self.grid = grid
+
+        ax = self.ax = self.fig.add_subplot(111)
+        ax.set_facecolor("#0b0e0b")
+        ax.tick_params(colors="#1f6b10", labelsize=7)
+        for spine in ax.spines.values():
+            spine.set_edgecolor("#14201a")
+        ax.set_xlabel("X (m)", fontsize=8, color="#39ff14")
+        ax.set_ylabel("Y (m)", fontsize=8, color="#39ff14")
+        ax.set_title("OCCUPANCY  —  time-decayed presence",
+                     color="#39ff14", fontsize=9, pad=8, fontfamily="monospace")
+        # grid is indexed [x, y] → transpose for imshow rows = y
+        self._img = ax.imshow(grid.floor_map().T, origin="lower", extent=grid.extent(),
+                              cmap="inferno", interpolation="nearest", vmin=0, vmax=1)
+        self.setMinimumHeight(440)
+
+    def refresh(self):
+        m = self.grid.floor_map()
+        self._img.set_data(m.T)
+        self._img.set_clim(0, max(float(m.max()), 1e-6))
+        self.draw_idle()
@@ -0,0 +1,101 @@
+import math
+import numpy as np
+
+# ══════════════════════════════════════════════════════════════════
+#  WORLD TRANSFORM  —  sensor coordinates → room (world) coordinates
+# ══════════════════════════════════════════════════════════════════
+# World frame: origin on the floor below the sensor, z up, y along the
+# sensor boresight projected onto the floor, x to the right.
+#
+# The People Tracking tracker already applies sensorPosition to its target
+# list; only the point cloud arrives in sensor coordinates. Set this False
+# for firmware whose targets are reported in the sensor frame.
+TARGETS_IN_WORLD = True
+
+
+def _rotation(az_deg, elev_deg):
+    """Sensor → world rotation: tilt the boresight down by elev, then turn it towards +x by az."""
+    e, a = math.radians(elev_deg), math.radians(az_deg)
+    ce, se, ca, sa = math.cos(e), math.sin(e), math.cos(a), math.sin(a)
+    rx = np.array([[1, 0, 0], [0, ce, se], [0, -se, ce]])
+    rz = np.array([[ca, sa, 0], [-sa, ca, 0], [0, 0, 1]])
+    return (rz @ rx).astype(np.float32)
+
+
+class SensorTransform:
+    """
+    One precomputed rotation + translation, applied to whole N×≥3 float32
+    arrays in place (columns 0..2 are x, y, z; extra columns are untouched).
+
+    height       sensor height above the floor (m)
+    az_tilt      azimuth tilt (deg), positive turns the boresight towards +x
+    elev_tilt    elevation tilt (deg), positive points the boresight down
+    x, y, yaw    sensor placement in a shared room frame (m, m, deg) —
+                 zero for a single sensor, set per sensor when fusing
+    """
+
+    def __init__(self, height=0.0, az_tilt=0.0, elev_tilt=0.0, x=0.0, y=0.0, yaw=0.0):
+        self.height, self.az_tilt, self.elev_tilt = height, az_tilt, elev_tilt
+        self.x, self.y, self.yaw = x, y, yaw
+        self.R   = _rotation(az_tilt + yaw, elev_tilt)
+        self._RT = np.ascontiguousarray(self.R.T)
+        self.t   = np.array([x, y, height], dtype=np.float32)
+        self.identity = not (height or az_tilt or elev_tilt or x or y or yaw)
+        # Placement only (for targets the tracker already put in its own world frame)
+        self._place_RT = np.ascontiguousarray(_rotation(yaw, 0.0).T)
+        self._place_t  = np.array([x, y, 0.0], dtype=np.float32)
+        self._zero_t   = np.zeros(3, dtype=np.float32)
+        self.placed    = bool(x or y or yaw)
+        self._tmp = np.empty((0, 3), dtype=np.float32)
+
+    @classmethod
+    def from_cfg(cls, cfg_text, **placement):
+        """Build from the `sensorPosition <height> <azTilt> <elevTilt>` line of a .cfg."""
+        for line in cfg_text.splitlines():
+            parts = line.split()
+            if parts and parts[0] == "sensorPosition":
+                vals = [float(v) for v in parts[1:4]] + [0.0] * (4 - len(parts))
+                return cls(vals[0], vals[1], vals[2], **placement)
+        return cls(**placement)
+
+    def _transform(self, arr, RT, t):
+        n = len(arr)
+        if len(self._tmp) < n:
+            self._tmp = np.empty((max(n, 2 * len(self._tmp)), 3), dtype=np.float32)
+        tmp = self._tmp[:n]
+        np.matmul(arr[:, :3], RT, out=tmp)
+        tmp += t
+        arr[:, :3] = tmp
+        return arr
+
+    def apply(self, arr):
+        """Transform arr[:, :3] in place; returns arr. arr must be float32."""
+        if len(arr) == 0 or self.identity:
+            return arr
+        return self._transform(arr, self._RT, self.t)
+
+    def apply_frame(self, fr):
+        """Bring a RadarFrame's point cloud and targets into the world frame."""
+        self.apply(fr.points)
+        if len(fr.target_pos):
+            if not TARGETS_IN_WORLD and not self.identity:
+                self.apply(fr.target_pos)
+                self._transform(fr.target_vel, self._RT, self._zero_t)      # rotate only
+                self._transform(fr.target_acc, self._RT, self._zero_t)
+            elif self.placed:
+                self._transform(fr.target_pos, self._place_RT, self._place_t)
+                self._transform(fr.target_vel, self._place_RT, self._zero_t)
+                self._transform(fr.target_acc, self._place_RT, self._zero_t)
+            else:
+                return fr
+            fr.targets = None          # rebuild the dict view from the new positions
+        return fr
+
+    def inverse(self, arr):
+        """World → sensor for arr[:, :3] (not in place), e.g. to draw the FOV."""
+        a = np.asarray(arr, dtype=np.float32)
+        return (a[:, :3] - self.t) @ self.R
+
+    def __repr__(self):
+        return (f"SensorTransform(h={self.height} az={self.az_tilt} elev={self.elev_tilt}"
+                f" at x={self.x} y={self.y} yaw={self.yaw})")
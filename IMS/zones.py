@@ -0,0 +1,121 @@
+import json
+import numpy as np
+
+# ══════════════════════════════════════════════════════════════════
+#  ZONES  —  polygon keep-out zones with height bands, tested per frame
+# ══════════════════════════════════════════════════════════════════
+ZONE_MIN_POINTS = 5           # moving raw points inside a zone that count as an intrusion
+ZONE_MIN_DOPPLER = 0.1        # m/s; slower points are static clutter (racks, machines, walls)
+
+
+class Zone:
+    """Floor polygon (world x/y, metres) extruded over the height band z0 … z1."""
+
+    __slots__ = ["name", "polygon", "z0", "z1"]
+
+    def __init__(self, name, polygon, z0=0.0, z1=3.0):
+        self.name    = name
+        self.polygon = np.asarray(polygon, dtype=np.float32).reshape(-1, 2)
+        if len(self.polygon) < 3:
+            raise ValueError(f"zone {name!r}: polygon needs at least 3 vertices")
+        self.z0, self.z1 = float(z0), float(z1)
+
+    @classmethod
+    def from_box(cls, name, zone):
+        """From a HazardZone-style box (x0, x1, y0, y1, z0, z1)."""
+        return cls(name, [(zone.x0, zone.y0), (zone.x1, zone.y0),
+                          (zone.x1, zone.y1), (zone.x0, zone.y1)], zone.z0, zone.z1)
+
+
+def load_zones(path):
+    """JSON list of {"name": ..., "polygon": [[x, y], ...], "z": [z0, z1]}."""
+    with open(path, "r") as f:
+        raw = json.load(f)
+    return [Zone(z["name"], z["polygon"], *z.get("z", (0.0, 3.0))) for z in raw]
+
+
+class ZoneResult:
+    __slots__ = ["point_counts", "target_mask", "target_counts", "intrusion"]
+
+    def __init__(self, point_counts, target_mask, target_counts, intrusion):
+        self.point_counts  = point_counts    # int   Z    moving raw points per zone (|doppler| ≥ min)
+        self.target_mask   = target_mask     # bool  T×Z  target i inside zone j
+        self.target_counts = target_counts   # int   Z    targets per zone
+        self.intrusion     = intrusion       # bool  Z    any target, or ≥ ZONE_MIN_POINTS moving points
+
+
+class ZoneSet:
+    """
+    All zones compiled into padded numpy arrays.
+
+    contains(xyz) tests N positions against Z zones in one call: an
+    axis-aligned bounding-box + height-band prefilter over the N×Z grid,
+    then a vectorised crossing-number point-in-polygon test only for the
+    surviving (position, zone) pairs. Polygons are padded to a common vertex
+    count by repeating the last vertex, which adds zero-length edges that
+    never count as crossings.
+
+    Raw points only count when |doppler| ≥ min_doppler: static reflectors
+    inside a zone (a machine, a rack, the wall behind it) return points every
+    frame and would otherwise hold the zone in intrusion permanently.
+
+    A ZoneSet is immutable; to change zones build a new one and swap the
+    reference (safe to do while a reader thread is using the old one).
+    """
+
+    def __init__(self, zones, min_points=ZONE_MIN_POINTS, min_doppler=ZONE_MIN_DOPPLER):
+        self.zones = list(zones)
+        self.names = [z.name for z in self.zones]
+        self.min_points = min_points
+        self.min_doppler = min_doppler
+        n = len(self.zones)
+        k = max((len(z.polygon) for z in self.zones), default=3)
+        vx = np.zeros((n, k), dtype=np.float32)
+        vy = np.zeros((n, k), dtype=np.float32)
+        for i, z in enumerate(self.zones):
+            m = len(z.polygon)
+            vx[i, :m], vy[i, :m] = z.polygon[:, 0], z.polygon[:, 1]
+            vx[i, m:], vy[i, m:] = z.polygon[-1, 0], z.polygon[-1, 1]
+        # edge i → i+1 (wrapping); padded vertices give zero-length edges
+        self._x0, self._y0 = vx, vy
+        self._x1, self._y1 = np.roll(vx, -1, axis=1), np.roll(vy, -1, axis=1)
+        dy = self._y1 - self._y0
+        self._slope = np.divide(self._x1 - self._x0, dy, out=np.zeros_like(dy), where=dy != 0)
+        self._bbox = np.stack([vx.min(1), vx.max(1), vy.min(1), vy.max(1)], axis=1) \
+            if n else np.zeros((0, 4), dtype=np.float32)
+        self._zlo = np.array([z.z0 for z in self.zones], dtype=np.float32)
+        self._zhi = np.array([z.z1 for z in self.zones], dtype=np.float32)
+
+    def __len__(self):
+        return len(self.zones)
+
+    def contains(self, xyz):
+        """bool N×Z: position i inside zone j (polygon and height band)."""
+        xyz = np.asarray(xyz)
+        n, nz = len(xyz), len(self.zones)
+        out = np.zeros((n, nz), dtype=bool)
+        if n == 0 or nz == 0:
+            return out
+        x, y, z = xyz[:, 0:1], xyz[:, 1:2], xyz[:, 2:3]
+        b = self._bbox
+        cand = (x >= b[:, 0]) & (x <= b[:, 1]) & (y >= b[:, 2]) & (y <= b[:, 3]) \
+            & (z >= self._zlo) & (z <= self._zhi)
+        pi, zi = np.nonzero(cand)
+        if len(pi) == 0:
+            return out
+        px, py = xyz[pi, 0:1], xyz[pi, 1:2]
+        y0, y1 = self._y0[zi], self._y1[zi]
+        crosses = ((y0 > py) != (y1 > py)) & (px < self._slope[zi] * (py - y0) + self._x0[zi])
+        out[pi, zi] = (np.count_nonzero(crosses, axis=1) & 1).astype(bool)
+        return out
+
+    def evaluate(self, points, target_pos):
+        """One call per frame: all moving points and all targets against all zones."""
+        points = np.asarray(points)
+        if points.ndim == 2 and points.shape[1] >= 4:
+            points = points[np.abs(points[:, 3]) >= self.min_doppler]
+        pm = self.contains(points)
+        tm = self.contains(target_pos)
+        pc = pm.sum(axis=0)
+        tc = tm.sum(axis=0)
+        return ZoneResult(pc, tm, tc, (tc > 0) | (pc >= self.min_points))
@@ -1,9 +1,15 @@
+import os
+import sys
 import serial
 import struct
 import asyncio
 import time
 from typing import List, Tuple, Optional
 
+# Modules shared with the other apps (radar_common/) live at the repository root
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from radar_common.config_uploader import ConfigUploader
+
 MAGIC_WORD = bytes([2, 1, 4, 3, 6, 5, 8, 7])
 
 class RadarHandler:
@@ -14,6 +20,7 @@ class RadarHandler:
         self.data_serial = None
         self.buffer = bytearray()
         self.is_running = False
+        self.config_sent_at: Optional[float] = None
 
     def connect(self):
         try:
@@ -29,12 +36,14 @@ class RadarHandler:
             return False
         try:
             with open(cfg_path, "r") as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('%'):
-                        self.cfg_serial.write((line + "\n").encode())
-                        time.sleep(0.01)
-            return True
+                cfg_text = f.read()
+            self.cfg_serial.reset_input_buffer()
+            result = ConfigUploader(self.cfg_serial).upload(cfg_text)
+            print(f"Config: {result.summary()}")
+            for r in result.errors:
+                print(f"  CLI error on '{r.cmd}': {r.response}")
+            self.config_sent_at = time.perf_counter()
+            return result.ok
         except Exception as e:
             print(f"Error sending config: {e}")
             return False
@@ -98,6 +107,10 @@ class RadarHandler:
             frame = self.parse_frame()
             if frame:
                 frame_num, points = frame
+                if self.config_sent_at is not None:
+                    ttff = (time.perf_counter() - self.config_sent_at) * 1000
+                    print(f"First frame {ttff:.0f} ms after config upload finished.")
+                    self.config_sent_at = None
                 await callback({"frame": frame_num, "points": points, "timestamp": time.time()})
             await asyncio.sleep(0.01)
 
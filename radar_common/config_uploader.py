@@ -0,0 +1,146 @@
+import time
+
+# ══════════════════════════════════════════════════════════════════
+#  CONFIG UPLOADER  —  stream .cfg commands, next line on each ACK
+# ══════════════════════════════════════════════════════════════════
+ACK_MIN_S      = 0.15       # adaptive timeout floor
+ACK_MAX_S      = 1.0        # adaptive timeout ceiling
+ACK_RTT_FACTOR = 4.0        # timeout = factor × smoothed round-trip time
+# Commands that legitimately take longer than a parameter write
+ACK_SLOW_S     = {"sensorStart": 3.0, "sensorStop": 1.5, "flushCfg": 1.0,
+                  "calibData": 2.0}
+COMMENT_PREFIXES = ("%", "#")
+
+
+def config_commands(cfg_text):
+    """Non-empty, non-comment lines of a .cfg, whitespace-normalised."""
+    out = []
+    for line in cfg_text.splitlines():
+        line = " ".join(line.split())
+        if line and not line.startswith(COMMENT_PREFIXES):
+            out.append(line)
+    return out
+
+
+class CommandResult:
+    __slots__ = ["cmd", "status", "rtt_ms", "response"]
+
+    def __init__(self, cmd, status, rtt_ms, response):
+        self.cmd      = cmd
+        self.status   = status      # "done" | "error" | "timeout"
+        self.rtt_ms   = rtt_ms
+        self.response = response
+
+
+class UploadResult:
+    def __init__(self):
+        self.commands = []          # CommandResult per line
+        self.total_ms = 0.0
+        self.aborted  = False
+        self.silent   = False       # first command got no bytes back (not a CLI port)
+
+    @property
+    def ok(self):
+        return not (self.aborted or self.silent) and all(c.status != "error" for c in self.commands)
+
+    @property
+    def errors(self):
+        return [c for c in self.commands if c.status == "error"]
+
+    def summary(self):
+        rtts = sorted(c.rtt_ms for c in self.commands if c.status == "done")
+        med = rtts[len(rtts) // 2] if rtts else 0.0
+        worst = max(self.commands, key=lambda c: c.rtt_ms, default=None)
+        n_to = sum(c.status == "timeout" for c in self.commands)
+        s = (f"{len(self.commands)} commands in {self.total_ms:.0f} ms · "
+             f"median RTT {med:.1f} ms")
+        if worst:
+            s += f" · slowest '{worst.cmd.split()[0]}' {worst.rtt_ms:.0f} ms"
+        if n_to:
+            s += f" · {n_to} timeout(s)"
+        return s
+
+
+class ConfigUploader:
+    """
+    Sends a TI mmWave .cfg over the CLI UART.
+
+    Each command is written as soon as the previous one is acknowledged
+    ("Done" / "Error" / "not recognized"), so there are no fixed sleeps.
+    The ACK timeout adapts to the measured round-trip time (a few × the
+    smoothed RTT, clamped to [ACK_MIN_S, ACK_MAX_S]); slow commands such as
+    sensorStart get their own floor from ACK_SLOW_S.
+    The CLI has no flow control, so only one command is in flight at a time.
+
+    ser        — open pyserial-like object (write, flush, read, in_waiting)
+    on_command — optional callback(index, total, CommandResult) for logging
+    stop_event — optional threading.Event; upload aborts when set
+    stop_if_silent — give up (result.silent) when the first command gets no
+                 reply at all, e.g. a cached CLI port that is really the data port
+    """
+
+    def __init__(self, ser, on_command=None, stop_event=None, stop_if_silent=False):
+        self.ser        = ser
+        self.on_command = on_command
+        self.stop_event = stop_event
+        self.stop_if_silent = stop_if_silent
+        self._rtt       = None      # smoothed RTT (s)
+
+    def _timeout_for(self, cmd):
+        base = ACK_MAX_S if self._rtt is None else \
+            min(ACK_MAX_S, max(ACK_MIN_S, ACK_RTT_FACTOR * self._rtt))
+        return max(base, ACK_SLOW_S.get(cmd.split()[0], 0.0))
+
+    def _stopped(self):
+        return self.stop_event is not None and self.stop_event.is_set()
+
+    def _read_ack(self, timeout):
+        deadline = time.perf_counter() + timeout
+        buf = ""
+        while time.perf_counter() < deadline:
+            if self._stopped():
+                return buf, None
+            n = self.ser.in_waiting
+            if n:
+                buf += self.ser.read(n).decode("ascii", errors="ignore")
+                low = buf.lower()
+                if "done" in low:
+                    return buf, "done"
+                if "error" in low or "not recognized" in low:
+                    return buf, "error"
+            else:
+                time.sleep(0.001)
+        return buf, "timeout"
+
+    def upload(self, cfg_text):
+        lines  = config_commands(cfg_text)
+        result = UploadResult()
+        t_start = time.perf_counter()
+        for i, cmd in enumerate(lines):
+            if self._stopped():
+                result.aborted = True
+                break
+            t0 = time.perf_counter()
+            self.ser.write((cmd + "\n").encode("ascii"))
+            self.ser.flush()
+            resp, status = self._read_ack(self._timeout_for(cmd))
+            if status is None:
+                result.aborted = True
+                break
+            rtt = time.perf_counter() - t0
+            if status == "done" and cmd.split()[0] not in ACK_SLOW_S:
+                self._rtt = rtt if self._rtt is None else 0.8 * self._rtt + 0.2 * rtt
+            elif status == "timeout":
+                # drop a late ACK so it is not credited to the next command
+                if self.ser.in_waiting:
+                    self.ser.read(self.ser.in_waiting)
+            cr = CommandResult(cmd, status, rtt * 1000.0,
+                               resp.replace("\r", " ").replace("\n", " ").strip())
+            result.commands.append(cr)
+            if self.on_command:
+                self.on_command(i, len(lines), cr)
+            if i == 0 and self.stop_if_silent and status == "timeout" and not resp:
+                result.silent = True
+                break
+        result.total_ms = (time.perf_counter() - t_start) * 1000.0
+        return result
@@ -0,0 +1,89 @@
+import numpy as np
+
+# ══════════════════════════════════════════════════════════════════
+#  POINT HISTORY  —  fixed-capacity ring of the last K frames
+# ══════════════════════════════════════════════════════════════════
+TRAIL_FRAMES     = 8          # frames kept for persistence trails
+TRAIL_MAX_POINTS = 512        # per-frame cap (TI demos emit ≤ 500 points)
+TRAIL_MIN_ALPHA  = 0.08       # alpha of the oldest frame in the trail
+
+
+class PointHistory:
+    """
+    Ring buffer of the last K point-cloud frames for persistence trails.
+
+    All storage is allocated once:
+        _buf   (K, max_points, cols) float32  — raw points per slot
+        _n     (K,)                  int      — valid rows per slot
+        _out   (K*max_points, cols)  float32  — merged output
+        _alpha (K*max_points,)       float32  — per-point fade factor
+
+    push() copies one frame into the oldest slot; merged() copies only the
+    valid rows of each slot into _out / _alpha (oldest frame first, newest
+    last so it draws on top) and returns views of them. The views stay
+    valid until the next push(); merged() without a push in between
+    returns them again without copying.
+
+    Shared by IMS, radar_console_app and radar_ui_app.
+    """
+
+    def __init__(self, frames=TRAIL_FRAMES, max_points=TRAIL_MAX_POINTS,
+                 cols=4, min_alpha=TRAIL_MIN_ALPHA):
+        self.frames     = max(1, int(frames))
+        self.max_points = int(max_points)
+        self.cols       = int(cols)
+        K, M = self.frames, self.max_points
+
+        self._buf     = np.zeros((K, M, self.cols), dtype=np.float32)
+        self._n       = np.zeros(K, dtype=np.int64)
+        self._out     = np.zeros((K * M, self.cols), dtype=np.float32)
+        self._alpha   = np.zeros(K * M, dtype=np.float32)
+        self._total   = 0            # rows of _out / _alpha in use
+        self._dirty   = False        # pushed since the last merged()
+
+        # Age → alpha: oldest slot fades to min_alpha, newest is 1.0
+        self._slot_alpha = np.linspace(min_alpha, 1.0, K, dtype=np.float32)
+        self._head  = 0          # next slot to write
+        self._count = 0          # frames pushed (saturates at K)
+
+    def __len__(self):
+        return self._count
+
+    def clear(self):
+        self._n[:] = 0
+        self._head = 0
+        self._count = 0
+        self._total = 0
+        self._dirty = False
+
+    def push(self, points: np.ndarray):
+        """Store one frame (N × cols, extra columns ignored, excess rows dropped)."""
+        slot = self._head
+        n = 0
+        if points is not None and len(points):
+            n = min(len(points), self.max_points)
+            c = min(points.shape[1], self.cols)
+            self._buf[slot, :n, :c] = points[:n, :c]
+        self._n[slot] = n
+        self._head  = (slot + 1) % self.frames
+        self._count = min(self._count + 1, self.frames)
+        self._dirty = True
+
+    def merged(self):
+        """
+        Return (points, alpha) for every stored frame.
+        points: (P, cols) float32 view, alpha: (P,) float32 view in [min_alpha, 1].
+        """
+        if self._dirty:
+            K, pos = self.frames, 0
+            # Slots oldest → newest; one slice copy per slot, valid rows only
+            for age in range(K):
+                slot = (self._head + age) % K
+                n = int(self._n[slot])
+                if n:
+                    self._out[pos:pos + n] = self._buf[slot, :n]
+                    self._alpha[pos:pos + n] = self._slot_alpha[age]
+                    pos += n
+            self._total = pos
+            self._dirty = False
+        return self._out[:self._total], self._alpha[:self._total]
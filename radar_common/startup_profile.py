@@ -0,0 +1,70 @@
+import sys
+import time
+import builtins
+
+# ══════════════════════════════════════════════════════════════════
+#  STARTUP PROFILE  —  per-import cost and startup phases (--startup-profile)
+# ══════════════════════════════════════════════════════════════════
+PROFILE_FLAG = "--startup-profile"
+PROFILE_TOP  = 15             # slowest imports listed in the report
+
+
+class StartupProfile:
+    """
+    Times the first import of every module imported at depth ≤ 1 (the
+    app's own imports and what its sibling modules import), inclusive of
+    their sub-imports, plus named phases marked with mark().
+
+    install() must run before the heavy imports to see them; from_argv()
+    does nothing (returns None) unless PROFILE_FLAG is on the command line.
+    """
+
+    def __init__(self):
+        self.t0 = time.perf_counter()
+        self.imports = []             # (depth, name, ms)
+        self.marks = []               # (label, ms since t0)
+        self._depth = 0
+        self._orig = None
+
+    @classmethod
+    def from_argv(cls, argv):
+        if PROFILE_FLAG not in argv:
+            return None
+        p = cls()
+        p.install()
+        return p
+
+    def install(self):
+        self._orig = builtins.__import__
+        builtins.__import__ = self._import
+
+    def uninstall(self):
+        if self._orig is not None:
+            builtins.__import__ = self._orig
+            self._orig = None
+
+    def _import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        if level or name in sys.modules or self._depth > 1:
+            return self._orig(name, globals, locals, fromlist, level)
+        depth = self._depth
+        self._depth += 1
+        t = time.perf_counter()
+        try:
+            return self._orig(name, globals, locals, fromlist, level)
+        finally:
+            self._depth -= 1
+            self.imports.append((depth, name, (time.perf_counter() - t) * 1000.0))
+
+    def mark(self, label):
+        self.marks.append((label, (time.perf_counter() - self.t0) * 1000.0))
+
+    def report(self, top=PROFILE_TOP):
+        lines = ["startup profile:"]
+        prev = 0.0
+        for label, ms in self.marks:
+            lines.append(f"  {ms:8.1f} ms  (+{ms - prev:7.1f})  {label}")
+            prev = ms
+        lines.append("slowest imports (inclusive, first import only):")
+        for depth, name, ms in sorted(self.imports, key=lambda r: -r[2])[:top]:
+            lines.append(f"  {ms:8.1f} ms  {'  ' * depth}{name}")
+        return "\n".join(lines)
@@ -0,0 +1,293 @@
+"""
+Offline batch processing of recorded radar sessions.
+
+Runs parse -> filter -> track -> statistics over every capture in a
+directory, one file per worker process, and writes one JSON summary per
+session plus a sessions.csv index:
+
+    python batch.py captures/ -o batch_out -j 8 --eps 0.4 --max-range 8
+
+Captures are either raw data-port dumps (.bin / .dat / .raw, the TLV byte
+stream as read from the UART) or CSV files written by CSVLogger.
+"""
+import os
+
+# One BLAS thread per worker: the pool already uses every core, and nested
+# BLAS threads would only compete with the other workers.
+for _var in ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS"):
+    os.environ.setdefault(_var, "1")
+
+import argparse
+import ast
+import csv
+import json
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+
+import numpy as np
+
+from parser.frame_parser import FrameParser
+from processing.point_filter import PointFilter, MIN_RANGE, MAX_RANGE, MAX_SPEED
+from tracking.host_tracker import (HostTracker, CLUSTER_EPS, CLUSTER_MIN_POINTS,
+                                   GATE_DISTANCE, MAX_MISSES, CONFIRM_HITS)
+
+RAW_EXTENSIONS = ('.bin', '.dat', '.raw')
+CSV_EXTENSIONS = ('.csv',)
+READ_CHUNK = 1 << 20        # bytes fed to the parser at a time
+FRAME_PERIOD = 0.05         # s, timestamp step for raw captures (no host time recorded)
+
+# CSVLogger stores str(list of dicts); with numpy 2 scalars that reads
+# "np.float64(1.5)", which literal_eval rejects
+_NP_SCALAR = re.compile(r'np\.float\d+\(([^()]*)\)')
+
+
+def iter_raw_frames(path, frame_period=FRAME_PERIOD):
+    """
+    Yields (timestamp, frame) from a raw data-port dump.
+
+    Timestamps are derived from the frame number, since a raw dump carries
+    no host time.
+    """
+    parser = FrameParser()
+    first_id = None
+    with open(path, 'rb') as f:
+        while True:
+            chunk = f.read(READ_CHUNK)
+            if not chunk:
+                break
+            for frame in parser.parse(chunk):
+                if first_id is None:
+                    first_id = frame['frame_id']
+                yield (frame['frame_id'] - first_id) * frame_period, frame
+
+
+def iter_csv_frames(path, frame_period=FRAME_PERIOD):
+    """
+    Yields (timestamp, frame) from a CSVLogger file.
+
+    Uses the logged host timestamps; rows without a readable timestamp fall
+    back to one frame_period per row.
+    """
+    t0 = None
+    with open(path, newline='') as f:
+        for i, row in enumerate(csv.DictReader(f)):
+            points = ast.literal_eval(_NP_SCALAR.sub(r'\1', row.get('point_data') or '[]'))
+            xyzv = np.array([(p['x'], p['y'], p['z'], p['v']) for p in points],
+                            dtype=np.float32).reshape(-1, 4)
+            try:
+                t = datetime.fromisoformat(row.get('timestamp') or '').timestamp()
+                t0 = t if t0 is None else t0
+                t -= t0
+            except ValueError:
+                t = i * frame_period
+            yield t, {'frame_id': int(row['frame_id']), 'xyzv': xyzv,
+                      'num_points': len(xyzv)}
+
+
+def process_session(path, out_dir, params, name=None):
+    """
+    Runs one capture through the full pipeline. Executed in a worker process.
+
+    Args:
+        path (str): capture file.
+        out_dir (str): directory for the per-session JSON summary.
+        params (dict): filter / tracker parameters (see build_params).
+        name (str): session name, unique within the batch (see session_names);
+            defaults to the file name without extension.
+
+    Returns:
+        dict: the session summary (also written to <out_dir>/<name>.json).
+    """
+    if name is None:
+        name = os.path.splitext(os.path.basename(path))[0]
+    t_start = time.perf_counter()
+    if path.lower().endswith(CSV_EXTENSIONS):
+        frames = iter_csv_frames(path, params['frame_period'])
+    else:
+        frames = iter_raw_frames(path, params['frame_period'])
+
+    point_filter = PointFilter(min_range=params['min_range'], max_range=params['max_range'],
+                               roi=params['roi'], min_speed=params['min_speed'],
+                               max_speed=params['max_speed'], min_snr_db=params['min_snr'],
+                               background=params['background'])
+    tracker = HostTracker(eps=params['eps'], min_points=params['min_points'],
+                          gate=params['gate'], max_misses=params['max_misses'],
+                          confirm_hits=params['confirm_hits'])
+
+    n_frames = 0
+    lost = 0
+    last_id = None
+    raw_points = []
+    kept_points = []
+    concurrent = []
+    track_frames = {}       # track id -> frames reported
+    t_last = 0.0
+
+    for t, frame in frames:
+        fid = frame['frame_id']
+        if last_id is not None and fid > last_id + 1:
+            lost += fid - last_id - 1
+        last_id = fid
+
+        xyzv = frame['xyzv'][point_filter.apply(frame['xyzv'], frame.get('snr_db'))]
+        targets = tracker.update(xyzv, t)
+
+        n_frames += 1
+        raw_points.append(len(frame['xyzv']))
+        kept_points.append(len(xyzv))
+        concurrent.append(len(targets))
+        for tg in targets:
+            track_frames[tg['id']] = track_frames.get(tg['id'], 0) + 1
+        t_last = t
+
+    raw_points = np.asarray(raw_points)
+    kept_points = np.asarray(kept_points)
+    concurrent = np.asarray(concurrent)
+    lifetimes = np.asarray(list(track_frames.values()))
+    elapsed = time.perf_counter() - t_start
+
+    summary = {
+        'session': name,
+        'source': path,
+        'frames': n_frames,
+        'lost_frames': lost,
+        'duration_s': round(t_last, 3),
+        'points_mean': round(float(raw_points.mean()), 2) if n_frames else 0.0,
+        'points_max': int(raw_points.max()) if n_frames else 0,
+        'points_kept_ratio': round(float(kept_points.sum() / max(raw_points.sum(), 1)), 4),
+        'tracks': len(track_frames),
+        'tracks_max_concurrent': int(concurrent.max()) if n_frames else 0,
+        'tracks_mean_concurrent': round(float(concurrent.mean()), 3) if n_frames else 0.0,
+        'track_life_frames_mean': round(float(lifetimes.mean()), 1) if len(lifetimes) else 0.0,
+        'process_s': round(elapsed, 3),
+        'frames_per_s': round(n_frames / elapsed, 1) if elapsed > 0 else 0.0,
+    }
+    # one flat column per filter stage, so sessions.csv stays plain values
+    summary.update({f'dropped_{stage}': n for stage, n in point_filter.dropped.items()})
+    summary['params'] = params
+    with open(os.path.join(out_dir, f"{name}.json"), 'w') as f:
+        json.dump(summary, f, indent=2)
+    return summary
+
+
+def find_captures(capture_dir):
+    """Returns capture files in capture_dir, largest first (better pool packing)."""
+    exts = RAW_EXTENSIONS + CSV_EXTENSIONS
+    paths = [os.path.join(capture_dir, f) for f in os.listdir(capture_dir)
+             if f.lower().endswith(exts)]
+    return sorted(paths, key=os.path.getsize, reverse=True)
+
+
+def session_names(paths, capture_dir):
+    """
+    Maps each capture to a unique session name: its path relative to
+    capture_dir without the extension, folders joined with "__"; names that
+    still collide (a.bin next to a.csv) get a numeric suffix.
+    """
+    names = {}
+    used = set()
+    for path in sorted(paths):
+        rel = os.path.splitext(os.path.relpath(path, capture_dir))[0]
+        base = rel.replace(os.sep, '__')
+        name, k = base, 2
+        while name in used:
+            name, k = f"{base}_{k}", k + 1
+        used.add(name)
+        names[path] = name
+    return names
+
+
+def build_params(args):
+    return {
+        'frame_period': args.frame_period,
+        'min_range': args.min_range,
+        'max_range': args.max_range,
+        'roi': args.roi,
+        'min_speed': args.min_speed,
+        'max_speed': args.max_speed,
+        'min_snr': args.min_snr,
+        'background': not args.keep_static,
+        'eps': args.eps,
+        'min_points': args.min_points,
+        'gate': args.gate,
+        'max_misses': args.max_misses,
+        'confirm_hits': args.confirm_hits,
+    }
+
+
+def write_index(out_dir, summaries):
+    """One row per session, without the params column."""
+    fields = [k for k in summaries[0] if k != 'params']
+    with open(os.path.join(out_dir, 'sessions.csv'), 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=fields, extrasaction='ignore')
+        writer.writeheader()
+        for s in sorted(summaries, key=lambda s: s['session']):
+            writer.writerow(s)
+
+
+def parse_args(argv=None):
+    ap = argparse.ArgumentParser(description="Reprocess recorded radar sessions in parallel.")
+    ap.add_argument('capture_dir', help="directory of .bin/.dat/.raw dumps or CSVLogger files")
+    ap.add_argument('-o', '--out', default='batch_output', help="summary directory")
+    ap.add_argument('-j', '--jobs', type=int, default=os.cpu_count(), help="worker processes")
+    ap.add_argument('--frame-period', type=float, default=FRAME_PERIOD,
+                    help="s per frame for raw dumps")
+    ap.add_argument('--min-range', type=float, default=MIN_RANGE)
+    ap.add_argument('--max-range', type=float, default=MAX_RANGE)
+    ap.add_argument('--roi', type=float, nargs=6, metavar=('X0', 'X1', 'Y0', 'Y1', 'Z0', 'Z1'),
+                    help="keep only points inside this box (m)")
+    ap.add_argument('--min-speed', type=float, default=0.0)
+    ap.add_argument('--max-speed', type=float, default=MAX_SPEED)
+    ap.add_argument('--min-snr', type=float, help="dB; raw dumps with TLV 7 only")
+    ap.add_argument('--keep-static', action='store_true',
+                    help="don't suppress persistent static reflectors")
+    ap.add_argument('--eps', type=float, default=CLUSTER_EPS, help="cluster radius (m)")
+    ap.add_argument('--min-points', type=int, default=CLUSTER_MIN_POINTS)
+    ap.add_argument('--gate', type=float, default=GATE_DISTANCE, help="association gate (m)")
+    ap.add_argument('--max-misses', type=int, default=MAX_MISSES)
+    ap.add_argument('--confirm-hits', type=int, default=CONFIRM_HITS)
+    return ap.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    paths = find_captures(args.capture_dir)
+    if not paths:
+        print(f"No captures found in {args.capture_dir}.")
+        return 1
+    os.makedirs(args.out, exist_ok=True)
+    params = build_params(args)
+    names = session_names(paths, args.capture_dir)
+
+    t0 = time.perf_counter()
+    summaries = []
+    failed = 0
+    with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+        futures = {pool.submit(process_session, p, args.out, params, names[p]): p for p in paths}
+        for fut in as_completed(futures):
+            path = futures[fut]
+            try:
+                s = fut.result()
+            except Exception as e:
+                failed += 1
+                print(f"  FAILED {os.path.basename(path)}: {e}")
+                continue
+            summaries.append(s)
+            print(f"  {s['session']}: {s['frames']} frames, {s['tracks']} tracks, "
+                  f"{s['frames_per_s']:.0f} frames/s")
+
+    if summaries:
+        write_index(args.out, summaries)
+    wall = time.perf_counter() - t0
+    total = sum(s['frames'] for s in summaries)
+    busy = sum(s['process_s'] for s in summaries)
+    print(f"{len(summaries)} sessions ({failed} failed), {total} frames in {wall:.1f} s "
+          f"with {args.jobs} workers (speed-up {busy / wall if wall > 0 else 0:.1f}x).")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,7 @@
 import serial
 import time
 import threading
+from radar_common.config_uploader import ConfigUploader
 
 class SerialManager:
     """
@@ -17,6 +18,7 @@ class SerialManager:
         self.config_serial = None
         self.data_serial = None
         self.is_running = False
+        self.config_sent_at = None  # perf_counter() when the last config upload finished
 
     def connect(self):
         """Connects to both config and data ports."""
@@ -30,23 +32,30 @@ class SerialManager:
             return False
 
     def send_config(self, config_file_path):
-        """Sends each line of the config file to the radar."""
+        """
+        Sends the config file to the radar, one command per CLI acknowledgement.
+
+        Returns:
+            UploadResult: per-command status and round-trip times, or None on failure.
+        """
         if not self.config_serial:
             print("Config serial not connected.")
-            return
+            return None
 
         try:
             with open(config_file_path, 'r') as f:
-                lines = f.readlines()
-                
-            for line in lines:
-                line = line.strip()
-                if line and not line.startswith('#'):
-                    self.config_serial.write((line + '\n').encode())
-                    time.sleep(0.01)  # Brief pause between commands
-            print(f"Configuration sent from {config_file_path}")
+                cfg_text = f.read()
+
+            self.config_serial.reset_input_buffer()
+            result = ConfigUploader(self.config_serial).upload(cfg_text)
+            for r in result.errors:
+                print(f"  CLI error on '{r.cmd}': {r.response}")
+            print(f"Configuration sent from {config_file_path} ({result.summary()})")
+            self.config_sent_at = time.perf_counter()
+            return result
         except Exception as e:
             print(f"Error sending config: {e}")
+            return None
 
     def read_data(self):
         """Reads raw data from the data port."""
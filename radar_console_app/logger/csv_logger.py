@@ -31,7 +31,8 @@ class CSVLogger:
             self.file = open(self.filename, mode='a', newline='')
             # Define fieldnames based on requirement: timestamp, frame_id, parsed data fields
             # We'll use a generic 'data' field or expand as needed.
-            fieldnames = ['timestamp', 'frame_id', 'num_points', 'point_data']
+            fieldnames = ['timestamp', 'frame_id', 'num_points', 'point_data',
+                          'num_targets', 'target_data']
             self.writer = csv.DictWriter(self.file, fieldnames=fieldnames)
             
             if not self.header_written:
@@ -53,7 +54,9 @@ class CSVLogger:
                 'timestamp': timestamp,
                 'frame_id': parsed_frame.get('frame_id'),
                 'num_points': parsed_frame.get('num_points'),
-                'point_data': str(parsed_frame.get('points')) # Store as string for Excel compatibility
+                'point_data': str(parsed_frame.get('points')), # Store as string for Excel compatibility
+                'num_targets': len(parsed_frame.get('targets', [])),
+                'target_data': str(parsed_frame.get('targets', []))
             }
             self.writer.writerow(row)
             self.file.flush() # Ensure data is written
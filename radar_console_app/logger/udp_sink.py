@@ -0,0 +1,38 @@
+import json
+import socket
+
+class UDPSink:
+    """
+    Sends one JSON datagram per parsed frame (frame id, points, targets).
+    Same start / log_frame / close interface as CSVLogger.
+    """
+    def __init__(self, host='127.0.0.1', port=5600):
+        self.addr = (host, port)
+        self.sock = None
+
+    def start(self):
+        """Opens the UDP socket."""
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        print(f"UDP sink sending to {self.addr[0]}:{self.addr[1]}")
+
+    def log_frame(self, parsed_frame):
+        """Sends a frame; errors are reported and never stop acquisition."""
+        if not self.sock:
+            return
+
+        try:
+            msg = {
+                'frame_id': parsed_frame.get('frame_id'),
+                'points': parsed_frame['xyzv'].tolist(),
+                'targets': parsed_frame.get('targets', [])
+            }
+            self.sock.sendto(json.dumps(msg).encode('utf-8'), self.addr)
+        except Exception as e:
+            print(f"UDP sink error: {e}")
+
+    def close(self):
+        """Closes the socket."""
+        if self.sock:
+            self.sock.close()
+            self.sock = None
+            print("UDP sink closed.")
@@ -1,10 +1,20 @@
 import os
 import sys
+import json
 import time
+import signal
+import argparse
+# Modules shared with the other apps (radar_common/) live at the repository root
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from communication.serial_manager import SerialManager
 from parser.frame_parser import FrameParser
+from parser.heatmap_decoder import HeatmapDecoder
 from logger.csv_logger import CSVLogger
-from plotting.plot_manager import PlotManager
+from logger.udp_sink import UDPSink
+from tracking.host_tracker import HostTracker
+from processing.point_filter import PointFilter, MIN_RANGE, MAX_RANGE, MAX_SPEED
+from planning.cfg_planner import plan_file
+# plotting (matplotlib) is imported only when a plot is requested; see main()
 
 def select_config():
     """Prompts user to select a config file from the config folder."""
@@ -36,57 +46,168 @@ def select_plotting_mode():
     print("\n--- Plotting Mode ---")
     print("1. 2D Plot")
     print("2. 3D Plot")
+    print("3. Range / Noise Profile (needs TLV 2/3, e.g. range_profile.cfg)")
+    print("4. Range-Azimuth / Range-Doppler Heatmaps (needs TLV 4/5 in guiMonitor)")
     
     while True:
-        choice = input("Select mode (1 or 2): ")
+        choice = input("Select mode (1-4): ")
         if choice == '1':
             return '2D'
         elif choice == '2':
             return '3D'
+        elif choice == '3':
+            return 'PROFILE'
+        elif choice == '4':
+            return 'HEATMAP'
         print("Invalid choice. Try again.")
 
-def main():
+def parse_args(argv=None):
+    """
+    Command-line options; defaults may come from a JSON settings file.
+
+    Keys in the --settings file use the option names with underscores, e.g.
+    {"cli_port": "/dev/ttyUSB0", "data_port": "/dev/ttyUSB1", "cfg": "config/AOP_6m_default.cfg",
+     "no_plot": true, "udp": "127.0.0.1:5600"}. Options given on the command
+    line override the file.
+    """
+    pre = argparse.ArgumentParser(add_help=False)
+    pre.add_argument('--settings', help="JSON file with default values for these options")
+    known, _ = pre.parse_known_args(argv)
+
+    ap = argparse.ArgumentParser(parents=[pre],
+                                 description="Radar data acquisition (interactive when run without options).")
+    ap.add_argument('--cfg', help="radar .cfg file (omit to choose from the config folder)")
+    ap.add_argument('--cli-port', default='COM6', help="CLI (config) serial port")
+    ap.add_argument('--data-port', default='COM7', help="data serial port")
+    ap.add_argument('--cli-baud', type=int, default=115200)
+    ap.add_argument('--data-baud', type=int, default=921600)
+    ap.add_argument('--plot', choices=['2D', '3D', 'PROFILE', 'HEATMAP'], type=str.upper,
+                    help="plot mode (omit to be asked)")
+    ap.add_argument('--profile-avg', type=float, metavar='ALPHA',
+                    help="PROFILE mode: exponential averaging weight of each new frame (0-1)")
+    ap.add_argument('--no-plot', action='store_true',
+                    help="headless: never import or open the plotting package")
+    ap.add_argument('--csv-dir', default='output_excel', help="CSV log directory")
+    ap.add_argument('--no-csv', action='store_true', help="don't write the CSV log")
+    ap.add_argument('--udp', metavar='HOST:PORT', help="also send one JSON datagram per frame here")
+    ap.add_argument('--duration', type=float, help="stop after this many seconds")
+    ap.add_argument('--no-filter', action='store_true',
+                    help="pass the point cloud to tracker and sinks unfiltered")
+    ap.add_argument('--min-range', type=float, default=MIN_RANGE)
+    ap.add_argument('--max-range', type=float, default=MAX_RANGE)
+    ap.add_argument('--roi', type=float, nargs=6, metavar=('X0', 'X1', 'Y0', 'Y1', 'Z0', 'Z1'),
+                    help="keep only points inside this box (m)")
+    ap.add_argument('--min-speed', type=float, default=0.0, help="drop points slower than this (m/s)")
+    ap.add_argument('--max-speed', type=float, default=MAX_SPEED)
+    ap.add_argument('--min-snr', type=float, help="drop points below this SNR (dB, needs TLV 7)")
+    ap.add_argument('--keep-static', action='store_true',
+                    help="don't suppress persistent static reflectors")
+    if known.settings:
+        with open(known.settings) as f:
+            ap.set_defaults(**json.load(f))
+    return ap.parse_args(argv)
+
+
+def _on_sigterm(signum, frame):
+    # systemd stops services with SIGTERM; shut down like Ctrl+C
+    raise KeyboardInterrupt
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    interactive = sys.stdin.isatty()
     print("=== Radar Data Acquisition and Plotting Application ===")
-    
-    # Selection Menus
-    config_file = select_config()
-    plot_mode = select_plotting_mode()
-    
+
+    # Selection Menus (only for what the command line left open)
+    config_file = args.cfg
+    if config_file is None:
+        if not interactive:
+            print("No --cfg given and no terminal to ask on. Exiting.")
+            return 2
+        config_file = select_config()
+    plot_mode = None
+    if not args.no_plot:
+        plot_mode = args.plot or (select_plotting_mode() if interactive else None)
+
+    # Check the config against the data link before sending it
+    cfg_plan = plan_file(config_file, baud=args.data_baud)
+    print(f"\nData-link plan for {config_file}:")
+    print(cfg_plan.summary())
+
     # Initialize Modules
-    serial_manager = SerialManager(config_port='COM6', data_port='COM7')
-    parser = FrameParser()
-    logger = CSVLogger()
-    plotter = PlotManager(mode=plot_mode)
-    
+    serial_manager = SerialManager(config_port=args.cli_port, data_port=args.data_port,
+                                   config_baud=args.cli_baud, data_baud=args.data_baud)
+    gui = cfg_plan.model.gui
+    heatmaps = None
+    if gui.get('azimuth_heatmap') or gui.get('doppler_heatmap'):
+        heatmaps = HeatmapDecoder.from_cfg(cfg_plan.model)
+    parser = FrameParser(max_buffer=cfg_plan.buffer_bytes, heatmaps=heatmaps)
+    point_filter = None
+    if not args.no_filter:
+        point_filter = PointFilter(min_range=args.min_range, max_range=args.max_range,
+                                   roi=args.roi, min_speed=args.min_speed,
+                                   max_speed=args.max_speed, min_snr_db=args.min_snr,
+                                   background=not args.keep_static)
+    tracker = HostTracker()
+    sinks = []
+    if not args.no_csv:
+        sinks.append(CSVLogger(output_dir=args.csv_dir))
+    if args.udp:
+        host, port = args.udp.rsplit(':', 1)
+        sinks.append(UDPSink(host, int(port)))
+    plotter = None
+    if plot_mode:
+        from plotting.plot_manager import PlotManager
+        plotter = PlotManager(mode=plot_mode, range_res=cfg_plan.model.range_resolution_m,
+                              avg_alpha=args.profile_avg)
+    else:
+        print("Running headless (no plot).")
+
     # Connect
     if not serial_manager.connect():
         print("Could not connect to radar ports. Exiting.")
-        return
-        
+        return 1
+
+    signal.signal(signal.SIGTERM, _on_sigterm)
     try:
-        # Start Logger
-        logger.start()
+        # Start sinks
+        for sink in sinks:
+            sink.start()
         
         # Send Configuration
         serial_manager.send_config(config_file)
         
         # Start Plotter
-        plotter.start()
+        if plotter:
+            plotter.start()
         
         print("\nRadar is running. Press Ctrl+C to stop.")
         
         # Main Loop
-        while True:
+        first_frame = True
+        t_end = time.time() + args.duration if args.duration else None
+        while t_end is None or time.time() < t_end:
             # Read Raw Data
             raw_data = serial_manager.read_data()
             if raw_data:
                 # Parse Frames
                 frames = parser.parse(raw_data)
+                if frames and first_frame and serial_manager.config_sent_at:
+                    ttff = (time.perf_counter() - serial_manager.config_sent_at) * 1000
+                    print(f"First frame {ttff:.0f} ms after config upload finished.")
+                    first_frame = False
                 for frame in frames:
-                    # Log to CSV
-                    logger.log_frame(frame)
+                    # Drop clutter before it reaches the tracker and the sinks
+                    if point_filter:
+                        point_filter.filter_frame(frame)
+                    # Host-side tracking (OOB firmware sends points only)
+                    frame['targets'] = tracker.update(frame['xyzv'], time.time())
+                    # Log to CSV / UDP
+                    for sink in sinks:
+                        sink.log_frame(frame)
                     # Update Plot
-                    plotter.update(frame)
+                    if plotter:
+                        plotter.update(frame)
             
             time.sleep(0.01) # Small delay to prevent CPU hogging
             
@@ -96,10 +217,17 @@ def main():
         print(f"\nUnexpected error: {e}")
     finally:
         # Clean Shutdown
-        plotter.close()
-        logger.close()
+        if plotter:
+            plotter.close()
+        for sink in sinks:
+            sink.close()
         serial_manager.close()
+        if point_filter:
+            print(point_filter.report())
+        if heatmaps and heatmaps.mismatches:
+            print(f"{heatmaps.mismatches} heatmap TLVs did not match the config's dimensions.")
         print("Application exited cleanly.")
+    return 0
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
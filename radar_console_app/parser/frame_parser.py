@@ -1,15 +1,26 @@
 import struct
 import numpy as np
+from .heatmap_decoder import TLV_RANGE_AZIMUTH, TLV_RANGE_DOPPLER
+
+TLV_DETECTED_POINTS = 1
+TLV_RANGE_PROFILE = 2
+TLV_NOISE_PROFILE = 3
+TLV_SIDE_INFO = 7           # per point: int16 snr, int16 noise, in 0.1 dB
+# Profiles are log2 magnitudes in Q9 (uint16); this scales them to dB
+Q9_TO_DB = 20.0 * np.log10(2.0) / 512.0
 
 class FrameParser:
     """
     Parses radar data frames.
     Handles buffer management and extraction of point cloud data.
     """
-    def __init__(self):
+    def __init__(self, max_buffer=None, heatmaps=None):
         self.buffer = bytearray()
         self.frame_count = 0
         self.MAGIC_WORD = b'\x02\x01\x04\x03\x06\x05\x08\x07'
+        self.max_buffer = max_buffer  # bytes; size with cfg_planner (BandwidthPlan.buffer_bytes)
+        self.overflows = 0
+        self.heatmaps = heatmaps      # HeatmapDecoder; TLV 4/5 are skipped without one
 
     def parse(self, data):
         """
@@ -17,6 +28,12 @@ class FrameParser:
         """
         self.buffer.extend(data)
         frames = []
+
+        if self.max_buffer and len(self.buffer) > self.max_buffer:
+            # Reader fell behind: keep the newest data, resynchronised on a magic word
+            cut = self.buffer.find(self.MAGIC_WORD, len(self.buffer) - self.max_buffer)
+            self.buffer = self.buffer[cut:] if cut != -1 else bytearray()
+            self.overflows += 1
         
         while self.MAGIC_WORD in self.buffer:
             start_idx = self.buffer.find(self.MAGIC_WORD)
@@ -57,11 +74,18 @@ class FrameParser:
             # Total Header Len is typically 36 or 40 depending on version
             version = struct.unpack('<I', frame_data[8:12])[0]
             header_len = 40 if version > 0x01000005 else 36
+            # SDK 3.x (40-byte header): TLV length counts the payload only;
+            # older demos (36-byte header) count the 8-byte TLV header too
+            tlv_len_has_header = header_len == 36
             
             frame_id = struct.unpack('<I', frame_data[20:24])[0]
             num_tlvs = struct.unpack('<I', frame_data[32:36])[0]
             
             points = []
+            xyzv = np.empty((0, 4), dtype=np.float32)
+            profiles = {TLV_RANGE_PROFILE: None, TLV_NOISE_PROFILE: None}
+            range_azimuth = range_doppler = None
+            snr_db = None
             idx = header_len
             
             for _ in range(num_tlvs):
@@ -69,14 +93,34 @@ class FrameParser:
                     break
                     
                 tlv_type, tlv_len = struct.unpack('<II', frame_data[idx:idx+8])
+                payload_len = tlv_len - 8 if tlv_len_has_header else tlv_len
+                if payload_len < 0:
+                    break
+                data_start = idx + 8
+                nbytes = min(payload_len, len(frame_data) - data_start)
                 
-                if tlv_type == 1: # Detected Points
-                    num_points = (tlv_len - 8) // 16
-                    data_start = idx + 8
+                if tlv_type in profiles:
+                    # One uint16 per range bin -> float32 dB in one vector op
+                    q9 = np.frombuffer(frame_data, dtype='<u2', count=nbytes // 2, offset=data_start)
+                    profiles[tlv_type] = q9 * np.float32(Q9_TO_DB)
+
+                if tlv_type == TLV_SIDE_INFO:
+                    n = nbytes // 4
+                    side = np.frombuffer(frame_data, dtype='<i2', count=n * 2, offset=data_start)
+                    snr_db = side[0::2] * np.float32(0.1)
+
+                if self.heatmaps is not None and tlv_type in (TLV_RANGE_AZIMUTH, TLV_RANGE_DOPPLER):
+                    if tlv_type == TLV_RANGE_AZIMUTH:
+                        range_azimuth = self.heatmaps.decode_range_azimuth(frame_data, data_start, nbytes)
+                    else:
+                        range_doppler = self.heatmaps.decode_range_doppler(frame_data, data_start, nbytes)
+
+                if tlv_type == TLV_DETECTED_POINTS:
+                    num_points = nbytes // 16
+                    xyzv = np.frombuffer(frame_data, dtype='<f4', count=num_points * 4,
+                                         offset=data_start).reshape(-1, 4)
                     for i in range(num_points):
                         off = data_start + i * 16
-                        if off + 16 > len(frame_data):
-                            break
                         x, y, z, v = struct.unpack('<ffff', frame_data[off:off+16])
                         points.append({
                             'x': x,
@@ -86,12 +130,18 @@ class FrameParser:
                             'range': np.sqrt(x*x + y*y + z*z)
                         })
                 
-                idx += tlv_len
+                idx = data_start + payload_len
                 
             return {
                 'frame_id': frame_id,
                 'num_points': len(points),
-                'points': points
+                'points': points,
+                'xyzv': xyzv,  # same points as an N x 4 float32 array (x, y, z, v)
+                'range_profile_db': profiles[TLV_RANGE_PROFILE],  # float32 per range bin, or None
+                'noise_profile_db': profiles[TLV_NOISE_PROFILE],
+                'snr_db': snr_db,  # float32 per point (TLV 7), or None
+                'range_azimuth': range_azimuth,  # HeatmapDecoder arrays (reused), or None
+                'range_doppler': range_doppler
             }
         except Exception as e:
             print(f"Frame parsing error: {e}")
@@ -0,0 +1,78 @@
+import numpy as np
+
+TLV_RANGE_AZIMUTH = 4
+TLV_RANGE_DOPPLER = 5
+ANGLE_BINS = 64             # azimuth FFT size for the range-azimuth image
+
+class HeatmapDecoder:
+    """
+    Decodes the range-azimuth (TLV 4) and range-Doppler (TLV 5) heatmaps.
+
+    The TLV payloads are read with np.frombuffer (no copy) and converted
+    into arrays allocated once, so the returned images are the same objects
+    every frame: consumers must use or copy them before the next frame.
+
+    Range-azimuth: per range bin, one complex int16 sample (imag, real) per
+    virtual antenna. The first azimuth_antennas columns are zero-padded to
+    ANGLE_BINS and FFT'd across antennas for all range bins at once; the
+    result is |X| in dB, shaped (range_bins, ANGLE_BINS), angle fftshifted.
+
+    Range-Doppler: uint16 log magnitude per (range, Doppler) bin, shaped
+    (range_bins, doppler_bins) with zero Doppler in the middle.
+
+    nbytes is the TLV payload length (FrameParser resolves the SDK's length
+    convention). A payload that doesn't match the configured dimensions is
+    not decoded and counted in `mismatches` instead.
+    """
+    def __init__(self, range_bins, doppler_bins, virtual_antennas, azimuth_antennas=None,
+                 angle_bins=ANGLE_BINS):
+        self.range_bins = range_bins
+        self.doppler_bins = doppler_bins
+        self.virtual_antennas = virtual_antennas
+        self.azimuth_antennas = azimuth_antennas or virtual_antennas
+        self.angle_bins = angle_bins
+        self._cplx = np.zeros((range_bins, angle_bins), dtype=np.complex64)
+        self.range_azimuth = np.zeros((range_bins, angle_bins), dtype=np.float32)
+        self.range_doppler = np.zeros((range_bins, doppler_bins), dtype=np.float32)
+        self._rd_raw = np.zeros((range_bins, doppler_bins), dtype=np.float32)
+        self.mismatches = 0           # TLVs whose size didn't fit the config
+
+    @classmethod
+    def from_cfg(cls, model):
+        """From a planning.cfg_planner.CfgModel (azimuth = first two TX x RX)."""
+        return cls(model.range_bins, model.doppler_bins, model.num_tx * model.num_rx,
+                   min(model.num_tx, 2) * model.num_rx)
+
+    def decode_range_azimuth(self, buf, offset, nbytes):
+        """Returns the (range_bins, angle_bins) dB image, or None if the TLV size doesn't match."""
+        n = self.range_bins * self.virtual_antennas
+        if nbytes != n * 4:
+            self.mismatches += 1
+            return None
+        iq = np.frombuffer(buf, dtype='<i2', count=n * 2, offset=offset)
+        iq = iq.reshape(self.range_bins, self.virtual_antennas, 2)[:, :self.azimuth_antennas]
+        c = self._cplx
+        c.fill(0)
+        c.real[:, :self.azimuth_antennas] = iq[:, :, 1]
+        c.imag[:, :self.azimuth_antennas] = iq[:, :, 0]
+        spec = np.fft.fft(c, axis=1)
+        mag = np.abs(spec).astype(np.float32, copy=False)
+        np.maximum(mag, 1e-3, out=mag)
+        np.log10(mag, out=mag)
+        mag *= 20.0
+        self.range_azimuth[:] = np.fft.fftshift(mag, axes=1)
+        return self.range_azimuth
+
+    def decode_range_doppler(self, buf, offset, nbytes):
+        """Returns the (range_bins, doppler_bins) image, or None if the TLV size doesn't match."""
+        n = self.range_bins * self.doppler_bins
+        if nbytes != n * 2:
+            self.mismatches += 1
+            return None
+        raw = np.frombuffer(buf, dtype='<u2', count=n, offset=offset)
+        self._rd_raw[:] = raw.reshape(self.range_bins, self.doppler_bins)
+        half = self.doppler_bins // 2
+        # fftshift along Doppler without a temporary
+        self.range_doppler[:, :self.doppler_bins - half] = self._rd_raw[:, half:]
+        self.range_doppler[:, self.doppler_bins - half:] = self._rd_raw[:, :half]
+        return self.range_doppler
@@ -0,0 +1,252 @@
+"""
+Data-link bandwidth planner for mmWave .cfg files.
+
+Estimates the UART bytes per frame for the TLVs a config enables, compares
+the resulting rate with the data-port capacity and suggests the highest
+frame rate that fits. Run from radar_console_app:
+
+    python planning/cfg_planner.py config/*.cfg [--points 200] [--baud 921600]
+"""
+import argparse
+import math
+
+UART_BAUD = 921600
+UART_BITS_PER_BYTE = 10     # 8N1: start + 8 data + stop
+LINK_HEADROOM = 0.8         # plan for at most this share of the raw link
+OOB_HEADER = 40             # mmw demo frame header (bytes)
+TRACKING_HEADER = 48        # People Tracking frame header (bytes)
+TLV_HEADER = 8
+PACKET_ALIGN = 32           # mmw demo pads every packet to a multiple of this
+TYPICAL_POINTS = 100        # expected detections per frame (rate check)
+TYPICAL_TRACKS = 5          # expected tracked people per frame (rate check)
+OOB_MAX_POINTS = 500        # mmw demo detection limit (worst case, buffer sizing)
+BUFFER_FRAMES = 4           # parser buffer holds this many worst-case frames
+BUFFER_ALIGN = 4096
+HEATMAP_TLVS = (4, 5)       # range-azimuth, range-Doppler
+
+COMMENT_PREFIXES = ("%", "#")
+SPEED_OF_LIGHT = 299792458.0
+
+
+def _next_pow2(n):
+    return 1 << max(int(math.ceil(math.log2(max(n, 1)))), 0)
+
+
+def _bits(mask):
+    return bin(int(mask) & 0xFF).count('1')
+
+
+class CfgModel:
+    """
+    The parts of a .cfg that decide how much data each frame carries.
+
+    Attributes:
+        num_rx, num_tx (int): enabled antennas (channelCfg masks).
+        adc_samples, range_bins (int): profileCfg samples, padded to a power of two.
+        range_resolution_m (float): range per FFT bin (profileCfg slope and sample rate).
+        chirps, doppler_bins (int): chirps per frame; loops padded to a power of two.
+        frame_period_ms (float): frameCfg periodicity.
+        gui (dict): guiMonitor output switches (OOB demo); empty when absent.
+        tracking (bool): People Tracking firmware (trackingCfg present).
+        max_points, max_tracks (int or None): trackingCfg limits.
+    """
+    def __init__(self):
+        self.num_rx = 4
+        self.num_tx = 1
+        self.adc_samples = 256
+        self.range_bins = 256
+        self.range_resolution_m = None
+        self.chirps = 1
+        self.doppler_bins = 1
+        self.frame_period_ms = 100.0
+        self.gui = {}
+        self.tracking = False
+        self.max_points = None
+        self.max_tracks = None
+
+    @classmethod
+    def from_file(cls, path):
+        with open(path, 'r') as f:
+            return cls.from_text(f.read())
+
+    @classmethod
+    def from_text(cls, cfg_text):
+        m = cls()
+        for line in cfg_text.splitlines():
+            parts = line.split()
+            if not parts or parts[0].startswith(COMMENT_PREFIXES):
+                continue
+            cmd, args = parts[0], parts[1:]
+            if cmd == 'channelCfg' and len(args) >= 2:
+                m.num_rx, m.num_tx = _bits(args[0]), _bits(args[1])
+            elif cmd == 'profileCfg' and len(args) >= 11:
+                m.adc_samples = int(float(args[9]))
+                m.range_bins = _next_pow2(m.adc_samples)
+                slope_hz_s = float(args[7]) * 1e12          # MHz/us
+                fs_hz = float(args[10]) * 1e3                # ksps
+                if slope_hz_s > 0:
+                    m.range_resolution_m = SPEED_OF_LIGHT * fs_hz / (2 * slope_hz_s * m.range_bins)
+            elif cmd == 'frameCfg' and len(args) >= 5:
+                start, end, loops = int(args[0]), int(args[1]), int(args[2])
+                m.chirps = (end - start + 1) * loops
+                m.doppler_bins = _next_pow2(loops)
+                m.frame_period_ms = float(args[4])
+            elif cmd == 'guiMonitor' and len(args) >= 7:
+                flags = [int(a) for a in args[1:7]]
+                m.gui = dict(zip(('detected_objects', 'range_profile', 'noise_profile',
+                                  'azimuth_heatmap', 'doppler_heatmap', 'stats'), flags))
+            elif cmd == 'trackingCfg' and len(args) >= 4:
+                m.tracking = int(args[0]) == 1
+                m.max_points, m.max_tracks = int(args[2]), int(args[3])
+        return m
+
+    @property
+    def fps(self):
+        return 1000.0 / self.frame_period_ms if self.frame_period_ms > 0 else 0.0
+
+
+class BandwidthPlan:
+    """
+    Result of plan(): per-TLV sizes, link utilisation and recommendations.
+
+    Attributes:
+        tlvs (list): (tlv type, name, bytes per frame) at the expected load.
+        bytes_per_frame (int): header + TLVs, padded like the firmware does.
+        worst_bytes_per_frame (int): the same with the point / track limits reached.
+        bytes_per_s, capacity_bytes_per_s (float)
+        utilisation (float): bytes_per_s / capacity (1.0 = link full).
+        max_safe_fps (float): highest frame rate within LINK_HEADROOM.
+        suggested_period_ms (int or None): frameCfg period to use, None if the current one fits.
+        buffer_bytes (int): parser buffer size for BUFFER_FRAMES worst-case frames.
+        warnings (list): human-readable problems.
+    """
+    def __init__(self, model, tlvs, worst_tlvs, header, baud):
+        self.model = model
+        self.tlvs = tlvs
+        self.bytes_per_frame = self._frame_bytes(tlvs, header)
+        self.worst_bytes_per_frame = self._frame_bytes(worst_tlvs, header)
+        self.bytes_per_s = self.bytes_per_frame * model.fps
+        self.capacity_bytes_per_s = baud / UART_BITS_PER_BYTE
+        self.utilisation = self.bytes_per_s / self.capacity_bytes_per_s
+        self.max_safe_fps = self.capacity_bytes_per_s * LINK_HEADROOM / self.bytes_per_frame
+        self.suggested_period_ms = None
+        self.warnings = []
+        if model.fps > self.max_safe_fps:
+            self.suggested_period_ms = int(math.ceil(1000.0 / self.max_safe_fps))
+            self.warnings.append(
+                f"{self.bytes_per_s / 1000:.1f} kB/s needs {self.utilisation:.0%} of the "
+                f"{baud}-baud link; frames will be dropped. Use frameCfg period >= "
+                f"{self.suggested_period_ms} ms ({self.max_safe_fps:.1f} fps) or disable outputs.")
+        heatmap_bytes = sum(TLV_HEADER + size for tlv, _, size in tlvs if tlv in HEATMAP_TLVS)
+        budget = self.capacity_bytes_per_s * LINK_HEADROOM
+        if heatmap_bytes and heatmap_bytes * model.fps > budget:
+            without = self._frame_bytes([t for t in tlvs if t[0] not in HEATMAP_TLVS], header)
+            self.warnings.append(
+                f"heatmaps (TLV 4/5) alone need {heatmap_bytes * model.fps / 1000:.1f} kB/s of the "
+                f"{budget / 1000:.1f} kB/s budget; with them at most {self.max_safe_fps:.1f} fps, "
+                f"without them {budget / without:.1f} fps (guiMonitor azimuth/Doppler heatmap = 0).")
+        worst = self.worst_bytes_per_frame * model.fps / self.capacity_bytes_per_s
+        if self.ok and worst > 1.0:
+            self.warnings.append(
+                f"fits at the expected load, but frames at the point/track limits need "
+                f"{worst:.0%} of the link; bursts will drop frames.")
+        self.buffer_bytes = -(-BUFFER_FRAMES * self.worst_bytes_per_frame // BUFFER_ALIGN) \
+            * BUFFER_ALIGN
+
+    def _frame_bytes(self, tlvs, header):
+        raw = header + sum(TLV_HEADER + size for _, _, size in tlvs)
+        return raw if self.model.tracking else -(-raw // PACKET_ALIGN) * PACKET_ALIGN
+
+    @property
+    def ok(self):
+        return self.suggested_period_ms is None
+
+    def summary(self):
+        m = self.model
+        lines = [f"  frame {m.frame_period_ms:g} ms ({m.fps:.1f} fps), "
+                 f"{m.range_bins} range x {m.doppler_bins} Doppler bins, "
+                 f"{m.num_tx} TX x {m.num_rx} RX"]
+        for tlv, name, size in self.tlvs:
+            lines.append(f"    TLV {tlv:>4}  {name:<22} {size:>7} B")
+        lines.append(f"  {self.bytes_per_frame} B/frame -> {self.bytes_per_s / 1000:.1f} kB/s "
+                     f"of {self.capacity_bytes_per_s / 1000:.1f} kB/s ({self.utilisation:.0%}); "
+                     f"max safe {self.max_safe_fps:.1f} fps")
+        lines.append(f"  worst case {self.worst_bytes_per_frame} B/frame; "
+                     f"parser buffer {self.buffer_bytes} B")
+        for w in self.warnings:
+            lines.append(f"  WARNING: {w}")
+        return "\n".join(lines)
+
+
+def _tlv_sizes(model, points, tracks):
+    """(tlv type, name, bytes) for the outputs the config enables."""
+    if model.tracking:
+        return [(1020, 'compressed points', 20 + 8 * points),
+                (1010, 'target list', 112 * tracks),
+                (1011, 'target index', points),
+                (1012, 'target height', 12 * tracks),
+                (1021, 'presence', 4)]
+
+    g = model.gui or {'detected_objects': 1}
+    rb, virt = model.range_bins, model.num_tx * model.num_rx
+    tlvs = []
+    if g.get('detected_objects'):
+        tlvs.append((1, 'detected points', 16 * points))
+        if g['detected_objects'] == 1:
+            tlvs.append((7, 'point side info', 4 * points))
+    if g.get('range_profile'):
+        tlvs.append((2, 'range profile', 2 * rb))
+    if g.get('noise_profile'):
+        tlvs.append((3, 'noise profile', 2 * rb))
+    if g.get('azimuth_heatmap'):
+        tlvs.append((4, 'range-azimuth heatmap', 4 * rb * virt))
+    if g.get('doppler_heatmap'):
+        tlvs.append((5, 'range-Doppler heatmap', 2 * rb * model.doppler_bins))
+    if g.get('stats'):
+        tlvs.append((6, 'stats', 24))
+    return tlvs
+
+
+def plan(model, points=None, baud=UART_BAUD):
+    """
+    Estimates the data-port load of a config.
+
+    Args:
+        model (CfgModel): parsed config.
+        points (int): expected points per frame (default TYPICAL_POINTS).
+        baud (int): data-port baud rate.
+
+    Returns:
+        BandwidthPlan: rate check at the expected load; buffer sized for the
+        worst case (trackingCfg limits, or OOB_MAX_POINTS).
+    """
+    max_points = model.max_points or OOB_MAX_POINTS
+    max_tracks = model.max_tracks or 0
+    n = min(points if points is not None else TYPICAL_POINTS, max_points)
+    tlvs = _tlv_sizes(model, n, min(TYPICAL_TRACKS, max_tracks))
+    worst = _tlv_sizes(model, max_points, max_tracks)
+    header = TRACKING_HEADER if model.tracking else OOB_HEADER
+    return BandwidthPlan(model, tlvs, worst, header, baud)
+
+
+def plan_file(path, points=None, baud=UART_BAUD):
+    return plan(CfgModel.from_file(path), points, baud)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Check .cfg files against data-link bandwidth.")
+    ap.add_argument('cfg', nargs='+')
+    ap.add_argument('--points', type=int, help="expected points per frame")
+    ap.add_argument('--baud', type=int, default=UART_BAUD)
+    args = ap.parse_args(argv)
+    bad = 0
+    for path in args.cfg:
+        p = plan_file(path, args.points, args.baud)
+        print(f"{path}: {'OK' if p.ok else 'OVER BUDGET'}")
+        print(p.summary())
+        bad += not p.ok
+    return 1 if bad else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,101 @@
+import matplotlib.pyplot as plt
+
+CLIM_STEP = 0.2             # rescale colours when min/max move this share of the colour span
+
+class HeatmapPlot:
+    """
+    Live range-azimuth and range-Doppler images.
+
+    Each image is one persistent, animated AxesImage. A frame replaces its
+    pixel data and blits only that axes over a cached background; the axes,
+    ticks and colour bars are not redrawn. Images whose TLV is absent from
+    a frame are left untouched.
+
+    The colour limits stay fixed while the data range drifts by less than
+    CLIM_STEP of the colour span. Changing them updates the colour bar, so
+    that (and a new image shape) is the one case that does a full redraw,
+    which also re-caches the backgrounds.
+    """
+    def __init__(self, range_res=None):
+        self.range_res = range_res
+        plt.ion()
+        self.fig, (self.ax_ra, self.ax_rd) = plt.subplots(1, 2, figsize=(12, 5))
+        self._views = {}      # frame key -> [axes, image, (clim lo, clim hi), shape]
+        for key, ax, title, xlabel in (
+                ('range_azimuth', self.ax_ra, "Range-Azimuth", "Azimuth bin"),
+                ('range_doppler', self.ax_rd, "Range-Doppler", "Doppler bin")):
+            ax.set_title(title)
+            ax.set_xlabel(xlabel)
+            ax.set_ylabel("Range (m)" if range_res else "Range bin")
+            self._views[key] = [ax, None, None, None]
+        self._background = {}
+        self.fig.canvas.mpl_connect('draw_event', self._on_draw)
+        plt.show(block=False)
+
+    def _on_draw(self, event):
+        # Full redraw (first show, rescale, resize): animated images are not
+        # part of it, so this is exactly what lies behind them
+        self._background = {key: self.fig.canvas.copy_from_bbox(v[0].bbox)
+                            for key, v in self._views.items()}
+
+    def _create(self, view, data):
+        ax = view[0]
+        rows, cols = data.shape
+        top = rows * self.range_res if self.range_res else rows
+        lo, hi = self._limits(data)
+        view[1] = ax.imshow(data, origin='lower', aspect='auto', cmap='viridis',
+                            interpolation='nearest', extent=(0, cols, 0, top),
+                            vmin=lo, vmax=hi, animated=True)
+        view[2] = (lo, hi)
+        view[3] = data.shape
+        self.fig.colorbar(view[1], ax=ax)
+
+    @staticmethod
+    def _limits(data):
+        lo, hi = float(data.min()), float(data.max())
+        return lo, (hi if hi > lo else lo + 1.0)
+
+    def _rescale(self, view, data):
+        """Moves the colour limits if the data left them by more than CLIM_STEP; True if moved."""
+        clo, chi = view[2]
+        lo, hi = self._limits(data)
+        step = CLIM_STEP * (chi - clo)
+        if abs(lo - clo) <= step and abs(hi - chi) <= step:
+            return False
+        view[2] = (lo, hi)
+        view[1].set_clim(lo, hi)
+        return True
+
+    def update(self, parsed_frame):
+        """Uploads the heatmaps present in this frame and blits their axes."""
+        canvas = self.fig.canvas
+        shown = []
+        full_redraw = False
+        for key, view in self._views.items():
+            data = parsed_frame.get(key)
+            if data is None:
+                continue
+            if view[1] is None or view[3] != data.shape:
+                if view[1] is not None:
+                    view[1].colorbar.remove()
+                    view[1].remove()
+                self._create(view, data)
+                full_redraw = True
+            else:
+                view[1].set_data(data)
+                full_redraw |= self._rescale(view, data)
+            shown.append((key, view))
+        if not shown:
+            return
+        if full_redraw:
+            canvas.draw()             # _on_draw re-caches the backgrounds
+        for key, (ax, img, _, _) in shown:
+            if key in self._background:
+                canvas.restore_region(self._background[key])
+            ax.draw_artist(img)
+            canvas.blit(ax.bbox)
+        # Process GUI events only: plt.pause() would also redraw a stale figure in full
+        canvas.flush_events()
+
+    def close(self):
+        plt.close(self.fig)
@@ -1,13 +1,19 @@
+import numpy as np
 import matplotlib.pyplot as plt
+from radar_common.point_history import PointHistory, TRAIL_FRAMES
 
 class Plot2D:
     """
     Handles 2D scatter plotting for radar data.
     """
-    def __init__(self):
+    def __init__(self, trail_frames=TRAIL_FRAMES):
+        self.trail = PointHistory(trail_frames, cols=2)
+        self._colors = np.zeros((self.trail.frames * self.trail.max_points, 4))
+        self._colors[:, 0] = 1.0  # red, alpha set per point from frame age
         plt.ion()
         self.fig, self.ax = plt.subplots(figsize=(7, 7))
         self.scatter = self.ax.scatter([], [], s=20, c='r')
+        self.track_scatter = self.ax.scatter([], [], s=120, c='lime', marker='^', edgecolors='k')
 
         self.ax.set_xlim(-6, 6)
         self.ax.set_ylim(0, 10)
@@ -19,14 +25,17 @@ class Plot2D:
 
     def update(self, parsed_frame):
         """Updates the plot with new frame data."""
-        points = parsed_frame.get('points', [])
-        if not points:
-            return
+        self.trail.push(parsed_frame['xyzv'])      # only x, y are kept (cols=2)
+        xy, age_alpha = self.trail.merged()
 
-        xs = [p['x'] for p in points]
-        ys = [p['y'] for p in points]
-        
-        self.scatter.set_offsets(list(zip(xs, ys)))
+        colors = self._colors[:len(xy)]
+        colors[:, 3] = age_alpha
+        self.scatter.set_offsets(xy)
+        self.scatter.set_facecolors(colors)
+
+        targets = parsed_frame.get('targets', [])
+        self.track_scatter.set_offsets(
+            np.array([(t['x'], t['y']) for t in targets], dtype=np.float32).reshape(-1, 2))
         
         self.fig.canvas.draw()
         self.fig.canvas.flush_events()
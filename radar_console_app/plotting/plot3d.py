@@ -1,11 +1,16 @@
+import numpy as np
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
+from radar_common.point_history import PointHistory, TRAIL_FRAMES
 
 class Plot3D:
     """
     Handles 3D scatter plotting for radar data.
     """
-    def __init__(self):
+    def __init__(self, trail_frames=TRAIL_FRAMES):
+        self.trail = PointHistory(trail_frames, cols=3)
+        self._colors = np.zeros((self.trail.frames * self.trail.max_points, 4))
+        self._colors[:, 2] = 1.0  # blue, alpha set per point from frame age
         plt.ion()
         self.fig = plt.figure(figsize=(8, 8))
         self.ax = self.fig.add_subplot(111, projection='3d')
@@ -19,30 +24,27 @@ class Plot3D:
         self.ax.set_zlabel('Z (meters)')
         self.ax.set_title('Live Radar Detected Points (3D)')
         
-        self.scatter = self.ax.scatter([], [], [], s=20, c='b')
+        # Persistent artists: update() moves them, it never rebuilds the axes
+        self.scatter = self.ax.scatter([], [], [], s=20, c='b', depthshade=False)
+        self.track_scatter = self.ax.scatter([], [], [], s=120, c='lime', marker='^',
+                                             depthshade=False)
         plt.show(block=False)
 
     def update(self, parsed_frame):
         """Updates the plot with new frame data."""
-        points = parsed_frame.get('points', [])
-        if not points:
-            return
+        self.trail.push(parsed_frame['xyzv'])      # extra columns (v) are ignored
+        xyz, age_alpha = self.trail.merged()
 
-        xs = [p['x'] for p in points]
-        ys = [p['y'] for p in points]
-        zs = [p['z'] for p in points]
+        colors = self._colors[:len(xyz)]
+        colors[:, 3] = age_alpha
+        self.scatter._offsets3d = (xyz[:, 0], xyz[:, 1], xyz[:, 2])
+        self.scatter.set_facecolors(colors)
+
+        targets = parsed_frame.get('targets', [])
+        self.track_scatter._offsets3d = ([t['x'] for t in targets], [t['y'] for t in targets],
+                                         [t['z'] for t in targets])
+        self.track_scatter.set_visible(bool(targets))
 
-        self.ax.cla()
-        self.ax.set_xlim(-6, 6)
-        self.ax.set_ylim(0, 10)
-        self.ax.set_zlim(-3, 3)
-        self.ax.set_xlabel('X (meters)')
-        self.ax.set_ylabel('Y (meters)')
-        self.ax.set_zlabel('Z (meters)')
-        self.ax.set_title('Live Radar Detected Points (3D)')
-        
-        self.ax.scatter(xs, ys, zs, s=20, c='b')
-        
         self.fig.canvas.draw()
         self.fig.canvas.flush_events()
         plt.pause(0.001)
@@ -1,22 +1,27 @@
-from .plot2d import Plot2D
-from .plot3d import Plot3D
-
 class PlotManager:
     """
     Manages plotting mode selection and delegation.
     """
-    def __init__(self, mode='2D'):
+    def __init__(self, mode='2D', **plot_options):
         self.mode = mode.upper()
+        self.plot_options = plot_options  # passed to plotters that take them (PROFILE, HEATMAP)
         self.plotter = None
 
     def start(self):
-        """Initializes the selected plotter."""
-        if self.mode == '2D':
-            self.plotter = Plot2D()
-        elif self.mode == '3D':
+        """Initializes the selected plotter (only its backend modules get imported)."""
+        if self.mode == '3D':
+            from .plot3d import Plot3D
             self.plotter = Plot3D()
+        elif self.mode == 'PROFILE':
+            from .profile_plot import ProfilePlot
+            self.plotter = ProfilePlot(**self.plot_options)
+        elif self.mode == 'HEATMAP':
+            from .heatmap_plot import HeatmapPlot
+            self.plotter = HeatmapPlot(range_res=self.plot_options.get('range_res'))
         else:
-            print(f"Unknown plotting mode: {self.mode}. Defaulting to 2D.")
+            if self.mode != '2D':
+                print(f"Unknown plotting mode: {self.mode}. Defaulting to 2D.")
+            from .plot2d import Plot2D
             self.plotter = Plot2D()
 
     def update(self, parsed_frame):
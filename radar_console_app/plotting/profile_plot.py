@@ -0,0 +1,86 @@
+import numpy as np
+import matplotlib.pyplot as plt
+
+class ProfilePlot:
+    """
+    Live 1D plot of the range profile (TLV 2) and noise profile (TLV 3).
+
+    Each line owns a preallocated float32 buffer that is updated in place
+    and handed to the same Line2D every frame, so nothing is reallocated
+    while streaming. With avg_alpha set, each buffer is an exponential
+    moving average over frames (avg += alpha * (new - avg)).
+    """
+    def __init__(self, range_res=None, avg_alpha=None):
+        self.range_res = range_res
+        self.avg_alpha = avg_alpha
+        self._bufs = {}       # frame key -> float32 buffer shown by the line
+        self._lines = {}
+        self._ylim = None     # (lo, hi) once a profile has been shown
+        plt.ion()
+        self.fig, self.ax = plt.subplots(figsize=(9, 5))
+        self.ax.set_xlabel("Range (m)" if range_res else "Range bin")
+        self.ax.set_ylabel("Magnitude (dB)")
+        title = "Range / Noise Profile"
+        if avg_alpha:
+            title += f" (averaged, alpha={avg_alpha:g})"
+        self.ax.set_title(title)
+        self.ax.grid(True)
+        for key, label, color in (('range_profile_db', 'range profile', 'tab:blue'),
+                                  ('noise_profile_db', 'noise profile', 'tab:gray')):
+            self._lines[key], = self.ax.plot([], [], color=color, lw=1.2, label=label)
+            self._lines[key].set_visible(False)     # until its profile first arrives
+        self.ax.legend(loc='upper right')
+        plt.show(block=False)
+
+    def _setup(self, key, n):
+        """(Re)allocates one line's buffer and x axis for n range bins."""
+        x = np.arange(n, dtype=np.float32)
+        if self.range_res:
+            x *= self.range_res
+        self._bufs[key] = np.zeros(n, dtype=np.float32)
+        line = self._lines[key]
+        line.set_data(x, self._bufs[key])
+        line.set_visible(False)
+        # x range covers the longest profile shown
+        xmax = max(len(b) for b in self._bufs.values()) - 1
+        self.ax.set_xlim(0, (xmax * self.range_res if self.range_res else xmax) if xmax > 0 else 1)
+
+    def update(self, parsed_frame):
+        """Copies the frame's profiles into the line buffers and redraws."""
+        changed = False
+        for key, line in self._lines.items():
+            prof = parsed_frame.get(key)
+            if prof is None or len(prof) == 0:
+                continue
+            buf = self._bufs.get(key)
+            if buf is None or len(prof) != len(buf):
+                self._setup(key, len(prof))
+                buf = self._bufs[key]
+            if self.avg_alpha and line.get_visible():
+                buf += self.avg_alpha * (prof - buf)
+            else:
+                np.copyto(buf, prof)
+            line.set_ydata(buf)
+            line.set_visible(True)
+            changed = True
+        if not changed:
+            return
+
+        # Fit the y range to the first data, then only widen it (never shrink:
+        # no jitter); profiles that never arrived don't count
+        shown = [self._bufs[k] for k, l in self._lines.items() if k in self._bufs and l.get_visible()]
+        lo = min(float(b.min()) for b in shown)
+        hi = max(float(b.max()) for b in shown)
+        if self._ylim is None:
+            self._ylim = (lo - 5, hi + 5)
+            self.ax.set_ylim(*self._ylim)
+        elif lo < self._ylim[0] or hi > self._ylim[1]:
+            self._ylim = (min(lo - 5, self._ylim[0]), max(hi + 5, self._ylim[1]))
+            self.ax.set_ylim(*self._ylim)
+
+        self.fig.canvas.draw()
+        self.fig.canvas.flush_events()
+        plt.pause(0.001)
+
+    def close(self):
+        plt.close(self.fig)
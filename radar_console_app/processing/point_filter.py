@@ -0,0 +1,146 @@
+import numpy as np
+
+MIN_RANGE = 0.2             # m, closer points are antenna leakage / mounting
+MAX_RANGE = 10.0            # m
+MAX_SPEED = 8.0             # m/s, faster than anything indoors (aliasing, interference)
+STATIC_SPEED = 0.05         # m/s, |v| below this counts as static for the background model
+BG_CELL = 0.15              # m, background grid cell (x-y)
+BG_DECAY = 0.9              # per-frame decay of the static score
+BG_THRESHOLD = 5.0          # score at which a cell is background (~7 consecutive frames)
+
+STAGES = ('range', 'roi', 'velocity', 'snr', 'static')
+
+
+class PointFilter:
+    """
+    Per-frame point-cloud filter between the parser and the sinks.
+
+    Stages (each drops points; a point is counted against the first stage
+    that rejects it):
+        range:    non-finite points and points outside [min_range, max_range].
+        roi:      points outside the roi box (x0, x1, y0, y1, z0, z1), if set.
+        velocity: |v| below min_speed or above max_speed.
+        snr:      SNR below min_snr_db, when the frame carries side info (TLV 7).
+        static:   static points (|v| < STATIC_SPEED) in x-y cells that held a
+                  static point in most recent frames. Each cell keeps a score
+                  score = score * BG_DECAY + hit, so a reflector becomes
+                  background after a few frames and is released again a few
+                  frames after it disappears. A person standing perfectly
+                  still long enough is suppressed too; the tracker coasts
+                  over that (see HostTracker max_misses).
+
+    All stages are vectorized over the frame. Counts per stage accumulate
+    in `dropped`; report() summarises them.
+    """
+    def __init__(self, min_range=MIN_RANGE, max_range=MAX_RANGE, roi=None, min_speed=0.0,
+                 max_speed=MAX_SPEED, min_snr_db=None, background=True,
+                 cell=BG_CELL, decay=BG_DECAY, threshold=BG_THRESHOLD):
+        self.min_range = min_range
+        self.max_range = max_range
+        self.roi = roi
+        self.min_speed = min_speed
+        self.max_speed = max_speed
+        self.min_snr_db = min_snr_db
+        self.background = background
+        self.cell = cell
+        self.decay = decay
+        self.threshold = threshold
+        # Background grid covers the x-y square within max_range
+        self._half = int(np.ceil(max_range / cell))
+        self._score = np.zeros((2 * self._half + 1, 2 * self._half + 1), dtype=np.float32)
+        self._hit = np.zeros_like(self._score)
+        self.frames = 0
+        self.points_in = 0
+        self.points_out = 0
+        self.dropped = dict.fromkeys(STAGES, 0)
+
+    def reset(self):
+        """Forgets the background and the counters (e.g. after moving the sensor)."""
+        self._score.fill(0)
+        self.frames = self.points_in = self.points_out = 0
+        self.dropped = dict.fromkeys(STAGES, 0)
+
+    def apply(self, xyzv, snr_db=None):
+        """
+        Args:
+            xyzv (np.ndarray): N x 4 points (x, y, z, v).
+            snr_db (np.ndarray or None): N SNR values (TLV 7), or None to skip the SNR gate.
+
+        Returns:
+            np.ndarray: boolean keep mask of length N.
+        """
+        n = len(xyzv)
+        self.frames += 1
+        self.points_in += n
+        keep = np.ones(n, dtype=bool)
+        if n:
+            xyz, v = xyzv[:, :3], xyzv[:, 3]
+            r2 = np.einsum('ij,ij->i', xyz, xyz)
+            self._gate('range', keep, np.isfinite(r2) & np.isfinite(v)
+                       & (r2 >= self.min_range ** 2) & (r2 <= self.max_range ** 2))
+            if self.roi is not None:
+                x0, x1, y0, y1, z0, z1 = self.roi
+                self._gate('roi', keep, (xyz[:, 0] >= x0) & (xyz[:, 0] <= x1)
+                           & (xyz[:, 1] >= y0) & (xyz[:, 1] <= y1)
+                           & (xyz[:, 2] >= z0) & (xyz[:, 2] <= z1))
+            speed = np.abs(v)
+            self._gate('velocity', keep, (speed >= self.min_speed) & (speed <= self.max_speed))
+            if self.min_snr_db is not None and snr_db is not None and len(snr_db) == n:
+                self._gate('snr', keep, snr_db >= self.min_snr_db)
+        if self.background:
+            self._background(xyzv, keep)
+        self.points_out += int(keep.sum())
+        return keep
+
+    def _gate(self, stage, keep, ok):
+        cut = keep & ~ok
+        self.dropped[stage] += int(cut.sum())
+        keep &= ok
+
+    def _background(self, xyzv, keep):
+        # Judge against the score from earlier frames, then add this frame's static hits
+        self._score *= self.decay
+        if not keep.any():
+            return
+        pts = xyzv[keep]
+        static = np.abs(pts[:, 3]) < STATIC_SPEED
+        ij = np.floor(pts[:, :2] / self.cell).astype(np.intp) + self._half
+        bg = static & (self._score[ij[:, 0], ij[:, 1]] >= self.threshold)
+        self._hit.fill(0)
+        self._hit[ij[static, 0], ij[static, 1]] = 1.0   # once per cell per frame
+        self._score += self._hit
+        if bg.any():
+            idx = np.flatnonzero(keep)
+            keep[idx[bg]] = False
+            self.dropped['static'] += int(bg.sum())
+
+    def filter_frame(self, frame):
+        """Filters a FrameParser frame in place ('xyzv', 'points', 'num_points', 'snr_db')."""
+        keep = self.apply(frame['xyzv'], frame.get('snr_db'))
+        if keep.all():
+            return frame
+        frame['xyzv'] = frame['xyzv'][keep]
+        if frame.get('points') is not None and len(frame['points']) == len(keep):
+            frame['points'] = [p for p, k in zip(frame['points'], keep) if k]
+        if frame.get('snr_db') is not None and len(frame['snr_db']) == len(keep):
+            frame['snr_db'] = frame['snr_db'][keep]
+        frame['num_points'] = len(frame['xyzv'])
+        return frame
+
+    @property
+    def kept_ratio(self):
+        return self.points_out / self.points_in if self.points_in else 1.0
+
+    def stats(self):
+        """Counters as a plain dict (JSON-friendly)."""
+        return {'frames': self.frames, 'points_in': self.points_in,
+                'points_out': self.points_out, 'dropped': dict(self.dropped)}
+
+    def report(self):
+        lines = [f"point filter: {self.frames} frames, {self.points_in} points in, "
+                 f"{self.points_out} kept ({self.kept_ratio:.0%})"]
+        for stage in STAGES:
+            if self.dropped[stage]:
+                lines.append(f"  {stage:<9} dropped {self.dropped[stage]:>8} "
+                             f"({self.dropped[stage] / self.points_in:.0%})")
+        return "\n".join(lines)
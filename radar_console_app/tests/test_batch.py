@@ -0,0 +1,45 @@
+import csv
+import os
+import shutil
+import sys
+
+# Run from radar_console_app (python -m pytest tests) or from anywhere else
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, APP_DIR)
+
+from batch import process_session, session_names, write_index, build_params, parse_args
+from processing.point_filter import STAGES
+
+SAMPLE_CSV = os.path.join(APP_DIR, 'output_excel', 'radar_output_20260213_164918.csv')
+
+
+def test_session_names_are_unique():
+    root = os.path.join('caps')
+    paths = [os.path.join(root, 'day1', 'run.csv'), os.path.join(root, 'day2', 'run.csv'),
+             os.path.join(root, 'run.bin'), os.path.join(root, 'run.csv')]
+    names = session_names(paths, root)
+    assert names[paths[0]] == 'day1__run' and names[paths[1]] == 'day2__run'
+    assert {names[paths[2]], names[paths[3]]} == {'run', 'run_2'}
+
+
+def test_same_stem_sessions_keep_separate_summaries(tmp_path):
+    caps, out = tmp_path / 'caps', tmp_path / 'out'
+    paths = []
+    for day in ('day1', 'day2'):
+        (caps / day).mkdir(parents=True)
+        paths.append(str(caps / day / 'run.csv'))
+        shutil.copy(SAMPLE_CSV, paths[-1])
+    out.mkdir()
+    params = build_params(parse_args([str(caps)]))
+    names = session_names(paths, str(caps))
+    summaries = [process_session(p, str(out), params, names[p]) for p in paths]
+
+    assert sorted(os.listdir(out)) == ['day1__run.json', 'day2__run.json']
+    write_index(str(out), summaries)
+    with open(out / 'sessions.csv', newline='') as f:
+        rows = list(csv.DictReader(f))
+    assert [r['session'] for r in rows] == ['day1__run', 'day2__run']
+    for stage in STAGES:
+        assert rows[0][f'dropped_{stage}'].isdigit()
+    assert not any(v.startswith('{') for v in rows[0].values())
+    assert rows[0]['frames'] == rows[1]['frames'] != '0'
@@ -0,0 +1,80 @@
+import os
+import sys
+
+import pytest
+
+# Run from radar_console_app (python -m pytest tests) or from anywhere else
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, APP_DIR)
+
+from planning.cfg_planner import (CfgModel, plan, plan_file, main, BUFFER_FRAMES,
+                                  BUFFER_ALIGN, PACKET_ALIGN, LINK_HEADROOM)
+
+
+def cfg_path(name):
+    return os.path.join(APP_DIR, 'config', name)
+
+
+def test_parses_oob_cfg():
+    m = CfgModel.from_file(cfg_path('awr1843.cfg'))
+    assert (m.num_tx, m.num_rx) == (3, 4)
+    assert (m.adc_samples, m.range_bins, m.doppler_bins, m.chirps) == (256, 256, 16, 32)
+    assert m.fps == pytest.approx(20.0)
+    assert not m.tracking and m.gui['azimuth_heatmap'] == 1
+    # c * fs / (2 * slope * N) = 3e8 * 5 Msps / (2 * 70 MHz/us * 256)
+    assert m.range_resolution_m == pytest.approx(0.0418, abs=1e-3)
+
+
+def test_heatmap_cfg_is_over_budget():
+    p = plan_file(cfg_path('awr1843.cfg'))
+    assert not p.ok
+    assert p.utilisation > 1.0
+    assert p.suggested_period_ms >= 1000.0 / p.max_safe_fps
+    assert p.max_safe_fps * p.bytes_per_frame <= p.capacity_bytes_per_s * LINK_HEADROOM + 1e-6
+    assert len(p.warnings) == 2
+    assert 'frameCfg period >=' in p.warnings[0]
+    assert 'heatmaps (TLV 4/5)' in p.warnings[1]
+
+
+def test_range_profile_cfg_fits_with_burst_warning():
+    p = plan_file(cfg_path('range_profile.cfg'))
+    assert p.ok and p.utilisation < LINK_HEADROOM
+    assert [t for t, _, _ in p.tlvs] == [1, 7, 2, 6]
+    assert len(p.warnings) == 1 and 'bursts' in p.warnings[0]
+    assert p.bytes_per_frame % PACKET_ALIGN == 0
+
+
+def test_tracking_cfg_uses_tracking_limits():
+    m = CfgModel.from_file(cfg_path('AOP_6m_default.cfg'))
+    assert m.tracking and (m.max_points, m.max_tracks) == (800, 30)
+    p = plan(m)
+    assert p.ok
+    assert [t for t, _, _ in p.tlvs] == [1020, 1010, 1011, 1012, 1021]
+    assert p.worst_bytes_per_frame > p.bytes_per_frame
+
+
+def test_buffer_holds_worst_case_frames():
+    for name in ('AOP_6m_default.cfg', 'awr1843.cfg', 'range_profile.cfg'):
+        p = plan_file(cfg_path(name))
+        assert p.buffer_bytes % BUFFER_ALIGN == 0
+        assert BUFFER_FRAMES * p.worst_bytes_per_frame <= p.buffer_bytes \
+            < BUFFER_FRAMES * p.worst_bytes_per_frame + BUFFER_ALIGN
+
+
+def test_more_points_or_lower_baud_cost_more():
+    m = CfgModel.from_file(cfg_path('range_profile.cfg'))
+    assert plan(m, points=300).bytes_per_frame > plan(m, points=50).bytes_per_frame
+    assert not plan(m, baud=115200).ok
+
+
+def test_defaults_without_gui_monitor():
+    m = CfgModel.from_text("% comment\nframeCfg 0 0 32 0 100 1 0\n")
+    p = plan(m, points=10)
+    assert [t for t, _, _ in p.tlvs] == [1, 7]      # demo default: points + side info
+    assert m.doppler_bins == 32
+
+
+def test_cli_exit_status(capsys):
+    assert main([cfg_path('range_profile.cfg')]) == 0
+    assert main([cfg_path('range_profile.cfg'), cfg_path('awr1843.cfg')]) == 1
+    assert 'OVER BUDGET' in capsys.readouterr().out
@@ -0,0 +1,126 @@
+import os
+import struct
+import sys
+
+import numpy as np
+
+# Run from radar_console_app (python -m pytest tests) or from anywhere else
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from parser.frame_parser import FrameParser, Q9_TO_DB
+from parser.heatmap_decoder import HeatmapDecoder
+
+MAGIC = b'\x02\x01\x04\x03\x06\x05\x08\x07'
+SDK3_VERSION = 0x03060000       # 40-byte header, TLV length = payload only
+LEGACY_VERSION = 0x01000005     # 36-byte header, TLV length includes the TLV header
+
+RANGE_BINS = 16
+DOPPLER_BINS = 8
+VIRT_ANT = 8
+
+
+def build_frame(tlvs, version=SDK3_VERSION, frame_id=7):
+    """Frame bytes in the mmw demo layout; tlvs is a list of (type, payload)."""
+    legacy = version <= 0x01000005
+    body = b''
+    for tlv_type, payload in tlvs:
+        length = len(payload) + (8 if legacy else 0)
+        body += struct.pack('<II', tlv_type, length) + payload
+    header_len = 36 if legacy else 40
+    total = header_len + len(body)
+    header = MAGIC + struct.pack('<IIIIIII', version, total, 0x1843, frame_id, 0, 3, len(tlvs))
+    if not legacy:
+        header += struct.pack('<I', 0)          # subframe number
+    return header + body
+
+
+def sample_tlvs():
+    points = np.array([[0.5, 1.0, 0.1, 0.25],
+                       [-1.0, 2.0, 0.0, 0.0],
+                       [2.0, 4.0, -0.2, -1.5]], dtype='<f4')
+    side = np.array([[120, 30], [45, 31], [210, 29]], dtype='<i2')
+    range_prof = (np.arange(RANGE_BINS) * 100).astype('<u2')
+    noise_prof = np.full(RANGE_BINS, 512, dtype='<u2')
+    iq = np.zeros((RANGE_BINS, VIRT_ANT, 2), dtype='<i2')
+    iq[:, :, 1] = 100                              # real only: peak at boresight
+    rd = np.arange(RANGE_BINS * DOPPLER_BINS, dtype='<u2').reshape(RANGE_BINS, DOPPLER_BINS)
+    tlvs = [(1, points.tobytes()), (7, side.tobytes()), (2, range_prof.tobytes()),
+            (3, noise_prof.tobytes()), (4, iq.tobytes()), (5, rd.tobytes())]
+    return tlvs, points, side, range_prof, noise_prof, rd
+
+
+def test_sdk3_frame_decodes_every_tlv():
+    tlvs, points, side, range_prof, noise_prof, rd = sample_tlvs()
+    frames = FrameParser().parse(build_frame(tlvs))
+    assert len(frames) == 1
+    f = frames[0]
+
+    assert f['frame_id'] == 7
+    assert f['num_points'] == 3
+    np.testing.assert_array_equal(f['xyzv'], points)
+    assert [p['v'] for p in f['points']] == [0.25, 0.0, -1.5]
+
+    np.testing.assert_allclose(f['snr_db'], side[:, 0] * 0.1, rtol=1e-6)
+
+    assert len(f['range_profile_db']) == RANGE_BINS
+    np.testing.assert_allclose(f['range_profile_db'], range_prof * Q9_TO_DB, rtol=1e-6)
+    assert len(f['noise_profile_db']) == RANGE_BINS
+    np.testing.assert_allclose(f['noise_profile_db'], noise_prof * Q9_TO_DB, rtol=1e-6)
+
+    # TLV 4/5 are skipped without a HeatmapDecoder
+    assert f['range_azimuth'] is None and f['range_doppler'] is None
+
+
+def test_sdk3_frames_back_to_back_stay_in_sync():
+    tlvs = sample_tlvs()[0]
+    stream = build_frame(tlvs, frame_id=1) + build_frame(tlvs, frame_id=2)
+    frames = FrameParser().parse(stream)
+    assert [f['frame_id'] for f in frames] == [1, 2]
+    assert all(len(f['noise_profile_db']) == RANGE_BINS for f in frames)
+
+
+def test_sdk3_tlvs_after_skipped_heatmaps_line_up():
+    tlvs = sample_tlvs()[0]
+    f = FrameParser().parse(build_frame([tlvs[4], tlvs[5], tlvs[0], tlvs[2]]))[0]
+    assert f['num_points'] == 3
+    assert len(f['range_profile_db']) == RANGE_BINS
+
+
+def test_legacy_frame_length_includes_tlv_header():
+    tlvs, points, _, range_prof, _, _ = sample_tlvs()
+    f = FrameParser().parse(build_frame([tlvs[0], tlvs[2]], version=LEGACY_VERSION))[0]
+    np.testing.assert_array_equal(f['xyzv'], points)
+    assert len(f['range_profile_db']) == RANGE_BINS
+    assert f['range_azimuth'] is None and f['snr_db'] is None
+
+
+def make_heatmap_parser():
+    return FrameParser(heatmaps=HeatmapDecoder(RANGE_BINS, DOPPLER_BINS, VIRT_ANT))
+
+
+def test_sdk3_heatmaps_decode():
+    tlvs, _, _, _, noise_prof, rd = sample_tlvs()
+    parser = make_heatmap_parser()
+    f = parser.parse(build_frame(tlvs))[0]
+
+    ra = f['range_azimuth']
+    assert ra is not None and ra.shape == (RANGE_BINS, 64)
+    # constant phase across antennas -> peak in the middle (0 deg) after fftshift
+    assert np.all(np.argmax(ra, axis=1) == 32)
+    np.testing.assert_allclose(ra[:, 32], 20 * np.log10(100 * VIRT_ANT), rtol=1e-5)
+
+    rdm = f['range_doppler']
+    assert rdm is not None and rdm.shape == (RANGE_BINS, DOPPLER_BINS)
+    np.testing.assert_array_equal(rdm, np.fft.fftshift(rd, axes=1))
+
+    np.testing.assert_allclose(f['noise_profile_db'], noise_prof * Q9_TO_DB, rtol=1e-6)
+    assert parser.heatmaps.mismatches == 0
+
+
+def test_heatmap_size_mismatch_is_counted_not_decoded():
+    tlvs = sample_tlvs()[0]
+    parser = FrameParser(heatmaps=HeatmapDecoder(RANGE_BINS * 2, DOPPLER_BINS, VIRT_ANT))
+    f = parser.parse(build_frame(tlvs))[0]
+    assert f['range_azimuth'] is None and f['range_doppler'] is None
+    assert parser.heatmaps.mismatches == 2
+    assert f['num_points'] == 3
@@ -0,0 +1,106 @@
+import os
+import sys
+
+import numpy as np
+
+# Run from radar_console_app (python -m pytest tests) or from anywhere else
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tracking.host_tracker import HostTracker, grid_dbscan, CONFIRM_HITS
+
+FRAME_DT = 0.05
+
+
+def blob(center, n=12, spread=0.1, seed=0):
+    rng = np.random.default_rng(seed)
+    return np.asarray(center, dtype=np.float64) + rng.uniform(-spread, spread, (n, 3))
+
+
+def brute_dbscan(xyz, eps, min_points):
+    """Reference: core flags and core-point components from the full distance matrix."""
+    d2 = ((xyz[:, None, :] - xyz[None, :, :]) ** 2).sum(axis=2)
+    near = d2 <= eps * eps
+    core = near.sum(axis=1) >= min_points
+    comp = np.full(len(xyz), -1)
+    for i in np.flatnonzero(core):
+        if comp[i] >= 0:
+            continue
+        stack, comp[i] = [i], i
+        while stack:
+            j = stack.pop()
+            for k in np.flatnonzero(near[j] & core):
+                if comp[k] < 0:
+                    comp[k] = i
+                    stack.append(k)
+    return core, comp, near
+
+
+def test_grid_dbscan_separates_blobs_and_noise():
+    xyz = np.vstack([blob((0, 2, 1)), blob((3, 4, 1), seed=1), [[-3.0, 8.0, 0.0]]])
+    labels = grid_dbscan(xyz, eps=0.5, min_points=4)
+    assert len(set(labels[:12])) == 1 and len(set(labels[12:24])) == 1
+    assert labels[0] != labels[12] and labels[0] >= 0 and labels[12] >= 0
+    assert labels[-1] == -1
+
+
+def test_grid_dbscan_matches_brute_force():
+    rng = np.random.default_rng(42)
+    xyz = rng.uniform(-3, 3, (300, 3))
+    eps, min_points = 0.6, 4
+    labels = grid_dbscan(xyz, eps, min_points)
+    core, comp, near = brute_dbscan(xyz, eps, min_points)
+
+    # same core partition, up to relabelling
+    ci = np.flatnonzero(core)
+    pairs = {(int(a), int(b)) for a, b in zip(comp[ci], labels[ci])}
+    assert len(pairs) == len(set(comp[ci])) == len(set(labels[ci]))
+    # border points sit in a neighbouring core point's cluster; the rest is noise
+    for i in np.flatnonzero(~core):
+        nbr = np.flatnonzero(near[i] & core)
+        if len(nbr):
+            assert labels[i] in set(labels[nbr])
+        else:
+            assert labels[i] == -1
+
+
+def test_grid_dbscan_empty():
+    assert len(grid_dbscan(np.zeros((0, 3)))) == 0
+
+
+def test_tracker_confirms_and_keeps_id_while_walking():
+    tracker = HostTracker()
+    out = []
+    for k in range(10):
+        out = tracker.update(blob((0.1 * k, 3.0, 1.0), seed=k), k * FRAME_DT)
+        if k < CONFIRM_HITS - 1:
+            assert out == []
+    assert len(out) == 1
+    assert out[0]['id'] == 1
+    assert abs(out[0]['x'] - 0.9) < 0.2 and abs(out[0]['y'] - 3.0) < 0.2
+    assert out[0]['vx'] > 0.5          # ~2 m/s walking in +x
+
+
+def test_tracker_two_people_get_distinct_ids():
+    tracker = HostTracker()
+    for k in range(CONFIRM_HITS):
+        out = tracker.update(np.vstack([blob((-1.5, 3, 1), seed=k), blob((1.5, 3, 1), seed=k + 50)]),
+                             k * FRAME_DT)
+    assert sorted(t['id'] for t in out) == [1, 2]
+
+
+def test_tracker_coasts_then_drops_lost_track():
+    tracker = HostTracker(max_misses=3)
+    t = 0.0
+    for k in range(CONFIRM_HITS):
+        tracker.update(blob((0, 3, 1), seed=k), t); t += FRAME_DT
+    empty = np.zeros((0, 4))
+    for _ in range(3):
+        assert len(tracker.update(empty, t)) == 1; t += FRAME_DT
+    assert tracker.update(empty, t) == []
+
+
+def test_tentative_track_dropped_on_first_miss():
+    tracker = HostTracker()
+    tracker.update(blob((0, 3, 1)), 0.0)
+    tracker.update(np.zeros((0, 4)), FRAME_DT)
+    assert len(tracker.ids) == 0
@@ -0,0 +1,90 @@
+import os
+import sys
+
+import numpy as np
+
+# Run from radar_console_app (python -m pytest tests) or from anywhere else
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from processing.point_filter import PointFilter, STAGES
+
+
+def xyzv(*rows):
+    return np.array(rows, dtype=np.float32).reshape(-1, 4)
+
+
+def test_range_gate_and_non_finite():
+    f = PointFilter(background=False)
+    keep = f.apply(xyzv([0, 0.1, 0, 1], [0, 3, 0, 1], [0, 12, 0, 1], [np.nan, 2, 0, 1]))
+    assert keep.tolist() == [False, True, False, False]
+    assert f.dropped['range'] == 3
+
+
+def test_roi_velocity_and_snr_stages():
+    f = PointFilter(roi=(-1, 1, 0, 5, -1, 2), min_speed=0.1, max_speed=5.0,
+                    min_snr_db=10.0, background=False)
+    pts = xyzv([0, 2, 0, 1.0],      # kept
+               [3, 2, 0, 1.0],      # outside roi
+               [0, 2, 0, 0.0],      # too slow
+               [0, 2, 0, 9.0],      # too fast
+               [0, 2, 0, -1.0])     # low SNR
+    keep = f.apply(pts, np.array([20, 20, 20, 20, 5], dtype=np.float32))
+    assert keep.tolist() == [True, False, False, False, False]
+    assert f.dropped == {'range': 0, 'roi': 1, 'velocity': 2, 'snr': 1, 'static': 0}
+    # without side info (or with a length mismatch) the SNR gate is skipped
+    assert f.apply(pts[[0, 4]]).tolist() == [True, True]
+    assert f.apply(pts[[0, 4]], np.array([5.0])).tolist() == [True, True]
+
+
+def test_point_counted_against_first_rejecting_stage():
+    f = PointFilter(roi=(-1, 1, 0, 5, -1, 2), min_speed=0.5, background=False)
+    f.apply(xyzv([3, 2, 0, 0.0]))                  # outside roi and too slow
+    assert f.dropped['roi'] == 1 and f.dropped['velocity'] == 0
+
+
+def test_static_reflector_becomes_background_and_is_released():
+    f = PointFilter()
+    wall, person = [2.0, 4.0, 1.0, 0.0], [0.0, 2.0, 1.0, 0.8]
+    kept = [f.apply(xyzv(wall, person)).tolist() for _ in range(12)]
+    assert kept[0] == [True, True]
+    assert kept[-1] == [False, True]               # wall suppressed, mover kept
+    first = next(i for i, k in enumerate(kept) if not k[0])
+    assert 3 <= first <= 10
+    # the wall goes away: a few frames later a static point there is kept again
+    for _ in range(30):
+        f.apply(xyzv(person))
+    assert f.apply(xyzv(wall)).tolist() == [True]
+
+
+def test_moving_points_never_build_background():
+    f = PointFilter()
+    for _ in range(30):
+        keep = f.apply(xyzv([1.0, 3.0, 1.0, 0.5]))
+    assert keep.tolist() == [True]
+    assert f.dropped['static'] == 0
+
+
+def test_filter_frame_keeps_fields_in_step():
+    f = PointFilter(min_speed=0.1, background=False)
+    frame = {'xyzv': xyzv([0, 2, 0, 1], [0, 2, 0, 0], [0, 3, 0, -1]),
+             'points': [{'v': 1}, {'v': 0}, {'v': -1}],
+             'snr_db': np.array([10, 11, 12], dtype=np.float32),
+             'num_points': 3}
+    f.filter_frame(frame)
+    assert frame['num_points'] == 2
+    assert [p['v'] for p in frame['points']] == [1, -1]
+    assert frame['snr_db'].tolist() == [10, 12]
+    np.testing.assert_array_equal(frame['xyzv'][:, 3], [1, -1])
+
+
+def test_counters_stats_and_reset():
+    f = PointFilter(background=False)
+    f.apply(xyzv([0, 2, 0, 1], [0, 20, 0, 1]))
+    f.apply(xyzv())
+    s = f.stats()
+    assert (s['frames'], s['points_in'], s['points_out']) == (2, 2, 1)
+    assert f.kept_ratio == 0.5
+    assert 'range' in f.report() and 'roi' not in f.report()
+    f.reset()
+    assert f.stats() == {'frames': 0, 'points_in': 0, 'points_out': 0,
+                         'dropped': dict.fromkeys(STAGES, 0)}
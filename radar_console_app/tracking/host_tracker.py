@@ -0,0 +1,246 @@
+import numpy as np
+
+try:
+    from scipy.optimize import linear_sum_assignment
+except ImportError:  # scipy is optional; greedy association is used without it
+    linear_sum_assignment = None
+
+# Clustering
+CLUSTER_EPS = 0.5          # metres, DBSCAN neighbourhood radius
+CLUSTER_MIN_POINTS = 4     # core point threshold (including the point itself)
+CLUSTER_Z_SCALE = 0.5      # shrink z so people (tall, narrow) form one cluster
+
+# Tracking
+GATE_DISTANCE = 1.0        # metres, max centroid-to-prediction distance
+PROCESS_NOISE = 2.0        # acceleration noise (m/s^2)
+MEASUREMENT_NOISE = 0.15   # metres
+CONFIRM_HITS = 3           # hits before a track is reported
+MAX_MISSES = 10            # frames a track may coast without a detection
+
+_NEIGHBOUR_OFFSETS = np.array(
+    [(dx, dy, dz) for dx in (-1, 0, 1) for dy in (-1, 0, 1) for dz in (-1, 0, 1)],
+    dtype=np.int64)
+
+
+def grid_dbscan(xyz, eps=CLUSTER_EPS, min_points=CLUSTER_MIN_POINTS):
+    """
+    DBSCAN accelerated with a uniform grid of cell size eps.
+
+    Points are sorted by cell key once; neighbour candidates for every point
+    come from the 27 surrounding cells via np.searchsorted, so the cost is
+    O(N log N + N * k) instead of the O(N^2) distance matrix.
+
+    Args:
+        xyz (np.ndarray): N x 3 float array.
+
+    Returns:
+        np.ndarray: int labels per point, -1 for noise.
+    """
+    n = len(xyz)
+    labels = np.full(n, -1, dtype=np.int64)
+    if n == 0:
+        return labels
+
+    cells = np.floor(xyz / eps).astype(np.int64)
+    cells -= cells.min(axis=0)
+    dims = cells.max(axis=0) + 3  # +1 extent, +2 padding for neighbour offsets
+    cells += 1
+    keys = (cells[:, 0] * dims[1] + cells[:, 1]) * dims[2] + cells[:, 2]
+    order = np.argsort(keys, kind='stable')
+    sorted_keys = keys[order]
+
+    # Neighbour pairs (i, j) for every point and every one of the 27 cells
+    offs = (_NEIGHBOUR_OFFSETS[:, 0] * dims[1] + _NEIGHBOUR_OFFSETS[:, 1]) * dims[2] \
+        + _NEIGHBOUR_OFFSETS[:, 2]
+    probe = keys[:, None] + offs[None, :]
+    lo = np.searchsorted(sorted_keys, probe, side='left').ravel()
+    hi = np.searchsorted(sorted_keys, probe, side='right').ravel()
+    counts = hi - lo
+    total = int(counts.sum())
+    src = np.repeat(np.repeat(np.arange(n), len(offs)), counts)
+    # positions lo..hi-1 for each (point, offset) run, built without a Python loop
+    run_start = np.repeat(lo - np.concatenate(([0], np.cumsum(counts)[:-1])), counts)
+    dst = order[np.arange(total) + run_start]
+
+    d = xyz[src] - xyz[dst]
+    close = np.einsum('ij,ij->i', d, d) <= eps * eps
+    src, dst = src[close], dst[close]
+
+    core = np.bincount(src, minlength=n) >= min_points
+    # Connected components over core-core edges: vectorised min-label
+    # propagation with pointer jumping (converges in O(log diameter) passes)
+    cc = core[src] & core[dst]
+    a, b = src[cc], dst[cc]
+    roots = np.arange(n)
+    while True:
+        prev = roots
+        roots = roots.copy()
+        np.minimum.at(roots, a, roots[b])
+        roots = roots[roots]
+        if np.array_equal(roots, prev):
+            break
+
+    core_idx = np.flatnonzero(core)
+    if len(core_idx) == 0:
+        return labels
+    _, comp = np.unique(roots[core_idx], return_inverse=True)
+    labels[core_idx] = comp
+    # Border points join the cluster of any core neighbour
+    border = ~core[src] & core[dst]
+    labels[src[border]] = labels[dst[border]]
+    return labels
+
+
+class HostTracker:
+    """
+    Host-side people tracker for point-cloud-only (out-of-box demo) firmware.
+
+    Pipeline per frame: grid DBSCAN -> cluster centroids -> constant-velocity
+    Kalman predict for all tracks at once -> gated association (Hungarian when
+    scipy is installed, greedy otherwise) -> batched Kalman update.
+
+    Output matches the IMS RadarFrame.targets shape:
+    a list of dicts with 'id', 'x', 'y', 'z' (plus 'vx', 'vy', 'vz').
+    """
+
+    def __init__(self, eps=CLUSTER_EPS, min_points=CLUSTER_MIN_POINTS,
+                 gate=GATE_DISTANCE, max_misses=MAX_MISSES, confirm_hits=CONFIRM_HITS):
+        self.eps = eps
+        self.min_points = min_points
+        self.gate = gate
+        self.max_misses = max_misses
+        self.confirm_hits = confirm_hits
+
+        # Track state, one row per track: x y z vx vy vz
+        self.x = np.zeros((0, 6))
+        self.P = np.zeros((0, 6, 6))
+        self.ids = np.zeros(0, dtype=np.int64)
+        self.hits = np.zeros(0, dtype=np.int64)
+        self.misses = np.zeros(0, dtype=np.int64)
+        self._next_id = 1
+        self._last_t = None
+
+        self._H = np.hstack([np.eye(3), np.zeros((3, 3))])
+        self._R = np.eye(3) * MEASUREMENT_NOISE ** 2
+
+    def reset(self):
+        self.__init__(self.eps, self.min_points, self.gate, self.max_misses, self.confirm_hits)
+
+    def cluster(self, xyz):
+        """Returns (centroids K x 3, labels N)."""
+        scaled = xyz.astype(np.float64, copy=True)
+        scaled[:, 2] *= CLUSTER_Z_SCALE
+        labels = grid_dbscan(scaled, self.eps, self.min_points)
+        k = labels.max() + 1 if len(labels) else 0
+        if k <= 0:
+            return np.zeros((0, 3)), labels
+        valid = labels >= 0
+        counts = np.bincount(labels[valid], minlength=k)
+        cent = np.stack([np.bincount(labels[valid], weights=xyz[valid, c], minlength=k)
+                         for c in range(3)], axis=1) / counts[:, None]
+        return cent, labels
+
+    def _predict(self, dt):
+        F = np.eye(6)
+        F[0, 3] = F[1, 4] = F[2, 5] = dt
+        q = PROCESS_NOISE ** 2
+        dt2, dt3, dt4 = dt * dt, dt ** 3 / 2, dt ** 4 / 4
+        Q = np.zeros((6, 6))
+        for i in range(3):
+            Q[i, i], Q[i, i + 3], Q[i + 3, i], Q[i + 3, i + 3] = dt4, dt3, dt3, dt2
+        Q *= q
+        self.x = self.x @ F.T
+        self.P = F @ self.P @ F.T + Q
+
+    def _associate(self, cost):
+        """Returns matched (track_idx, det_idx) arrays within the gate."""
+        if cost.size == 0:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+        if linear_sum_assignment is not None:
+            big = cost.copy()
+            big[big > self.gate] = 1e6
+            r, c = linear_sum_assignment(big)
+        else:
+            # Greedy: repeatedly take the globally closest remaining pair
+            flat = np.argsort(cost, axis=None)
+            r_all, c_all = np.unravel_index(flat, cost.shape)
+            used_r = np.zeros(cost.shape[0], dtype=bool)
+            used_c = np.zeros(cost.shape[1], dtype=bool)
+            r, c = [], []
+            for i, j in zip(r_all.tolist(), c_all.tolist()):
+                if cost[i, j] > self.gate:
+                    break
+                if used_r[i] or used_c[j]:
+                    continue
+                used_r[i] = used_c[j] = True
+                r.append(i); c.append(j)
+            r, c = np.array(r, dtype=np.int64), np.array(c, dtype=np.int64)
+        keep = cost[r, c] <= self.gate
+        return r[keep], c[keep]
+
+    def update(self, points, t):
+        """
+        Feed one frame.
+
+        Args:
+            points (np.ndarray): N x >=3 array (x, y, z, ...).
+            t (float): frame timestamp in seconds.
+
+        Returns:
+            list: confirmed tracks as dicts (RadarFrame.targets shape).
+        """
+        pts = np.asarray(points, dtype=np.float64)
+        xyz = pts[:, :3] if pts.ndim == 2 and len(pts) else np.zeros((0, 3))
+        dt = 0.05 if self._last_t is None else max(t - self._last_t, 1e-3)
+        self._last_t = t
+
+        dets, _ = self.cluster(xyz)
+        if len(self.x):
+            self._predict(dt)
+
+        H, R = self._H, self._R
+        # Distance from every prediction to every detection (T x D)
+        cost = np.linalg.norm(self.x[:, None, :3] - dets[None, :, :], axis=2) \
+            if len(self.x) and len(dets) else np.zeros((len(self.x), len(dets)))
+        ti, di = self._associate(cost)
+
+        if len(ti):
+            # Batched Kalman update for all matched tracks
+            P = self.P[ti]
+            S = H @ P @ H.T + R
+            K = P @ H.T @ np.linalg.inv(S)
+            innov = dets[di] - self.x[ti, :3]
+            self.x[ti] += np.einsum('tij,tj->ti', K, innov)
+            self.P[ti] = (np.eye(6) - K @ H) @ P
+            self.hits[ti] += 1
+            self.misses[ti] = 0
+
+        unmatched = np.ones(len(self.x), dtype=bool)
+        unmatched[ti] = False
+        self.misses[unmatched] += 1
+        alive = self.misses <= self.max_misses
+        # Tentative tracks that miss before confirmation are dropped at once
+        alive &= (self.hits >= self.confirm_hits) | (self.misses == 0)
+        self.x, self.P = self.x[alive], self.P[alive]
+        self.ids, self.hits, self.misses = self.ids[alive], self.hits[alive], self.misses[alive]
+
+        new = np.ones(len(dets), dtype=bool)
+        new[di] = False
+        n_new = int(new.sum())
+        if n_new:
+            x0 = np.zeros((n_new, 6))
+            x0[:, :3] = dets[new]
+            P0 = np.tile(np.diag([0.25, 0.25, 0.25, 1.0, 1.0, 1.0]), (n_new, 1, 1))
+            self.x = np.vstack([self.x, x0])
+            self.P = np.concatenate([self.P, P0])
+            self.ids = np.concatenate([self.ids, np.arange(self._next_id, self._next_id + n_new)])
+            self.hits = np.concatenate([self.hits, np.ones(n_new, dtype=np.int64)])
+            self.misses = np.concatenate([self.misses, np.zeros(n_new, dtype=np.int64)])
+            self._next_id += n_new
+
+        out = []
+        for i in np.flatnonzero(self.hits >= self.confirm_hits):
+            x = self.x[i]
+            out.append({'id': int(self.ids[i]), 'x': float(x[0]), 'y': float(x[1]), 'z': float(x[2]),
+                        'vx': float(x[3]), 'vy': float(x[4]), 'vz': float(x[5])})
+        return out
@@ -4,6 +4,17 @@ import csv
 import struct
 import time
 import random
+
+# Modules shared with the other apps (radar_common/) live at the repository root
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# =============================================================================
+# STARTUP PROFILE (--startup-profile; installed before the heavy imports below)
+# =============================================================================
+from radar_common.startup_profile import StartupProfile, PROFILE_FLAG
+
+PROFILE = StartupProfile.from_argv(sys.argv)   # None unless --startup-profile
+
 import numpy as np
 from datetime import datetime
 
@@ -14,7 +25,10 @@ from PySide6.QtCore import Qt, QTimer, QObject, QThread, Signal, Slot
 from PySide6.QtGui import QTextCursor
 
 import pyqtgraph as pg
-import pyqtgraph.opengl as gl
+
+from radar_common.point_history import PointHistory, TRAIL_FRAMES
+
+# pyqtgraph.opengl (and PyOpenGL) is imported by Plot3D, the first time 3D mode is selected
 
 # =============================================================================
 # LOGGER COMPONENT (from csv_logger.py)
@@ -324,8 +338,11 @@ class Plot2D(QWidget):
         self.scatter.clear()
 
 class Plot3D(QWidget):
-    def __init__(self):
+    def __init__(self, trail_frames=TRAIL_FRAMES):
         super().__init__()
+        import pyqtgraph.opengl as gl
+        self.trail = PointHistory(trail_frames, cols=3)
+        self._colors = np.ones((self.trail.frames * self.trail.max_points, 4), dtype=np.float32)
         self.layout = QVBoxLayout(self)
         self.view_widget = gl.GLViewWidget()
         self.layout.addWidget(self.view_widget)
@@ -338,21 +355,23 @@ class Plot3D(QWidget):
         self.view_widget.setCameraPosition(distance=15, elevation=30, azimuth=45)
 
     def update_plot(self, points):
-        if not points: return
-        pos = np.array([[p['x'], p['y'], p['z']] for p in points])
-        colors = np.array([[1, 1, 1, 0.8] for _ in points]) 
+        pos = np.array([[p['x'], p['y'], p['z']] for p in points], dtype=np.float32).reshape(-1, 3)
+        self.trail.push(pos)
+        pos, age_alpha = self.trail.merged()
+        colors = self._colors[:len(pos)]
+        np.multiply(age_alpha, 0.8, out=colors[:, 3])
         self.scatter.setData(pos=pos, color=colors)
 
     def clear(self):
+        self.trail.clear()
         self.scatter.setData(pos=np.empty((0, 3)))
 
 class PlotManager(QStackedWidget):
     def __init__(self):
         super().__init__()
         self.plot2d = Plot2D()
-        self.plot3d = Plot3D()
+        self.plot3d = None          # built on first switch to 3D (OpenGL init is slow)
         self.addWidget(self.plot2d)
-        self.addWidget(self.plot3d)
         self.current_mode = "2D"
 
     def set_mode(self, mode):
@@ -360,7 +379,10 @@ class PlotManager(QStackedWidget):
             self.setCurrentIndex(0)
             self.current_mode = "2D"
         elif mode == "3D":
-            self.setCurrentIndex(1)
+            if self.plot3d is None:
+                self.plot3d = Plot3D()
+                self.addWidget(self.plot3d)
+            self.setCurrentWidget(self.plot3d)
             self.current_mode = "3D"
 
     def update_data(self, points):
@@ -371,7 +393,8 @@ class PlotManager(QStackedWidget):
 
     def clear_plots(self):
         self.plot2d.clear()
-        self.plot3d.clear()
+        if self.plot3d is not None:
+            self.plot3d.clear()
 
 # =============================================================================
 # UI COMPONENTS (from control_panel.py, log_widget.py, status_bar.py)
@@ -561,11 +584,23 @@ class MainWindow(QMainWindow):
 # APPLICATION ENTRY POINT
 # =============================================================================
 def main():
-    app = QApplication(sys.argv)
+    if PROFILE: PROFILE.mark("module imports")
+    app = QApplication([a for a in sys.argv if a != PROFILE_FLAG])
     app.setStyle("Fusion")
     controller = RadarController()
     window = MainWindow(controller)
+    if PROFILE: PROFILE.mark("main window built")
     window.show()
+    if PROFILE:
+        app.processEvents()
+        PROFILE.mark("first paint")
+        window.plot_manager.set_mode("3D")      # measure the deferred OpenGL view too
+        app.processEvents()
+        PROFILE.mark("3D view ready")
+        PROFILE.uninstall()
+        print(PROFILE.report())
+        window.close()
+        sys.exit(0)
     sys.exit(app.exec())
 
 if __name__ == "__main__":